@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch edit-distance scoring against difflib and the delete index.
+
+Run with: python -m benchmarks.bench_batch_scorer
+"""
+
+import random
+import time
+from difflib import get_close_matches
+from typing import Callable, List
+
+from benchmarks.bench_typo_index import build_lexicon, make_typo
+from src.infrastructure.text.BatchEditDistanceScorer import (
+    NUMPY_AVAILABLE,
+    BatchEditDistanceScorer,
+)
+from src.infrastructure.text.SymSpellIndex import SymSpellIndex
+
+
+def time_lookups(lookup: Callable[[str], object], queries: List[str]) -> float:
+    """Return the mean lookup time in milliseconds."""
+    start = time.perf_counter()
+    for query in queries:
+        lookup(query)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def run_benchmark(lexicon_size: int = 20_000, queries: int = 200) -> None:
+    """Score typos with every backend and print the mean lookup time."""
+    print(f"📚 Building lexicon of {lexicon_size} words...")
+    lexicon = build_lexicon(lexicon_size)
+    rng = random.Random(7)
+    typos = [make_typo(rng.choice(lexicon), rng) for _ in range(queries)]
+
+    python_scorer = BatchEditDistanceScorer(use_numpy=False)
+    for word in lexicon:
+        python_scorer.add(word)
+    results = {
+        "difflib.get_close_matches": time_lookups(
+            lambda typo: get_close_matches(typo, lexicon, n=3, cutoff=0.6),
+            typos[:20],
+        ),
+        "batch scorer, pure Python": time_lookups(python_scorer.lookup, typos),
+    }
+
+    if NUMPY_AVAILABLE:
+        numpy_scorer = BatchEditDistanceScorer(use_numpy=True)
+        for word in lexicon:
+            numpy_scorer.add(word)
+        numpy_scorer.lookup(typos[0])  # encode the buckets outside the timing
+        results["batch scorer, NumPy"] = time_lookups(numpy_scorer.lookup, typos)
+    else:
+        print("⚠️  NumPy is not installed, skipping the vectorized scorer")
+
+    symspell = SymSpellIndex(lexicon)
+    results["SymSpellIndex"] = time_lookups(symspell.lookup, typos)
+
+    for name, mean_ms in results.items():
+        print(f"   {name:<28} {mean_ms:8.3f} ms per lookup")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark opening and querying a memory-mapped lexicon against a JSON dict.
+
+Run with: python -m benchmarks.bench_lexicon_load
+"""
+
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks.bench_typo_index import build_lexicon, make_typo
+from src.infrastructure.text.MappedLexicon import MappedLexicon
+
+
+def run_benchmark(lexicon_size: int = 300_000, queries: int = 10_000) -> None:
+    """Build both formats and time loading and lookups."""
+    print(f"📚 Building lexicon of {lexicon_size} words...")
+    words = build_lexicon(lexicon_size)
+    rng = random.Random(7)
+    entries = {word: "" for word in words}
+    for word in rng.sample(words, lexicon_size // 10):
+        entries.setdefault(make_typo(word, rng), word)
+
+    with tempfile.TemporaryDirectory() as directory:
+        lexicon_path = os.path.join(directory, "lexicon.lex")
+        json_path = os.path.join(directory, "lexicon.json")
+
+        start = time.perf_counter()
+        MappedLexicon.build(lexicon_path, entries.items())
+        print(f"🏗️  Lexicon built in {time.perf_counter() - start:.2f}s")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+
+        start = time.perf_counter()
+        with open(json_path, encoding="utf-8") as f:
+            loaded = json.load(f)
+        json_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        lexicon = MappedLexicon(lexicon_path)
+        mapped_ms = (time.perf_counter() - start) * 1000
+
+        print(f"📂 json.load: {json_ms:.1f} ms")
+        print(f"🗺️  MappedLexicon open: {mapped_ms:.3f} ms")
+
+        lookups = rng.sample(list(entries), queries)
+        timings = []
+        for word in lookups:
+            start = time.perf_counter()
+            lexicon.get(word)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+        print(f"🔎 lookup mean: {statistics.mean(timings):.1f} µs")
+
+        assert all(lexicon.get(word) == (loaded[word] or word) for word in lookups)
+        lexicon.close()
+
+
+if __name__ == "__main__":
+    run_benchmark()
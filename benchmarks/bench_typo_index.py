@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark typo suggestion lookups against a 100k-word Polish lexicon.
+
+Run with: python -m benchmarks.bench_typo_index
+"""
+
+import random
+import statistics
+import time
+from difflib import get_close_matches
+from typing import List
+
+from src.infrastructure.text.SymSpellIndex import SymSpellIndex
+
+SYLLABLES = (
+    "ba be bi bo bu ca ce ci co cu da de do du fa fe fi ga go ja je jo ka ke ki "
+    "ko ku la le li lo lu ma me mi mo mu na ne ni no nu pa pe pi po pu ra re ri "
+    "ro ru sa se si so su ta te to tu wa we wi wo za ze zi zo ło łą ść ęż ó cz "
+    "sz rz ch dz ży ni ką ką śl mą gę"
+).split()
+POLISH_LETTERS = "aąbcćdeęfghijklłmnńoóprsśtuwyzźż"
+
+
+def build_lexicon(size: int, seed: int = 42) -> List[str]:
+    """Generate a reproducible lexicon of Polish-looking words."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 5))))
+    return sorted(words)
+
+
+def make_typo(word: str, rng: random.Random) -> str:
+    """Apply a single random deletion, insertion or substitution."""
+    position = rng.randrange(len(word))
+    operation = rng.choice(("delete", "insert", "substitute"))
+    if operation == "delete":
+        return word[:position] + word[position + 1 :]
+    letter = rng.choice(POLISH_LETTERS)
+    if operation == "insert":
+        return word[:position] + letter + word[position:]
+    return word[:position] + letter + word[position + 1 :]
+
+
+def run_benchmark(
+    lexicon_size: int = 100_000, queries: int = 2_000, baseline_queries: int = 20
+) -> None:
+    """Build the index and time typo lookups."""
+    print(f"📚 Building lexicon of {lexicon_size} words...")
+    lexicon = build_lexicon(lexicon_size)
+
+    start = time.perf_counter()
+    index = SymSpellIndex(lexicon)
+    build_seconds = time.perf_counter() - start
+    print(f"🏗️  Index built in {build_seconds:.2f}s")
+
+    rng = random.Random(7)
+    typos = [make_typo(rng.choice(lexicon), rng) for _ in range(queries)]
+
+    timings = []
+    found = 0
+    for typo in typos:
+        start = time.perf_counter()
+        matches = index.lookup(typo)
+        timings.append((time.perf_counter() - start) * 1000)
+        found += bool(matches)
+
+    timings.sort()
+    print(f"🔎 {queries} lookups, {found} with suggestions")
+    print(f"   mean: {statistics.mean(timings):.3f} ms")
+    print(f"   p50:  {timings[len(timings) // 2]:.3f} ms")
+    print(f"   p99:  {timings[int(len(timings) * 0.99)]:.3f} ms")
+
+    start = time.perf_counter()
+    for typo in typos[:baseline_queries]:
+        get_close_matches(typo, lexicon, n=3, cutoff=0.6)
+    baseline_ms = (time.perf_counter() - start) * 1000 / baseline_queries
+    print(f"🐢 difflib.get_close_matches baseline: {baseline_ms:.1f} ms per lookup")
+
+
+if __name__ == "__main__":
+    run_benchmark()
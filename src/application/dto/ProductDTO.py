@@ -11,6 +11,7 @@ class ProductDTO(BaseModel):
     name: str
     quantity: int
     purchased: Optional[bool] = Field(default=False)
+    version: Optional[int] = None
 
     @field_validator("quantity")
     def quantity_must_be_positive(cls, v):
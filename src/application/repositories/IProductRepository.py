@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, List, Optional
 from src.domain.Product_Entity import _Product
 
 
@@ -55,3 +56,36 @@ class IProductRepository(ABC):
         :return: The updated product.
         """
         pass
+
+    @abstractmethod
+    def adjust_quantity(self, product_id: str, delta: int) -> _Product:
+        """
+        Atomically change a product's quantity by the given amount.
+
+        :param product_id: The ID of the product to change.
+        :param delta: Amount added to the quantity (negative to decrease).
+        :return: The updated product.
+        """
+        pass
+
+    @abstractmethod
+    def set_purchased(self, product_id: str, purchased: bool) -> _Product:
+        """
+        Atomically set a product's purchase status.
+
+        :param product_id: The ID of the product to change.
+        :param purchased: The new purchase status.
+        :return: The updated product.
+        """
+        pass
+
+    def transaction(self) -> ContextManager[Any]:
+        """
+        Group several repository operations into one atomic, batched unit.
+
+        Repositories backed by transactional storage override this; the
+        default runs each operation on its own.
+
+        :return: Context manager that commits on success and rolls back on error.
+        """
+        return nullcontext()
@@ -0,0 +1,45 @@
+from src.application.repositories.IProductRepository import IProductRepository
+from typing import Any, ContextManager, Optional
+
+
+class UnitOfWork:
+    """
+    Groups several use-case calls into a single repository transaction.
+
+    Operations executed inside ``with UnitOfWork(repository):`` are committed
+    together when the block completes and rolled back if it raises.
+    """
+
+    def __init__(self, productRepository: IProductRepository):
+        """
+        Initialize the unit of work for a product repository.
+
+        :param productRepository: An instance of IProductRepository.
+        """
+        self.__productRepository = productRepository
+        self.__transaction: Optional[ContextManager[Any]] = None
+
+    def __enter__(self) -> "UnitOfWork":
+        """
+        Begin the repository transaction.
+
+        :return: The active unit of work.
+        :raises RuntimeError: If the unit of work is already active.
+        """
+        if self.__transaction is not None:
+            raise RuntimeError("Unit of work is already active.")
+        transaction = self.__productRepository.transaction()
+        transaction.__enter__()
+        self.__transaction = transaction
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        """
+        Commit the transaction, or roll it back if the block raised.
+
+        :return: Whatever the repository transaction returns.
+        """
+        transaction, self.__transaction = self.__transaction, None
+        if transaction is None:
+            return None
+        return transaction.__exit__(exc_type, exc_value, traceback)
@@ -0,0 +1,32 @@
+from src.application.repositories.IProductRepository import IProductRepository
+from src.domain.Product_Entity import _Product
+
+
+class AdjustProductQuantity:
+    """
+    Use case for increasing or decreasing a product's quantity.
+    """
+
+    def __init__(self, productRepository: IProductRepository):
+        """
+        Initialize the AdjustProductQuantity use case with a product repository.
+
+        :param productRepository: An instance of IProductRepository.
+        """
+        self.__productRepository = productRepository
+
+    def execute(self, product_id: str, delta: int) -> _Product:
+        """
+        Execute the use case to change a product's quantity by a given amount.
+
+        The change is applied by the repository as a single atomic operation,
+        without reading the product first.
+
+        :param product_id: The ID of the product to change.
+        :param delta: Amount added to the quantity (negative to decrease).
+        :return: The updated product.
+        :raises ValueError: If the change is not a non-zero integer, the product does not exist or the quantity would not stay positive.
+        """
+        if isinstance(delta, bool) or not isinstance(delta, int) or delta == 0:
+            raise ValueError("Quantity change must be a non-zero integer.")
+        return self.__productRepository.adjust_quantity(product_id, delta)
@@ -0,0 +1,30 @@
+from src.application.repositories.IProductRepository import IProductRepository
+from src.domain.Product_Entity import _Product
+
+
+class SetProductPurchased:
+    """
+    Use case for marking a product as purchased or not purchased.
+    """
+
+    def __init__(self, productRepository: IProductRepository):
+        """
+        Initialize the SetProductPurchased use case with a product repository.
+
+        :param productRepository: An instance of IProductRepository.
+        """
+        self.__productRepository = productRepository
+
+    def execute(self, product_id: str, purchased: bool) -> _Product:
+        """
+        Execute the use case to set a product's purchase status.
+
+        The change is applied by the repository as a single atomic operation,
+        without reading the product first.
+
+        :param product_id: The ID of the product to change.
+        :param purchased: The new purchase status.
+        :return: The updated product.
+        :raises ValueError: If no product with the given ID exists.
+        """
+        return self.__productRepository.set_purchased(product_id, bool(purchased))
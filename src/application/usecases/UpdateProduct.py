@@ -1,5 +1,6 @@
 from src.application.repositories.IProductRepository import IProductRepository
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 from src.application.dto.ProductDTO import ProductDTO
 
 
@@ -20,9 +21,13 @@ class UpdateProduct:
         """
         Execute the use case to update an existing product.
 
+        Fields are assigned on the stored product so that only actual changes are
+        tracked; when nothing changed, the repository is not called at all.
+
         :param product_dto: Data transfer object containing updated product details.
         :return: The updated product.
         :raises ValueError: If no product with the given ID exists or if validation fails.
+        :raises ProductConflictError: If the DTO's version is older than the stored one.
         """
         if product_dto.id is None:
             raise ValueError("Product ID is required for update operation.")
@@ -30,6 +35,11 @@ class UpdateProduct:
         existing_product = self.__productRepository.get_product_by_id(product_dto.id)
         if not existing_product:
             raise ValueError(f"Product with id {product_dto.id} does not exist.")
+        if (
+            product_dto.version is not None
+            and product_dto.version != existing_product.version
+        ):
+            raise ProductConflictError(product_dto.id)
 
         existing_product.name = product_dto.name
         existing_product.quantity = product_dto.quantity
@@ -41,4 +51,7 @@ class UpdateProduct:
         if not existing_product.name:
             raise ValueError("Product name cannot be empty.")
 
+        if not existing_product.is_dirty:
+            return existing_product
+
         return self.__productRepository.update_product(existing_product)
@@ -0,0 +1,19 @@
+from typing import Optional
+
+
+class ProductConflictError(ValueError):
+    """
+    Raised when a product was modified by someone else since it was read.
+    """
+
+    def __init__(self, product_id: Optional[str]):
+        """
+        Initialize the error for the given product.
+
+        :param product_id: The ID of the product whose update conflicted.
+        """
+        super().__init__(
+            f"Product with id {product_id} was modified by another user. "
+            "Reload it and try again."
+        )
+        self.product_id = product_id
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, FrozenSet, Optional, Set
 import uuid
 
+# Fields whose changes are tracked so repositories can persist only what changed
+TRACKED_FIELDS = ("name", "quantity", "purchased")
+
 
 @dataclass
 class _Product:
@@ -13,6 +16,10 @@ class _Product:
     quantity: int
     id: Optional[str] = field(default=None)
     purchased: bool = False
+    version: int = 1
+    _dirty_fields: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """
@@ -21,6 +28,8 @@ class _Product:
         - Generates a unique ID if not provided.
         - Validates that the name is not empty.
         - Validates that the quantity is a positive integer.
+        - Marks every tracked field as dirty, since a new product has not been
+          persisted yet. Repositories call ``mark_clean`` once it is stored.
 
         :raises ValueError: If the name is empty or the quantity is not a positive integer.
         """
@@ -30,3 +39,41 @@ class _Product:
             raise ValueError("Product name cannot be empty.")
         if not isinstance(self.quantity, int) or self.quantity <= 0:
             raise ValueError("Quantity must be a positive integer.")
+        self._dirty_fields.update(TRACKED_FIELDS)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Record tracked fields whose value actually changes.
+
+        :param name: Attribute name.
+        :param value: New attribute value.
+        """
+        if name in TRACKED_FIELDS:
+            dirty_fields = self.__dict__.get("_dirty_fields")
+            if dirty_fields is not None and self.__dict__.get(name) != value:
+                dirty_fields.add(name)
+        object.__setattr__(self, name, value)
+
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """
+        Fields changed since the product was last loaded or persisted.
+
+        :return: Names of the dirty fields.
+        """
+        return frozenset(self._dirty_fields)
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Check whether the product has unsaved changes.
+
+        :return: True if any tracked field changed.
+        """
+        return bool(self._dirty_fields)
+
+    def mark_clean(self) -> None:
+        """
+        Forget tracked changes after the product was loaded or persisted.
+        """
+        self._dirty_fields.clear()
@@ -1,7 +1,8 @@
 from src.application.repositories.IProductRepository import IProductRepository
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 from src.utils.errorHandlerDecorator import handle_exceptions
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class InMemoryProductRepository(IProductRepository):
@@ -11,9 +12,9 @@ class InMemoryProductRepository(IProductRepository):
 
     def __init__(self) -> None:
         """
-        Initialize the repository with an empty list of products.
+        Initialize the repository with an empty, insertion-ordered index of products.
         """
-        self.__products: List[_Product] = []
+        self.__products: Dict[Optional[str], _Product] = {}
 
     @handle_exceptions
     def add_product(self, product: _Product) -> _Product:
@@ -26,7 +27,8 @@ class InMemoryProductRepository(IProductRepository):
         """
         if self.get_product_by_id(product.id) is not None:
             raise ValueError(f"Product with id {product.id} already exists.")
-        self.__products.append(product)
+        self.__products[product.id] = product
+        product.mark_clean()
         return product
 
     @handle_exceptions
@@ -36,7 +38,7 @@ class InMemoryProductRepository(IProductRepository):
 
         :return: A list of all products.
         """
-        return self.__products
+        return list(self.__products.values())
 
     @handle_exceptions
     def remove_product(self, product_id: str) -> None:
@@ -49,9 +51,7 @@ class InMemoryProductRepository(IProductRepository):
         product = self.get_product_by_id(product_id)
         if product is None:
             raise ValueError(f"Product with id {product_id} does not exist.")
-        self.__products = [
-            product for product in self.__products if product.id != product_id
-        ]
+        del self.__products[product_id]
 
     @handle_exceptions
     def get_product_by_id(self, product_id: str) -> Optional[_Product]:
@@ -61,10 +61,7 @@ class InMemoryProductRepository(IProductRepository):
         :param product_id: The ID of the product to retrieve.
         :return: The retrieved product, or None if no product with the given ID exists.
         """
-        for product in self.__products:
-            if product.id == product_id:
-                return product
-        return None
+        return self.__products.get(product_id)
 
     @handle_exceptions
     def update_product(self, product: _Product) -> _Product:
@@ -74,9 +71,54 @@ class InMemoryProductRepository(IProductRepository):
         :param product: The product with updated details.
         :return: The updated product.
         :raises ValueError: If no product with the given ID exists.
+        :raises ProductConflictError: If the stored product has a newer version.
         """
-        for i, p in enumerate(self.__products):
-            if p.id == product.id:
-                self.__products[i] = product
-                return product
-        raise ValueError(f"Product with id {product.id} does not exist.")
+        stored = self.__products.get(product.id)
+        if stored is None:
+            raise ValueError(f"Product with id {product.id} does not exist.")
+        if product.is_dirty:
+            if stored.version != product.version:
+                raise ProductConflictError(product.id)
+            product.version = stored.version + 1
+            self.__products[product.id] = product
+            product.mark_clean()
+        return product
+
+    @handle_exceptions
+    def adjust_quantity(self, product_id: str, delta: int) -> _Product:
+        """
+        Change a product's quantity in place by the given amount.
+
+        :param product_id: The ID of the product to change.
+        :param delta: Amount added to the quantity (negative to decrease).
+        :return: The updated product.
+        :raises ValueError: If the product does not exist or the quantity would drop to zero or below.
+        """
+        product = self.__products.get(product_id)
+        if product is None:
+            raise ValueError(f"Product with id {product_id} does not exist.")
+        if product.quantity + delta <= 0:
+            raise ValueError("Quantity must be positive")
+        product.quantity += delta
+        product.version += 1
+        product.mark_clean()
+        return product
+
+    @handle_exceptions
+    def set_purchased(self, product_id: str, purchased: bool) -> _Product:
+        """
+        Set a product's purchase status in place.
+
+        :param product_id: The ID of the product to change.
+        :param purchased: The new purchase status.
+        :return: The updated product.
+        :raises ValueError: If no product with the given ID exists.
+        """
+        product = self.__products.get(product_id)
+        if product is None:
+            raise ValueError(f"Product with id {product_id} does not exist.")
+        if product.purchased != purchased:
+            product.purchased = purchased
+            product.version += 1
+            product.mark_clean()
+        return product
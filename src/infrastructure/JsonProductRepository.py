@@ -1,7 +1,10 @@
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 from src.application.repositories.IProductRepository import IProductRepository
+from src.infrastructure.mappers.ProductMapper import ProductMapper
 from src.utils.errorHandlerDecorator import handle_exceptions
-from typing import Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 import json
 import os
 
@@ -18,6 +21,8 @@ class JsonProductRepository(IProductRepository):
         :param file_path: Path to the JSON file storing product data.
         """
         self.file_path = os.path.abspath(file_path)
+        self.__transaction_depth = 0
+        self.__has_unsaved_changes = False
         self.__ensure_file_exists()
         self.__load_products()
 
@@ -38,23 +43,66 @@ class JsonProductRepository(IProductRepository):
             with open(self.file_path, "r") as file:
                 products_data = json.load(file)
                 self.__products = []
+                self.__products_by_id: Dict[Optional[str], _Product] = {}
                 for data in products_data:
                     product = _Product(
                         id=data["id"],
                         name=data["name"],
                         quantity=data["quantity"],
                         purchased=data.get("purchased", False),
+                        version=data.get("version", 1),
                     )
+                    product.mark_clean()
                     self.__products.append(product)
+                    self.__products_by_id[product.id] = product
         except FileNotFoundError:
             self.__products = []
+            self.__products_by_id = {}
 
     def __save_products(self) -> None:
         """
         Save the current list of products to the JSON file.
+
+        Inside a transaction the write is deferred until it commits.
+        """
+        if self.__transaction_depth:
+            self.__has_unsaved_changes = True
+            return
+        self.__write_products()
+
+    def __write_products(self) -> None:
+        """
+        Write the current list of products to the JSON file.
         """
         with open(self.file_path, "w") as file:
-            json.dump([product.__dict__ for product in self.__products], file)
+            json.dump(
+                [ProductMapper.to_dict(product) for product in self.__products], file
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Batch the enclosed operations into a single save at commit.
+
+        On error, pending changes are discarded by reloading the file.
+        Nested transactions join the outermost one.
+
+        :yield: None
+        """
+        self.__transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            if self.__transaction_depth == 1:
+                self.__has_unsaved_changes = False
+                self.__load_products()
+            raise
+        else:
+            if self.__transaction_depth == 1 and self.__has_unsaved_changes:
+                self.__write_products()
+                self.__has_unsaved_changes = False
+        finally:
+            self.__transaction_depth -= 1
 
     @handle_exceptions
     def add_product(self, product: _Product) -> _Product:
@@ -68,7 +116,9 @@ class JsonProductRepository(IProductRepository):
         if self.get_product_by_id(product.id) is not None:
             raise ValueError(f"Product with id {product.id} already exists.")
         self.__products.append(product)
+        self.__products_by_id[product.id] = product
         self.__save_products()
+        product.mark_clean()
         return product
 
     @handle_exceptions
@@ -94,6 +144,7 @@ class JsonProductRepository(IProductRepository):
         self.__products = [
             product for product in self.__products if product.id != product_id
         ]
+        del self.__products_by_id[product_id]
         self.__save_products()
 
     @handle_exceptions
@@ -104,10 +155,7 @@ class JsonProductRepository(IProductRepository):
         :param product_id: The ID of the product to retrieve.
         :return: The retrieved product, or None if no product with the given ID exists.
         """
-        for product in self.__products:
-            if product.id == product_id:
-                return product
-        return None
+        return self.__products_by_id.get(product_id)
 
     @handle_exceptions
     def update_product(self, product: _Product) -> _Product:
@@ -117,16 +165,66 @@ class JsonProductRepository(IProductRepository):
         :param product: The product with updated details.
         :return: The updated product.
         :raises ValueError: If no product with the given ID exists.
+        :raises ProductConflictError: If the stored product has a newer version.
         """
         existing_product = self.get_product_by_id(product.id)
         if existing_product is None:
             raise ValueError(f"Product with id {product.id} does not exist.")
-        existing_product.name = product.name
-        existing_product.quantity = product.quantity
-        existing_product.purchased = product.purchased
-        self.__save_products()
+        if product is not existing_product:
+            if product.is_dirty and product.version != existing_product.version:
+                raise ProductConflictError(product.id)
+            # Only fields whose value differs end up dirty on the stored product
+            for field_name in product.dirty_fields:
+                setattr(existing_product, field_name, getattr(product, field_name))
+        if existing_product.is_dirty:
+            existing_product.version += 1
+            self.__save_products()
+            existing_product.mark_clean()
+        product.version = existing_product.version
+        product.mark_clean()
         return existing_product
 
+    @handle_exceptions
+    def adjust_quantity(self, product_id: str, delta: int) -> _Product:
+        """
+        Change a product's quantity in place by the given amount.
+
+        :param product_id: The ID of the product to change.
+        :param delta: Amount added to the quantity (negative to decrease).
+        :return: The updated product.
+        :raises ValueError: If the product does not exist or the quantity would drop to zero or below.
+        """
+        product = self.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError(f"Product with id {product_id} does not exist.")
+        if product.quantity + delta <= 0:
+            raise ValueError("Quantity must be positive")
+        product.quantity += delta
+        product.version += 1
+        self.__save_products()
+        product.mark_clean()
+        return product
+
+    @handle_exceptions
+    def set_purchased(self, product_id: str, purchased: bool) -> _Product:
+        """
+        Set a product's purchase status in place.
+
+        :param product_id: The ID of the product to change.
+        :param purchased: The new purchase status.
+        :return: The updated product.
+        :raises ValueError: If no product with the given ID exists.
+        """
+        product = self.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError(f"Product with id {product_id} does not exist.")
+        if product.purchased != purchased:
+            product.purchased = purchased
+            product.version += 1
+            self.__save_products()
+            product.mark_clean()
+        return product
+
     @handle_exceptions
     def get_products_by_status_generator(self, purchased: bool):
         """
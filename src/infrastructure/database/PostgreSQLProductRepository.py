@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Any, ContextManager, Dict, List, Optional
 from src.application.repositories.IProductRepository import IProductRepository
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 from src.infrastructure.services.DatabaseService import DatabaseService
 from src.infrastructure.mappers.ProductMapper import ProductMapper
 from src.utils.errorHandlerDecorator import handle_exceptions
@@ -12,14 +13,21 @@ class PostgreSQLProductRepository(IProductRepository):
     Uses Clean Architecture principles with proper layer separation.
     """
 
-    def __init__(self, database_service: Optional[DatabaseService] = None):
+    def __init__(
+        self,
+        database_service: Optional[DatabaseService] = None,
+        direct_hydration: bool = False,
+    ):
         """
         Initialize the PostgreSQL repository.
 
         :param database_service: Optional database service instance
+        :param direct_hydration: Build products straight from result tuples with
+            a psycopg row factory instead of mapping ``dict_row`` dictionaries
         """
         self._db_service = database_service or DatabaseService()
         self._mapper = ProductMapper()
+        self._direct_hydration = direct_hydration
         self._ensure_schema_initialized()
 
     def _ensure_schema_initialized(self) -> None:
@@ -29,6 +37,40 @@ class PostgreSQLProductRepository(IProductRepository):
         except Exception as e:
             raise RuntimeError(f"Failed to initialize database schema: {e}")
 
+    def _fetch_products(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[_Product]:
+        """
+        Run a product SELECT and hydrate the resulting rows.
+
+        :param query: SQL query selecting the product columns
+        :param params: Query parameters
+        :return: List of products
+        """
+        if self._direct_hydration:
+            return self._db_service.execute_query(
+                query, params, row_factory=self._mapper.product_row_factory
+            )
+        rows = self._db_service.execute_query(query, params)
+        return [self._mapper.from_db_row(row) for row in rows]
+
+    def _modify_products(
+        self, command: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[_Product]:
+        """
+        Run a product-modifying command with RETURNING and hydrate its rows.
+
+        :param command: SQL command returning the product columns
+        :param params: Command parameters
+        :return: List of modified products
+        """
+        if self._direct_hydration:
+            return self._db_service.execute_returning(
+                command, params, row_factory=self._mapper.product_row_factory
+            )
+        rows = self._db_service.execute_returning(command, params)
+        return [self._mapper.from_db_row(row) for row in rows]
+
     @handle_exceptions
     def add_product(self, product: _Product) -> _Product:
         """
@@ -52,8 +94,8 @@ class PostgreSQLProductRepository(IProductRepository):
         # Insert product
         product_data = self._mapper.to_db_row(product)
         insert_sql = """
-        INSERT INTO products (id, name, quantity, purchased)
-        VALUES (%(id)s, %(name)s, %(quantity)s, %(purchased)s)
+        INSERT INTO products (id, name, quantity, purchased, version)
+        VALUES (%(id)s, %(name)s, %(quantity)s, %(purchased)s, %(version)s)
         """
 
         affected_rows = self._db_service.execute_command(insert_sql, product_data)
@@ -62,6 +104,7 @@ class PostgreSQLProductRepository(IProductRepository):
                 f"Expected to insert 1 row, but {affected_rows} were affected"
             )
 
+        product.mark_clean()
         return product
 
     @handle_exceptions
@@ -72,13 +115,12 @@ class PostgreSQLProductRepository(IProductRepository):
         :return: A list of all products
         """
         select_sql = """
-        SELECT id, name, quantity, purchased, created_at, updated_at
+        SELECT id, name, quantity, purchased, version
         FROM products
         ORDER BY created_at DESC
         """
 
-        rows = self._db_service.execute_query(select_sql)
-        return [self._mapper.from_db_row(row) for row in rows]
+        return self._fetch_products(select_sql)
 
     @handle_exceptions
     def remove_product(self, product_id: str) -> None:
@@ -114,27 +156,36 @@ class PostgreSQLProductRepository(IProductRepository):
         :return: The retrieved product, or None if no product with the given ID exists
         """
         select_sql = """
-        SELECT id, name, quantity, purchased, created_at, updated_at
+        SELECT id, name, quantity, purchased, version
         FROM products
         WHERE id = %(product_id)s
         """
 
-        rows = self._db_service.execute_query(select_sql, {"product_id": product_id})
+        products = self._fetch_products(select_sql, {"product_id": product_id})
 
-        if not rows:
+        if not products:
             return None
 
-        return self._mapper.from_db_row(rows[0])
+        return products[0]
 
     @handle_exceptions
     def update_product(self, product: _Product) -> _Product:
         """
         Update an existing product in the PostgreSQL database.
 
+        Only the product's dirty columns are written; a product without
+        changes is returned without touching the database. The write is
+        guarded by the product's version, so a concurrent modification is
+        detected in the same round-trip instead of being overwritten.
+
         :param product: The product with updated details
         :return: The updated product
         :raises ValueError: If no product with the given ID exists
+        :raises ProductConflictError: If the stored version no longer matches
         """
+        if not product.is_dirty:
+            return product
+
         # Validate product for persistence
         validation_errors = self._mapper.validate_for_persistence(product)
         if validation_errors:
@@ -142,29 +193,104 @@ class PostgreSQLProductRepository(IProductRepository):
                 f"Product validation failed: {', '.join(validation_errors)}"
             )
 
-        # Check if product exists
-        if self.get_product_by_id(product.id) is None:
-            raise ValueError(f"Product with id {product.id} does not exist.")
-
-        # Update product
+        # Update only the changed columns
         product_data = self._mapper.to_db_row(product)
-        update_sql = """
+        columns = [
+            column
+            for column in self._mapper.PRODUCT_COLUMNS
+            if column in product.dirty_fields
+        ]
+        # Column names come from the mapper's fixed list, never from user input
+        assignments = "".join(f"{column} = %({column})s, " for column in columns)
+        update_sql = f"""
         UPDATE products
-        SET name = %(name)s,
-            quantity = %(quantity)s,
-            purchased = %(purchased)s,
+        SET {assignments}version = version + 1,
             updated_at = CURRENT_TIMESTAMP
-        WHERE id = %(id)s
+        WHERE id = %(id)s AND version = %(version)s
         """
+        update_params = {column: product_data[column] for column in columns}
+        update_params["id"] = product.id
+        update_params["version"] = product.version
 
-        affected_rows = self._db_service.execute_command(update_sql, product_data)
+        affected_rows = self._db_service.execute_command(update_sql, update_params)
         if affected_rows != 1:
-            raise RuntimeError(
-                f"Expected to update 1 row, but {affected_rows} were affected"
-            )
+            # Only the failure path pays for a lookup to report the right error
+            if self.get_product_by_id(product.id) is None:
+                raise ValueError(f"Product with id {product.id} does not exist.")
+            raise ProductConflictError(product.id)
+
+        product.version += 1
+        product.mark_clean()
+        return product
+
+    @handle_exceptions
+    def adjust_quantity(self, product_id: str, delta: int) -> _Product:
+        """
+        Atomically change a product's quantity on the server.
+
+        :param product_id: The ID of the product to change
+        :param delta: Amount added to the quantity (negative to decrease)
+        :return: The updated product
+        :raises ValueError: If the product does not exist or the quantity would drop to zero or below
+        """
+        update_sql = """
+        UPDATE products
+        SET quantity = quantity + %(delta)s,
+            version = version + 1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = %(product_id)s AND quantity + %(delta)s > 0
+        RETURNING id, name, quantity, purchased, version
+        """
+
+        products = self._modify_products(
+            update_sql, {"product_id": product_id, "delta": delta}
+        )
+        if products:
+            return products[0]
+
+        if self.get_product_by_id(product_id) is None:
+            raise ValueError(f"Product with id {product_id} does not exist.")
+        raise ValueError("Quantity must be positive")
+
+    @handle_exceptions
+    def set_purchased(self, product_id: str, purchased: bool) -> _Product:
+        """
+        Atomically set a product's purchase status on the server.
+
+        :param product_id: The ID of the product to change
+        :param purchased: The new purchase status
+        :return: The updated product
+        :raises ValueError: If no product with the given ID exists
+        """
+        update_sql = """
+        UPDATE products
+        SET purchased = %(purchased)s,
+            version = version + 1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = %(product_id)s AND purchased IS DISTINCT FROM %(purchased)s
+        RETURNING id, name, quantity, purchased, version
+        """
+
+        products = self._modify_products(
+            update_sql, {"product_id": product_id, "purchased": purchased}
+        )
+        if products:
+            return products[0]
 
+        # Nothing changed: either the status was already set or the row is gone
+        product = self.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError(f"Product with id {product_id} does not exist.")
         return product
 
+    def transaction(self) -> ContextManager[Any]:
+        """
+        Run the enclosed operations on one connection and one transaction.
+
+        :return: Context manager committing once when the block completes
+        """
+        return self._db_service.unit_of_work()
+
     def health_check(self) -> bool:
         """
         Check if the PostgreSQL database connection is healthy.
@@ -181,15 +307,13 @@ class PostgreSQLProductRepository(IProductRepository):
         :return: List of products matching the status
         """
         select_sql = """
-        SELECT id, name, quantity, purchased, created_at, updated_at
+        SELECT id, name, quantity, purchased, version
         FROM products
         WHERE purchased = %(purchased)s
         ORDER BY created_at DESC
         """
 
-        rows = self._db_service.execute_query(select_sql, {"purchased": purchased})
-
-        return [self._mapper.from_db_row(row) for row in rows]
+        return self._fetch_products(select_sql, {"purchased": purchased})
 
     def get_product_count(self) -> int:
         """
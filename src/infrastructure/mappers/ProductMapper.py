@@ -1,4 +1,4 @@
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Sequence
 from src.domain.Product_Entity import _Product
 
 
@@ -8,6 +8,9 @@ class ProductMapper:
     Handles conversion between domain objects and external data formats.
     """
 
+    # Columns required to hydrate a Product, in the order they are selected
+    PRODUCT_COLUMNS = ("id", "name", "quantity", "purchased", "version")
+
     @staticmethod
     def to_dict(product: _Product) -> Dict[str, Any]:
         """
@@ -21,6 +24,7 @@ class ProductMapper:
             "name": product.name,
             "quantity": product.quantity,
             "purchased": product.purchased,
+            "version": product.version,
         }
 
     @staticmethod
@@ -36,6 +40,7 @@ class ProductMapper:
             name=data["name"],
             quantity=data["quantity"],
             purchased=data.get("purchased", False),
+            version=data.get("version", 1),
         )
 
     @staticmethod
@@ -51,6 +56,7 @@ class ProductMapper:
             "name": product.name,
             "quantity": product.quantity,
             "purchased": product.purchased,
+            "version": product.version,
         }
 
     @staticmethod
@@ -59,14 +65,53 @@ class ProductMapper:
         Create Product entity from database row.
 
         :param row: Database row as dictionary
-        :return: Product domain entity
+        :return: Product domain entity, clean since it mirrors the stored row
         """
-        return _Product(
+        product = _Product(
             id=row["id"],
             name=row["name"],
             quantity=row["quantity"],
             purchased=row["purchased"],
+            version=row.get("version", 1),
         )
+        product.mark_clean()
+        return product
+
+    @staticmethod
+    def product_row_factory(cursor: Any) -> Callable[[Sequence[Any]], _Product]:
+        """
+        psycopg row factory creating Product entities directly from result tuples.
+
+        Column positions are resolved once per result set from the cursor
+        description, so each row is turned into a Product without building
+        an intermediate dictionary.
+
+        :param cursor: psycopg cursor the factory is attached to
+        :return: Callable converting a sequence of column values to a Product
+        :raises ValueError: If the result set lacks one of the product columns
+        """
+        description = cursor.description or []
+        positions = {column.name: index for index, column in enumerate(description)}
+        missing = [c for c in ProductMapper.PRODUCT_COLUMNS if c not in positions]
+        if missing:
+            raise ValueError(f"Result set is missing columns: {', '.join(missing)}")
+
+        id_pos, name_pos, quantity_pos, purchased_pos, version_pos = (
+            positions[column] for column in ProductMapper.PRODUCT_COLUMNS
+        )
+
+        def make_row(values: Sequence[Any]) -> _Product:
+            product = _Product(
+                id=values[id_pos],
+                name=values[name_pos],
+                quantity=values[quantity_pos],
+                purchased=values[purchased_pos],
+                version=values[version_pos],
+            )
+            product.mark_clean()
+            return product
+
+        return make_row
 
     @staticmethod
     def validate_for_persistence(product: _Product) -> List[str]:
@@ -1,9 +1,10 @@
 import os
+import threading
 from contextlib import contextmanager
 from typing import Optional, Iterator, Dict, Any, List
 import psycopg
 from psycopg import Connection
-from psycopg.rows import dict_row
+from psycopg.rows import RowFactory, dict_row
 
 
 class DatabaseService:
@@ -14,6 +15,8 @@ class DatabaseService:
 
     def __init__(self):
         self._connection_string = self._build_connection_string()
+        # Connection bound by an open unit of work, kept per thread
+        self._local = threading.local()
 
     def _build_connection_string(self) -> str:
         """Build PostgreSQL connection string from environment variables."""
@@ -57,6 +60,29 @@ class DatabaseService:
                 # Transaction is automatically rolled back
                 raise
 
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Connection[Dict[str, Any]]]:
+        """
+        Run all queries and commands issued on this thread in one transaction.
+
+        The connection is bound for the duration of the block, so several
+        repository calls share one connection and one commit. Nested units
+        of work join the outermost one.
+
+        :yield: Database connection with transaction
+        """
+        bound_connection = getattr(self._local, "connection", None)
+        if bound_connection is not None:
+            yield bound_connection
+            return
+
+        with self.get_transaction() as conn:
+            self._local.connection = conn
+            try:
+                yield conn
+            finally:
+                self._local.connection = None
+
     def health_check(self) -> bool:
         """
         Check if database connection is healthy.
@@ -82,9 +108,12 @@ class DatabaseService:
             name VARCHAR(255) NOT NULL,
             quantity INTEGER NOT NULL CHECK (quantity > 0),
             purchased BOOLEAN NOT NULL DEFAULT FALSE,
+            version INTEGER NOT NULL DEFAULT 1,
             created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP        );
 
+        ALTER TABLE products ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
         CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);
         CREATE INDEX IF NOT EXISTS idx_products_purchased ON products(purchased);
         """
@@ -94,19 +123,41 @@ class DatabaseService:
                 cursor.execute(create_table_sql)
 
     def execute_query(
-        self, query: str, params: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        row_factory: Optional[RowFactory[Any]] = None,
+    ) -> List[Any]:
         """
         Execute SELECT query and return results.
 
         :param query: SQL query
         :param params: Query parameters
-        :return: List of rows as dictionaries
+        :param row_factory: Optional psycopg row factory overriding ``dict_row``
+        :return: List of rows as dictionaries, or as built by ``row_factory``
         """
+        bound_connection = getattr(self._local, "connection", None)
+        if bound_connection is not None:
+            return self._fetch_all(bound_connection, query, params, row_factory)
+
         with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params or {})
-                return cursor.fetchall()
+            return self._fetch_all(conn, query, params, row_factory)
+
+    def _fetch_all(
+        self,
+        conn: Connection[Dict[str, Any]],
+        query: str,
+        params: Optional[Dict[str, Any]],
+        row_factory: Optional[RowFactory[Any]],
+    ) -> List[Any]:
+        """Execute a query on the given connection and fetch all rows."""
+        if row_factory is None:
+            cursor = conn.cursor()
+        else:
+            cursor = conn.cursor(row_factory=row_factory)
+        with cursor as active_cursor:
+            active_cursor.execute(query, params or {})
+            return active_cursor.fetchall()
 
     def execute_command(
         self, command: str, params: Optional[Dict[str, Any]] = None
@@ -118,7 +169,35 @@ class DatabaseService:
         :param params: Command parameters
         :return: Number of affected rows
         """
+        bound_connection = getattr(self._local, "connection", None)
+        if bound_connection is not None:
+            # Part of an open unit of work, committed when it completes
+            with bound_connection.cursor() as cursor:
+                cursor.execute(command, params or {})
+                return cursor.rowcount
+
         with self.get_transaction() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(command, params or {})
                 return cursor.rowcount
+
+    def execute_returning(
+        self,
+        command: str,
+        params: Optional[Dict[str, Any]] = None,
+        row_factory: Optional[RowFactory[Any]] = None,
+    ) -> List[Any]:
+        """
+        Execute INSERT/UPDATE/DELETE ... RETURNING command and fetch its rows.
+
+        :param command: SQL command with a RETURNING clause
+        :param params: Command parameters
+        :param row_factory: Optional psycopg row factory overriding ``dict_row``
+        :return: Returned rows as dictionaries, or as built by ``row_factory``
+        """
+        bound_connection = getattr(self._local, "connection", None)
+        if bound_connection is not None:
+            return self._fetch_all(bound_connection, command, params, row_factory)
+
+        with self.get_transaction() as conn:
+            return self._fetch_all(conn, command, params, row_factory)
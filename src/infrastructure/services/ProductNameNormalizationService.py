@@ -1,8 +1,37 @@
-from typing import Dict, List, Tuple, Any
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
+import heapq
 import re
 import json
 import os
-from difflib import get_close_matches
+from difflib import SequenceMatcher
+
+from src.infrastructure.text.BrandMatcher import BrandMatcher
+from src.infrastructure.text.LearnedTyposJournal import LearnedTyposJournal
+from src.infrastructure.text.MappedLexicon import MappedLexicon
+from src.infrastructure.text.Vocabulary import SYMSPELL_BACKEND, Vocabulary
+from src.utils.lru_cache import LRUCache
+
+# Service instance owned by each batch normalization worker process
+_worker_service: Optional["ProductNameNormalizationService"] = None
+
+# Correct words suggested even when no typo fix points at them
+COMMON_WORDS = (
+    "mleko",
+    "chleb",
+    "masło",
+    "jogurt",
+    "kiełbasa",
+    "marchew",
+    "ziemniaki",
+    "pomidory",
+    "banany",
+    "jabłka",
+    "cebula",
+    "czosnek",
+)
 
 
 class ProductNameNormalizationService:
@@ -11,8 +40,23 @@ class ProductNameNormalizationService:
     Fixes common Polish typos and learns from user corrections.
     """
 
-    def __init__(self):
-        """Initialize with Polish product corrections and load learned data."""
+    def __init__(
+        self,
+        scoring_backend: str = SYMSPELL_BACKEND,
+        typo_fixes: Optional[Dict[str, str]] = None,
+        brands: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize with Polish product corrections and load learned data.
+
+        Given ``typo_fixes``, the service uses them as they are and only
+        normalizes names: the learned data is not read or journaled and the
+        suggestion vocabulary starts empty. Batch workers are built this way.
+
+        :param scoring_backend: Vocabulary search backend, "symspell" or "batch"
+        :param typo_fixes: Compiled typo fixes replacing the built-in and learned ones
+        :param brands: Brand standardizations replacing the built-in ones
+        """
         self.built_in_typo_fixes = {
             "mlko": "mleko",
             "chlb": "chleb",
@@ -33,15 +77,41 @@ class ProductNameNormalizationService:
             "sprite": "Sprite",
             "danone": "Danone",
         }
+        if brands is not None:
+            self.brands = dict(brands)
+        self.brand_matcher = BrandMatcher(self.brands)
 
         # Path for learned data
         self.learned_data_path = "data/learned_typos.json"
 
-        # Load learned typo fixes
-        self.learned_typo_fixes = self._load_learned_typos()
+        self.learned_typos_journal: Optional[LearnedTyposJournal] = None
+        if typo_fixes is not None:
+            self.learned_typo_fixes: Dict[str, str] = {}
+            self.typo_fixes = dict(typo_fixes)
+        else:
+            # Load learned typo fixes, later corrections are journaled
+            self.learned_typos_journal = LearnedTyposJournal(self.learned_data_path)
+            self.learned_typo_fixes = self.learned_typos_journal.fixes
+
+            # Combined typo fixes (built-in + learned)
+            self.typo_fixes = {**self.built_in_typo_fixes, **self.learned_typo_fixes}
+
+        # Optional large lexicon, memory-mapped instead of loaded
+        self.lexicon_path = "data/polish_lexicon.lex"
+        self.lexicon = self._open_lexicon()
+
+        # Every word a typo can be corrected to, grown by learning and new products
+        self.vocabulary = Vocabulary(
+            self._suggestion_vocabulary() if typo_fixes is None else (),
+            backend=scoring_backend,
+        )
+
+        # How often missing diacritics answered a suggestion without fuzzy search
+        self.diacritic_hits = 0
+        self.diacritic_misses = 0
 
-        # Combined typo fixes (built-in + learned)
-        self.typo_fixes = {**self.built_in_typo_fixes, **self.learned_typo_fixes}
+        # Recent normalizations, cleared whenever the typo or brand fixes change
+        self._normalization_cache: LRUCache[Dict[str, Any]] = LRUCache(maxsize=1024)
 
     def normalize_name(self, name: str) -> Dict[str, Any]:
         """
@@ -53,33 +123,83 @@ class ProductNameNormalizationService:
         if not name:
             return {"original": "", "normalized": "", "improved": False, "changes": []}
 
-        original = name
-        changes = []
+        cached = self._normalization_cache.get(name)
+        if cached is None:
+            cached = self._normalize_uncached(name)
+            self._normalization_cache.put(name, cached)
+
+        # Callers may modify the result, so never hand out the cached dict
+        return {**cached, "changes": list(cached["changes"])}
 
-        # Step 1: Basic cleanup
-        normalized = self._clean_whitespace(name)
-        if normalized != name:
-            changes.append("Fixed spacing")
+    def normalize_names(
+        self, names: Iterable[str], workers: int = 1, batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Normalize many names, optionally across a pool of worker processes.
+
+        Results are yielded lazily in input order. With several workers the
+        typo and brand dictionaries are sent once to each worker, names are
+        sent in batches and only a bounded number of batches is in flight.
 
-        # Step 2: Fix typos
-        normalized = self._fix_typos(normalized)
-        if normalized != self._clean_whitespace(name):
-            changes.append("Fixed typos")
+        :param names: Names to normalize
+        :param workers: Number of worker processes, 1 normalizes in-process
+        :param batch_size: Number of names sent to a worker at once
+        :return: Iterator of normalization results
+        :raises ValueError: If workers or batch_size is not positive
+        """
+        if workers < 1 or batch_size < 1:
+            raise ValueError("Workers and batch size must be positive integers.")
+        if workers == 1:
+            return (self.normalize_name(name) for name in names)
+        return self._normalize_in_pool(names, workers, batch_size)
+
+    def _normalize_in_pool(
+        self, names: Iterable[str], workers: int, batch_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream batches through a process pool, keeping results in order."""
+        names_iterator = iter(names)
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_normalization_worker,
+            initargs=(self.typo_fixes, self.brands),
+        ) as executor:
+            while True:
+                while len(pending) < workers * 2:
+                    batch = list(islice(names_iterator, batch_size))
+                    if not batch:
+                        break
+                    pending.append(executor.submit(_normalize_batch, batch))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+
+    def _normalize_uncached(self, name: str) -> Dict[str, Any]:
+        """
+        Run each normalization stage once, recording the stages that changed the name.
 
-        # Step 3: Fix brands
-        normalized = self._fix_brands(normalized)
+        :param name: Original name
+        :return: Dict with original, normalized name and changes
+        """
+        stages = (
+            ("Fixed spacing", self._clean_whitespace),
+            ("Fixed typos", self._fix_typos),
+            (None, self._fix_brands),
+            ("Fixed capitalization", self._capitalize_properly),
+        )
 
-        # Step 4: Proper capitalization
-        normalized = self._capitalize_properly(normalized)
-        if normalized != self._fix_brands(
-            self._fix_typos(self._clean_whitespace(name))
-        ):
-            changes.append("Fixed capitalization")
+        normalized = name
+        changes = []
+        for change, stage in stages:
+            result = stage(normalized)
+            if change and result != normalized:
+                changes.append(change)
+            normalized = result
 
         return {
-            "original": original,
+            "original": name,
             "normalized": normalized,
-            "improved": original != normalized,
+            "improved": name != normalized,
             "changes": changes,
         }
 
@@ -93,19 +213,46 @@ class ProductNameNormalizationService:
         fixed_words = []
 
         for word in words:
-            if word in self.typo_fixes:
-                fixed_words.append(self.typo_fixes[word])
-            else:
-                fixed_words.append(word)
+            fixed_words.append(self._correct_word(word) or word)
 
         return " ".join(fixed_words)
 
+    def _correct_word(self, word: str) -> Optional[str]:
+        """Return the known correction of a word from the fixes or the lexicon."""
+        if word in self.typo_fixes:
+            return self.typo_fixes[word]
+        if self.lexicon is not None:
+            canonical = self.lexicon.get(word)
+            if canonical is not None and canonical != word:
+                return canonical
+        return None
+
+    def _open_lexicon(self) -> Optional[MappedLexicon]:
+        """Open the compiled lexicon if one was built."""
+        try:
+            if os.path.exists(self.lexicon_path):
+                return MappedLexicon(self.lexicon_path)
+        except (OSError, ValueError):
+            pass
+        return None
+
     def _fix_brands(self, text: str) -> str:
         """Fix brand names."""
-        lower_text = text.lower()
-        for brand_lower, brand_proper in self.brands.items():
-            lower_text = lower_text.replace(brand_lower, brand_proper)
-        return lower_text
+        return self.brand_matcher.replace(text)
+
+    def add_brand(self, brand: str, proper: str):
+        """
+        Add a brand standardization.
+
+        :param brand: Brand spelling to look for
+        :param proper: Proper form of the brand
+        """
+        brand_lower = " ".join(brand.lower().split())
+        proper = proper.strip()
+        if brand_lower and proper:
+            self.brands[brand_lower] = proper
+            self.brand_matcher.add_brand(brand_lower, proper)
+            self._normalization_cache.clear()
 
     def _capitalize_properly(self, text: str) -> str:
         """Apply proper capitalization."""
@@ -141,24 +288,10 @@ class ProductNameNormalizationService:
 
         return sorted(similar, key=lambda x: x[1], reverse=True)[:3]
 
-    def _load_learned_typos(self) -> Dict[str, str]:
-        """Load learned typo fixes from file."""
-        try:
-            if os.path.exists(self.learned_data_path):
-                with open(self.learned_data_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        return {}
-
-    def _save_learned_typos(self):
-        """Save learned typo fixes to file."""
-        try:
-            os.makedirs(os.path.dirname(self.learned_data_path), exist_ok=True)
-            with open(self.learned_data_path, "w", encoding="utf-8") as f:
-                json.dump(self.learned_typo_fixes, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+    def flush_learned_typos(self):
+        """Write learned typo fixes that are still waiting for the debounced flush."""
+        if self.learned_typos_journal is not None:
+            self.learned_typos_journal.flush()
 
     def add_learned_typo(self, typo: str, correct: str):
         """
@@ -171,9 +304,33 @@ class ProductNameNormalizationService:
         correct_formatted = correct.strip()
 
         if typo_lower and correct_formatted and typo_lower != correct_formatted.lower():
-            self.learned_typo_fixes[typo_lower] = correct_formatted.lower()
-            self.typo_fixes = {**self.built_in_typo_fixes, **self.learned_typo_fixes}
-            self._save_learned_typos()
+            if self.learned_typos_journal is not None:
+                self.learned_typos_journal.record(typo_lower, correct_formatted.lower())
+            self.typo_fixes[typo_lower] = correct_formatted.lower()
+            self.vocabulary.add(correct_formatted.lower())
+            self._normalization_cache.clear()
+
+    def _suggestion_vocabulary(self) -> Set[str]:
+        """Collect the correct words offered as typo suggestions."""
+        return set(self.typo_fixes.values()).union(COMMON_WORDS)
+
+    def learn_product_name(self, name: str):
+        """
+        Add the words of a product name to the suggestion vocabulary.
+
+        :param name: Product name, ideally already normalized
+        """
+        for word in name.lower().split():
+            if len(word) >= 3 and word.isalpha() and word not in self.typo_fixes:
+                self.vocabulary.add(word)
+
+    def _is_known_word(self, word: str) -> bool:
+        """Check whether a word is a correct vocabulary word rather than a typo."""
+        if word in self.typo_fixes:
+            return False
+        if word in self.vocabulary:
+            return True
+        return self.lexicon is not None and self.lexicon.get(word) == word
 
     def find_typo_suggestions(
         self, word: str, max_suggestions: int = 3
@@ -188,32 +345,31 @@ class ProductNameNormalizationService:
         word_lower = word.lower().strip()
 
         # First check direct matches
-        if word_lower in self.typo_fixes:
-            return [(self.typo_fixes[word_lower], 1.0)]
-
-        # Get all possible correct words (values from typo_fixes + common words)
-        all_correct_words = list(set(self.typo_fixes.values()))
-        all_correct_words.extend(
-            [
-                "mleko",
-                "chleb",
-                "masło",
-                "jogurt",
-                "kiełbasa",
-                "marchew",
-                "ziemniaki",
-                "pomidory",
-                "banany",
-                "jabłka",
-                "cebula",
-                "czosnek",
-            ]
-        )
-
-        # Use difflib to find close matches
-        close_matches = get_close_matches(
-            word_lower, all_correct_words, n=max_suggestions, cutoff=0.6
-        )
+        correction = self._correct_word(word_lower)
+        if correction is not None:
+            return [(correction, 1.0)]
+
+        # Most typos are just missing Polish letters, answer those directly;
+        # words typed with diacritics are never folded back to plain letters
+        folded = self.vocabulary.fold_diacritics(word_lower)
+        if word_lower == folded:
+            variants = self.vocabulary.diacritic_variants(word_lower)
+            if variants:
+                self.diacritic_hits += 1
+                return [(variant, 1.0) for variant in variants[:max_suggestions]]
+            self.diacritic_misses += 1
+
+        # Only words within the vocabulary edit distance are compared,
+        # more frequent words win ties
+        scored = []
+        for candidate, _ in self.vocabulary.lookup(word_lower):
+            # Neither the word itself nor its plain-letter spelling is a fix
+            if candidate == folded:
+                continue
+            ratio = SequenceMatcher(None, word_lower, candidate).ratio()
+            if ratio >= 0.6:
+                scored.append((ratio, self.vocabulary.frequency(candidate), candidate))
+        close_matches = [match for *_, match in heapq.nlargest(max_suggestions, scored)]
 
         # Calculate confidence scores
         suggestions = []
@@ -246,8 +402,10 @@ class ProductNameNormalizationService:
 
         suggestions = []
 
-        # Check each word for potential improvements
+        # Check each word for potential improvements, correct words have none
         for word in words:
+            if self._is_known_word(word):
+                continue
             word_suggestions = self.find_typo_suggestions(word, max_suggestions)
 
             for suggestion, confidence in word_suggestions:
@@ -283,6 +441,8 @@ class ProductNameNormalizationService:
         words = name.lower().split()
 
         for word in words:
+            if self._is_known_word(word):
+                continue
             suggestions = self.find_typo_suggestions(word, 1)
             if suggestions and suggestions[0][1] > confidence_threshold:
                 return True
@@ -303,7 +463,9 @@ class ProductNameNormalizationService:
             suggestions = self.find_typo_suggestions(word, 3)
             word_analysis[word] = {
                 "suggestions": suggestions,
-                "has_suggestions": len(suggestions) > 0 and suggestions[0][1] > 0.6,
+                "has_suggestions": not self._is_known_word(word)
+                and len(suggestions) > 0
+                and suggestions[0][1] > 0.6,
                 "best_suggestion": suggestions[0] if suggestions else None,
             }
 
@@ -321,11 +483,32 @@ class ProductNameNormalizationService:
 
         :return: Dictionary with learning statistics
         """
+        diacritic_lookups = self.diacritic_hits + self.diacritic_misses
         return {
             "built_in_typos": len(self.built_in_typo_fixes),
             "learned_typos": len(self.learned_typo_fixes),
             "total_typos": len(self.typo_fixes),
+            "lexicon_words": len(self.lexicon) if self.lexicon is not None else 0,
+            "diacritic_hits": self.diacritic_hits,
+            "diacritic_misses": self.diacritic_misses,
+            "diacritic_hit_rate": (
+                self.diacritic_hits / diacritic_lookups if diacritic_lookups else 0.0
+            ),
             "learned_examples": list(self.learned_typo_fixes.items())[
                 :10
             ],  # Show first 10
         }
+
+
+def _init_normalization_worker(typo_fixes: Dict[str, str], brands: Dict[str, str]):
+    """Create the worker's service from the parent's dictionaries."""
+    global _worker_service
+    _worker_service = ProductNameNormalizationService(
+        typo_fixes=typo_fixes, brands=brands
+    )
+
+
+def _normalize_batch(names: List[str]) -> List[Dict[str, Any]]:
+    """Normalize one batch of names inside a worker process."""
+    assert _worker_service is not None, "Worker was not initialized."
+    return [_worker_service.normalize_name(name) for name in names]
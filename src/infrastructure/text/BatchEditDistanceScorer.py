@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.text.SymSpellIndex import SymSpellIndex
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the scorer falls back to pure Python
+    np = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE = np is not None
+
+
+class BatchEditDistanceScorer:
+    """
+    Scores a word against whole groups of vocabulary words at once.
+
+    Words are grouped by length and, when NumPy is installed, encoded as one
+    integer array of code points per length. A lookup fills the Levenshtein
+    table for every word of a length bucket simultaneously and drops words as
+    soon as they can no longer stay within the distance bound. Without NumPy
+    the same buckets are scored one word at a time.
+    """
+
+    def __init__(self, max_distance: int = 2, use_numpy: Optional[bool] = None):
+        """
+        Create an empty scorer.
+
+        :param max_distance: Largest edit distance a lookup can return.
+        :param use_numpy: Force the NumPy or pure-Python path, by default NumPy
+            is used when it is installed.
+        :raises ValueError: If NumPy is requested but not installed.
+        """
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise ValueError("NumPy is not installed.")
+        self.max_distance = max_distance
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else use_numpy
+        self._buckets: Dict[int, List[str]] = {}
+        self._encoded: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def add(self, word: str) -> None:
+        """
+        Add a word, its length bucket is re-encoded on the next lookup.
+
+        :param word: Word to add, callers must not add duplicates.
+        """
+        self._buckets.setdefault(len(word), []).append(word)
+        self._encoded.pop(len(word), None)
+
+    def lookup(
+        self, word: str, max_distance: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Find words within an edit distance of the given word.
+
+        :param word: Word to look up.
+        :param max_distance: Largest edit distance, defaults to the scorer maximum.
+        :return: List of (word, distance) tuples, closest first.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        matches: List[Tuple[str, int]] = []
+        for length in range(len(word) - max_distance, len(word) + max_distance + 1):
+            bucket = self._buckets.get(length)
+            if not bucket:
+                continue
+            if self.use_numpy:
+                matches.extend(self._score_bucket(word, length, max_distance))
+            else:
+                for candidate in bucket:
+                    distance = SymSpellIndex.edit_distance(
+                        word, candidate, max_distance
+                    )
+                    if distance <= max_distance:
+                        matches.append((candidate, distance))
+
+        return sorted(matches, key=lambda match: (match[1], match[0]))
+
+    def _score_bucket(
+        self, word: str, length: int, max_distance: int
+    ) -> List[Tuple[str, int]]:
+        """Run the Levenshtein recurrence for a whole length bucket with NumPy."""
+        encoded = self._encoded.get(length)
+        if encoded is None:
+            encoded = np.array(
+                [
+                    [ord(char) for char in candidate]
+                    for candidate in self._buckets[length]
+                ],
+                dtype=np.int32,
+            ).reshape(len(self._buckets[length]), length)
+            self._encoded[length] = encoded
+
+        rows = np.arange(len(encoded))
+        previous = np.tile(np.arange(length + 1, dtype=np.int32), (len(encoded), 1))
+        for i, char in enumerate(word, 1):
+            # Substitutions and deletions come from the previous row
+            diagonal = previous[:, :-1] + (encoded != ord(char))
+            above = previous[:, 1:] + 1
+            best = np.minimum(diagonal, above)
+
+            # Insertions depend on the cell to the left, so walk the columns
+            current = np.empty_like(previous)
+            current[:, 0] = i
+            for j in range(length):
+                current[:, j + 1] = np.minimum(best[:, j], current[:, j] + 1)
+
+            alive = current.min(axis=1) <= max_distance
+            if not alive.all():
+                if not alive.any():
+                    return []
+                encoded, current, rows = encoded[alive], current[alive], rows[alive]
+            previous = current
+
+        distances = previous[:, -1]
+        within = distances <= max_distance
+        bucket = self._buckets[length]
+        return [
+            (bucket[row], int(distance))
+            for row, distance in zip(rows[within], distances[within])
+        ]
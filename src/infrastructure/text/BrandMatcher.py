@@ -0,0 +1,84 @@
+import re
+from typing import Dict, Mapping, Optional, Pattern
+
+
+class BrandMatcher:
+    """
+    Replaces every known brand in a text in a single regex pass.
+
+    All brands are compiled into one alternation, longest first, so that a
+    brand contained in a longer one never wins. The pattern is rebuilt only
+    when the brand set changes.
+    """
+
+    def __init__(self, brands: Optional[Mapping[str, str]] = None):
+        """
+        Build the matcher.
+
+        :param brands: Mapping of lower-case brand spellings to their proper form.
+        """
+        self._brands: Dict[str, str] = {}
+        self._pattern: Optional[Pattern[str]] = None
+        self.set_brands(brands or {})
+
+    @property
+    def brands(self) -> Dict[str, str]:
+        """
+        Brands known to the matcher.
+
+        :return: Copy of the brand mapping.
+        """
+        return dict(self._brands)
+
+    def set_brands(self, brands: Mapping[str, str]) -> None:
+        """
+        Replace the whole brand set.
+
+        :param brands: Mapping of brand spellings to their proper form.
+        """
+        self._brands = {
+            self._key(brand): proper for brand, proper in brands.items() if brand
+        }
+        self._compile()
+
+    def add_brand(self, brand: str, proper: str) -> None:
+        """
+        Add or change a single brand.
+
+        :param brand: Brand spelling to look for.
+        :param proper: Proper form of the brand.
+        """
+        key = self._key(brand)
+        if key and self._brands.get(key) != proper:
+            self._brands[key] = proper
+            self._compile()
+
+    def replace(self, text: str) -> str:
+        """
+        Lower-case the text and standardize every whole-word brand in it.
+
+        :param text: Text to process.
+        :return: Text with brands replaced.
+        """
+        lower_text = text.lower()
+        if self._pattern is None:
+            return lower_text
+        return self._pattern.sub(
+            lambda match: self._brands[self._key(match.group(0))], lower_text
+        )
+
+    @staticmethod
+    def _key(brand: str) -> str:
+        """Normalize a brand spelling to its lookup key."""
+        return " ".join(brand.lower().split())
+
+    def _compile(self) -> None:
+        """Compile all brands into one word-bounded alternation."""
+        if not self._brands:
+            self._pattern = None
+            return
+        alternatives = [
+            r"\s+".join(re.escape(part) for part in brand.split())
+            for brand in sorted(self._brands, key=len, reverse=True)
+        ]
+        self._pattern = re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + r")(?!\w)")
@@ -0,0 +1,160 @@
+import atexit
+import json
+import os
+import threading
+import weakref
+from typing import Dict, List, Optional
+
+# Journals still open, flushed once at interpreter exit without being kept alive
+_open_journals: "weakref.WeakSet[LearnedTyposJournal]" = weakref.WeakSet()
+
+
+def _flush_open_journals() -> None:
+    """Write the buffered corrections of every journal that is still open."""
+    for journal in list(_open_journals):
+        journal.flush()
+
+
+atexit.register(_flush_open_journals)
+
+
+class LearnedTyposJournal:
+    """
+    Persists learned typo corrections as a snapshot plus an append-only journal.
+
+    New corrections are buffered and appended to the journal by a debounced
+    flush, so bulk teaching costs one write per burst instead of one full
+    rewrite per correction. Once the journal grows past ``compact_threshold``
+    entries it is folded into the snapshot and truncated.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        journal_path: Optional[str] = None,
+        flush_delay: float = 1.0,
+        compact_threshold: int = 500,
+    ):
+        """
+        Create the journal and load the stored corrections.
+
+        :param snapshot_path: JSON file holding the compacted corrections.
+        :param journal_path: JSON Lines file of corrections since the last
+            compaction, defaults to the snapshot path with a .journal suffix.
+        :param flush_delay: Seconds to wait for more corrections before writing.
+        :param compact_threshold: Journal entries that trigger a compaction.
+        """
+        self.snapshot_path = os.path.abspath(snapshot_path)
+        self.journal_path = os.path.abspath(
+            journal_path or os.path.splitext(snapshot_path)[0] + ".journal"
+        )
+        self.flush_delay = flush_delay
+        self.compact_threshold = compact_threshold
+        self.fixes: Dict[str, str] = {}
+        self._journal_entries = 0
+        self._pending: List[Dict[str, str]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._load()
+        _open_journals.add(self)
+
+    def record(self, typo: str, correct: str) -> None:
+        """
+        Store a correction and schedule it to be written.
+
+        :param typo: The incorrect word.
+        :param correct: The correct word.
+        """
+        with self._lock:
+            self.fixes[typo] = correct
+            self._pending.append({"typo": typo, "correct": correct})
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Append buffered corrections to the journal, compacting it if it grew too long.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.writelines(
+                        json.dumps(entry, ensure_ascii=False) + "\n"
+                        for entry in self._pending
+                    )
+                self._journal_entries += len(self._pending)
+                self._pending.clear()
+                if self._journal_entries >= self.compact_threshold:
+                    self._compact()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """
+        Write buffered corrections and stop flushing this journal at exit.
+        """
+        self.flush()
+        _open_journals.discard(self)
+
+    def compact(self) -> None:
+        """
+        Write every correction to the snapshot and empty the journal.
+        """
+        self.flush()
+        with self._lock:
+            try:
+                self._compact()
+            except OSError:
+                pass
+
+    def _compact(self) -> None:
+        """Replace the snapshot atomically, then truncate the journal."""
+        os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(self.fixes, f, ensure_ascii=False, indent=2)
+        os.replace(temporary_path, self.snapshot_path)
+        open(self.journal_path, "w", encoding="utf-8").close()
+        self._journal_entries = 0
+
+    def _load(self) -> None:
+        """Read the snapshot and replay the journal on top of it."""
+        try:
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    self.fixes.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+        try:
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return
+
+        if data and not data.endswith(b"\n"):
+            # A crash left a partially written last line; cut it off so the
+            # next flush does not append onto it
+            data = data[: data.rfind(b"\n") + 1]
+            try:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(len(data))
+            except OSError:
+                # Read-only journal: the torn line is still skipped below
+                pass
+
+        for line in data.decode("utf-8", errors="replace").splitlines():
+            try:
+                entry = json.loads(line)
+                self.fixes[entry["typo"]] = entry["correct"]
+                self._journal_entries += 1
+            except (ValueError, KeyError, TypeError):
+                continue
@@ -0,0 +1,162 @@
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Optional, Tuple
+
+MAGIC = b"PLLEX\x00\x00\x01"
+HEADER = struct.Struct("<8sI4x")
+OFFSET = struct.Struct("<I")
+BOUNDS = struct.Struct("<II")
+SEPARATOR = b"\x00"
+
+
+class MappedLexicon:
+    """
+    Read-only word lexicon stored as a memory-mapped sorted string table.
+
+    The file holds a header, a table of entry offsets and the entries
+    themselves, each ``key NUL value`` in UTF-8 and sorted by key. Opening only
+    maps the file and reads the header. Lookups binary search the offset table
+    directly in the mapping, so the lexicon is never loaded into Python objects
+    and its pages are shared between processes.
+
+    An empty value marks a correct word, any other value is the word's
+    canonical spelling.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a lexicon file.
+
+        :param path: Path to a file written by ``MappedLexicon.build``.
+        :raises ValueError: If the file is not a lexicon.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map.size() < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is not a lexicon file.")
+        magic, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a lexicon file.")
+
+    def __enter__(self) -> "MappedLexicon":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._find(word.encode("utf-8")) is not None
+
+    def close(self) -> None:
+        """
+        Unmap the lexicon file.
+        """
+        self._map.close()
+
+    def get(self, word: str) -> Optional[str]:
+        """
+        Look a word up.
+
+        :param word: Word to look up.
+        :return: The canonical spelling, the word itself for correct words,
+            or None if the word is not in the lexicon.
+        """
+        index = self._find(word.encode("utf-8"))
+        if index is None:
+            return None
+        value = self._value_at(index)
+        return value.decode("utf-8") if value else word
+
+    def items_with_prefix(self, prefix: str) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over entries whose key starts with a prefix, in key order.
+
+        :param prefix: Key prefix, an empty prefix yields every entry.
+        :yield: (word, canonical spelling) tuples.
+        """
+        encoded_prefix = prefix.encode("utf-8")
+        index = self._lower_bound(encoded_prefix)
+        while index < self._count:
+            key = self._key_at(index)
+            if not key.startswith(encoded_prefix):
+                return
+            value = self._value_at(index)
+            word = key.decode("utf-8")
+            yield word, value.decode("utf-8") if value else word
+            index += 1
+
+    @staticmethod
+    def build(path: str, entries: Iterable[Tuple[str, str]]) -> int:
+        """
+        Write a lexicon file.
+
+        :param path: Destination path, replaced atomically.
+        :param entries: (word, canonical spelling) pairs, an empty spelling marks
+            a correct word. Later duplicates override earlier ones.
+        :return: Number of entries written.
+        """
+        table = {}
+        for word, canonical in entries:
+            if word:
+                table[word.encode("utf-8")] = (
+                    b"" if canonical in ("", word) else canonical.encode("utf-8")
+                )
+        keys = sorted(table)
+
+        data_start = HEADER.size + OFFSET.size * (len(keys) + 1)
+        offsets = []
+        position = data_start
+        for key in keys:
+            offsets.append(position)
+            position += len(key) + len(SEPARATOR) + len(table[key])
+        offsets.append(position)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(keys)))
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            for key in keys:
+                f.write(key + SEPARATOR + table[key])
+        os.replace(temporary_path, path)
+        return len(keys)
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """Return the index of an exact key, or None."""
+        index = self._lower_bound(key)
+        if index < self._count and self._key_at(index) == key:
+            return index
+        return None
+
+    def _lower_bound(self, key: bytes) -> int:
+        """Return the index of the first entry not smaller than the key."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _entry_bounds(self, index: int) -> Tuple[int, int]:
+        """Return the start and end offsets of an entry."""
+        return BOUNDS.unpack_from(self._map, HEADER.size + OFFSET.size * index)
+
+    def _key_at(self, index: int) -> bytes:
+        """Read the key of an entry."""
+        start, end = self._entry_bounds(index)
+        return self._map[start : self._map.find(SEPARATOR, start, end)]
+
+    def _value_at(self, index: int) -> bytes:
+        """Read the value of an entry."""
+        start, end = self._entry_bounds(index)
+        return self._map[self._map.find(SEPARATOR, start, end) + 1 : end]
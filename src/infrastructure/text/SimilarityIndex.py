@@ -0,0 +1,134 @@
+import math
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+class SimilarityIndex:
+    """
+    Finds product names that contain, or are contained in, a given name.
+
+    Names are indexed by their character trigrams in postings bucketed by name
+    length. A query only reads the postings of its own trigrams for lengths
+    that can reach the similarity threshold, instead of scanning every name.
+    """
+
+    NGRAM_SIZE = 3
+
+    def __init__(self, min_similarity: float = 0.7):
+        """
+        Create an empty index.
+
+        :param min_similarity: Length ratio a match must exceed.
+        """
+        self.min_similarity = min_similarity
+        self._names: Dict[Hashable, str] = {}
+        self._lower_names: Dict[Hashable, str] = {}
+        self._ngram_counts: Dict[Hashable, int] = {}
+        self._postings: Dict[Tuple[int, str], Set[Hashable]] = {}
+        self._length_buckets: Dict[int, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
+    def add(self, key: Hashable, name: str) -> None:
+        """
+        Index a name, replacing the name previously stored under the key.
+
+        :param key: Identifier of the name, e.g. a product ID.
+        :param name: Name to index.
+        """
+        if key in self._names:
+            if self._names[key] == name:
+                return
+            self.remove(key)
+
+        lower_name = name.lower()
+        self._names[key] = name
+        self._lower_names[key] = lower_name
+        ngrams = self._ngrams(lower_name)
+        self._ngram_counts[key] = len(ngrams)
+        self._length_buckets.setdefault(len(lower_name), set()).add(key)
+        for ngram in ngrams:
+            self._postings.setdefault((len(lower_name), ngram), set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a name from the index if it is present.
+
+        :param key: Identifier of the name.
+        """
+        if key not in self._names:
+            return
+        del self._names[key]
+        lower_name = self._lower_names.pop(key)
+        del self._ngram_counts[key]
+        bucket = self._length_buckets[len(lower_name)]
+        bucket.discard(key)
+        if not bucket:
+            del self._length_buckets[len(lower_name)]
+        for ngram in self._ngrams(lower_name):
+            posting_key = (len(lower_name), ngram)
+            posting = self._postings[posting_key]
+            posting.discard(key)
+            if not posting:
+                del self._postings[posting_key]
+
+    def find_similar(self, name: str, limit: int = 3) -> List[Tuple[str, float]]:
+        """
+        Find indexed names that contain or are contained in the given name.
+
+        Similarity is the ratio of the shorter to the longer name and must
+        exceed ``min_similarity``. Names equal to the query are not returned.
+
+        :param name: Name to compare.
+        :param limit: Maximum number of results.
+        :return: List of (name, similarity) tuples, most similar first.
+        """
+        query = name.lower()
+        if not query:
+            return []
+
+        query_ngrams = self._ngrams(query)
+        hits: Dict[Hashable, int] = {}
+        candidates: List[Hashable] = []
+        for length in self._candidate_lengths(len(query)):
+            if length < self.NGRAM_SIZE or not query_ngrams:
+                # Without shared trigrams to go by, check the whole bucket
+                candidates.extend(self._length_buckets.get(length, ()))
+                continue
+            for ngram in query_ngrams:
+                for key in self._postings.get((length, ngram), ()):
+                    hits[key] = hits.get(key, 0) + 1
+
+        # A contained name shares all of its trigrams with the containing one
+        candidates.extend(
+            key
+            for key, count in hits.items()
+            if count >= min(len(query_ngrams), self._ngram_counts[key])
+        )
+
+        similar: Dict[str, float] = {}
+        for key in candidates:
+            other = self._lower_names[key]
+            if other == query or (query not in other and other not in query):
+                continue
+            similarity = min(len(query), len(other)) / max(len(query), len(other))
+            if similarity > self.min_similarity:
+                similar.setdefault(self._names[key], similarity)
+
+        return sorted(similar.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def _candidate_lengths(self, length: int) -> range:
+        """Lengths whose ratio to the given length can exceed the threshold."""
+        shortest = math.floor(length * self.min_similarity) + 1
+        longest = math.ceil(length / self.min_similarity)
+        return range(shortest, longest + 1)
+
+    @classmethod
+    def _ngrams(cls, text: str) -> Set[str]:
+        """Split text into its distinct character trigrams."""
+        return {
+            text[i : i + cls.NGRAM_SIZE] for i in range(len(text) - cls.NGRAM_SIZE + 1)
+        }
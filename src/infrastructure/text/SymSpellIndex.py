@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete spelling index for fuzzy word lookups.
+
+    Every indexed word is stored under each variant of its prefix with up to
+    ``max_distance`` characters deleted. A lookup generates the same deletes
+    for the query, so only words sharing a delete are compared instead of the
+    whole vocabulary.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str] = (),
+        max_distance: int = 2,
+        prefix_length: int = 7,
+    ):
+        """
+        Build the index.
+
+        :param words: Initial vocabulary.
+        :param max_distance: Largest edit distance a lookup can return.
+        :param prefix_length: Number of leading characters used for the deletes.
+        """
+        if max_distance < 0:
+            raise ValueError("Maximum edit distance cannot be negative.")
+        if prefix_length <= max_distance:
+            raise ValueError("Prefix length must be greater than the edit distance.")
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._words: Set[str] = set()
+        self._deletes: Dict[str, List[str]] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._words
+
+    def add(self, word: str) -> bool:
+        """
+        Add a word to the index.
+
+        :param word: Word to index.
+        :return: True if the word was not indexed before.
+        """
+        if not word or word in self._words:
+            return False
+        self._words.add(word)
+        for delete in self._generate_deletes(word[: self.prefix_length]):
+            self._deletes.setdefault(delete, []).append(word)
+        return True
+
+    def lookup(
+        self, word: str, max_distance: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Find indexed words within an edit distance of the given word.
+
+        :param word: Word to look up.
+        :param max_distance: Largest edit distance, defaults to the index maximum.
+        :return: List of (word, distance) tuples, closest first.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        matches = []
+        for candidate in self.candidates(word, max_distance):
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            distance = self.edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((candidate, distance))
+
+        return sorted(matches, key=lambda match: (match[1], match[0]))
+
+    def candidates(self, word: str, max_distance: Optional[int] = None) -> Set[str]:
+        """
+        Collect indexed words sharing a prefix delete with the given word.
+
+        Every word within ``max_distance`` is included, but so are some farther
+        words, so callers must verify the distance.
+
+        :param word: Word to look up.
+        :param max_distance: Largest edit distance, defaults to the index maximum.
+        :return: Set of candidate words.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        candidates: Set[str] = set()
+        prefix = word[: self.prefix_length]
+        for delete in self._generate_deletes(prefix, max_distance):
+            candidates.update(self._deletes.get(delete, ()))
+        return candidates
+
+    def _generate_deletes(
+        self, word: str, max_distance: Optional[int] = None
+    ) -> Set[str]:
+        """Return the word and every variant with up to max_distance deletions."""
+        if max_distance is None:
+            max_distance = self.max_distance
+        deletes = {word}
+        frontier = {word}
+        for _ in range(max_distance):
+            frontier = {
+                variant[:i] + variant[i + 1 :]
+                for variant in frontier
+                for i in range(len(variant))
+            }
+            deletes.update(frontier)
+        return deletes
+
+    @staticmethod
+    def edit_distance(source: str, target: str, max_distance: int) -> int:
+        """
+        Levenshtein distance that gives up once it exceeds max_distance.
+
+        :return: The distance, or max_distance + 1 if it is larger.
+        """
+        # Shared prefixes and suffixes never add to the distance
+        start = 0
+        shortest = min(len(source), len(target))
+        while start < shortest and source[start] == target[start]:
+            start += 1
+        end = 0
+        while (
+            end < shortest - start
+            and source[len(source) - 1 - end] == target[len(target) - 1 - end]
+        ):
+            end += 1
+        source = source[start : len(source) - end]
+        target = target[start : len(target) - end]
+        if not source or not target:
+            return min(len(source) + len(target), max_distance + 1)
+
+        previous = list(range(len(target) + 1))
+        for i, source_char in enumerate(source, 1):
+            current = [i]
+            row_minimum = i
+            for j, target_char in enumerate(target, 1):
+                cost = previous[j - 1] + (source_char != target_char)
+                if previous[j] + 1 < cost:
+                    cost = previous[j] + 1
+                if current[j - 1] + 1 < cost:
+                    cost = current[j - 1] + 1
+                if cost < row_minimum:
+                    row_minimum = cost
+                current.append(cost)
+            if row_minimum > max_distance:
+                return max_distance + 1
+            previous = current
+        return min(previous[-1], max_distance + 1)
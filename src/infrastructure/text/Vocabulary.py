@@ -0,0 +1,190 @@
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.infrastructure.text.BatchEditDistanceScorer import BatchEditDistanceScorer
+from src.infrastructure.text.SymSpellIndex import SymSpellIndex
+
+# Candidate search backends: a symmetric-delete index or bucket-wide scoring
+SYMSPELL_BACKEND = "symspell"
+BATCH_BACKEND = "batch"
+
+# Letters that do not decompose into a base letter and a combining mark
+FOLDED_LETTERS = str.maketrans("łŁđĐøØ", "lLdDoO")
+
+
+class Vocabulary:
+    """
+    Correct words known to the suggestion engine, with ranking data.
+
+    Each word keeps a frequency, a bucket by length, a character signature and
+    an entry under its diacritic-free spelling. Everything is updated in place
+    when a word is added, so lookups never rebuild any structure.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str] = (),
+        max_distance: int = 2,
+        backend: str = SYMSPELL_BACKEND,
+    ):
+        """
+        Create the vocabulary.
+
+        :param words: Initial words, each counted once.
+        :param max_distance: Largest edit distance a lookup can return.
+        :param backend: ``"symspell"`` for the delete index, or ``"batch"`` to
+            score whole length buckets at once (vectorized when NumPy is installed).
+        :raises ValueError: If the backend is unknown.
+        """
+        if backend not in (SYMSPELL_BACKEND, BATCH_BACKEND):
+            raise ValueError(f"Unknown vocabulary backend: {backend}")
+        self.max_distance = max_distance
+        self.backend = backend
+        self._index: Optional[SymSpellIndex] = None
+        self._scorer: Optional[BatchEditDistanceScorer] = None
+        if backend == BATCH_BACKEND:
+            self._scorer = BatchEditDistanceScorer(max_distance=max_distance)
+        else:
+            self._index = SymSpellIndex(max_distance=max_distance)
+        self._frequencies: Dict[str, int] = {}
+        self._length_buckets: Dict[int, Set[str]] = {}
+        self._signatures: Dict[str, int] = {}
+        self._folded: Dict[str, Set[str]] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._frequencies)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._frequencies
+
+    def add(self, word: str, count: int = 1) -> None:
+        """
+        Add a word or increase its frequency.
+
+        :param word: Word to add.
+        :param count: How many occurrences to record.
+        """
+        if not word:
+            return
+        if word in self._frequencies:
+            self._frequencies[word] += count
+            return
+        self._frequencies[word] = count
+        self._length_buckets.setdefault(len(word), set()).add(word)
+        self._signatures[word] = self.signature(word)
+        self._folded.setdefault(self.fold_diacritics(word), set()).add(word)
+        if self._index is not None:
+            self._index.add(word)
+        if self._scorer is not None:
+            self._scorer.add(word)
+
+    def frequency(self, word: str) -> int:
+        """
+        Get how often a word was added.
+
+        :param word: Word to check.
+        :return: The frequency, 0 for unknown words.
+        """
+        return self._frequencies.get(word, 0)
+
+    def words_of_length(self, length: int) -> Set[str]:
+        """
+        Get the words with the given length.
+
+        :param length: Word length.
+        :return: Set of words, empty if there are none.
+        """
+        return self._length_buckets.get(length, set())
+
+    def diacritic_variants(self, word: str) -> List[str]:
+        """
+        Find accented spellings of a word typed without diacritics.
+
+        Only missing diacritics are restored: an accented word is never
+        matched to its plain spelling, even when that spelling is known too.
+
+        :param word: Word to look up.
+        :return: Known words that add diacritics to the word, most frequent
+            first; empty if the word already carries diacritics.
+        """
+        folded = self.fold_diacritics(word)
+        if word != folded:
+            return []
+        variants = self._folded.get(folded)
+        if not variants:
+            return []
+        return sorted(
+            (variant for variant in variants if variant != folded),
+            key=lambda variant: (-self._frequencies[variant], variant),
+        )
+
+    def lookup(
+        self, word: str, max_distance: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Find words within an edit distance of the given word.
+
+        :param word: Word to look up.
+        :param max_distance: Largest edit distance, defaults to the vocabulary maximum.
+        :return: List of (word, distance) tuples, closest first.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        if self._index is None:
+            assert self._scorer is not None
+            return self._scorer.lookup(word, max_distance)
+
+        length = len(word)
+        if not any(
+            distance_length in self._length_buckets
+            for distance_length in range(
+                length - max_distance, length + max_distance + 1
+            )
+        ):
+            return []
+
+        # Each edit flips at most two signature bits
+        signature = self.signature(word)
+        max_flipped_bits = 2 * max_distance
+
+        matches = []
+        for candidate in self._index.candidates(word, max_distance):
+            if abs(len(candidate) - length) > max_distance:
+                continue
+            if (
+                bin(self._signatures[candidate] ^ signature).count("1")
+                > max_flipped_bits
+            ):
+                continue
+            distance = SymSpellIndex.edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((candidate, distance))
+
+        return sorted(matches, key=lambda match: (match[1], match[0]))
+
+    @staticmethod
+    def fold_diacritics(word: str) -> str:
+        """
+        Strip diacritics, e.g. "żółć" becomes "zolc".
+
+        :param word: Word to fold.
+        :return: The word without diacritics.
+        """
+        decomposed = unicodedata.normalize("NFKD", word.translate(FOLDED_LETTERS))
+        return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    @staticmethod
+    def signature(word: str) -> int:
+        """
+        Compute a bit set of the characters occurring in a word.
+
+        :param word: Word to summarize.
+        :return: 64-bit character signature.
+        """
+        signature = 0
+        for char in word:
+            signature |= 1 << (ord(char) % 64)
+        return signature
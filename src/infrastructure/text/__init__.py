@@ -0,0 +1 @@
+"""Infrastructure text indexes for fast name lookups."""
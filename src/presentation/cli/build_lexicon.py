@@ -0,0 +1,104 @@
+"""
+Compile a word list into a memory-mapped lexicon.
+
+Each input line is either a correct word or ``typo<TAB>correction``. Correct
+words with diacritics also get their diacritic-free spelling as a typo entry,
+unless that spelling is listed itself.
+
+Usage: python -m src.presentation.cli.build_lexicon words.tsv -o data/polish_lexicon.lex
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from src.infrastructure.text.MappedLexicon import MappedLexicon
+from src.infrastructure.text.Vocabulary import Vocabulary
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    :param argv: Arguments to parse, defaults to sys.argv.
+    :return: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compile a word list into a memory-mapped lexicon."
+    )
+    parser.add_argument(
+        "input", help="Words, or typo<TAB>correction pairs, one per line, - for stdin"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="data/polish_lexicon.lex",
+        help="Lexicon file to write (default: data/polish_lexicon.lex)",
+    )
+    parser.add_argument(
+        "--no-fold-diacritics",
+        action="store_true",
+        help="Do not add diacritic-free spellings of correct words",
+    )
+    return parser.parse_args(argv)
+
+
+def read_entries(stream: TextIO) -> Iterator[Tuple[str, str]]:
+    """
+    Yield lexicon entries from a word list.
+
+    :param stream: Stream with one word or tab-separated pair per line.
+    :yield: (word, correction) tuples, the correction is empty for correct words.
+    """
+    for line in stream:
+        fields = line.rstrip("\n").split("\t")
+        word = fields[0].strip().lower()
+        correction = fields[1].strip().lower() if len(fields) > 1 else ""
+        if word:
+            yield word, correction
+
+
+def with_folded_spellings(entries: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Add the diacritic-free spelling of every correct word as a correction.
+
+    :param entries: (word, correction) tuples.
+    :return: Mapping of words to corrections including the folded spellings.
+    """
+    table = dict(entries)
+    for word, correction in list(table.items()):
+        if not correction:
+            table.setdefault(Vocabulary.fold_diacritics(word), word)
+    return table
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Build the lexicon and report how long it took on stderr.
+
+    :param argv: Command-line arguments.
+    :return: Process exit code.
+    """
+    args = parse_args(argv)
+    start = time.perf_counter()
+
+    if args.input == "-":
+        entries = dict(read_entries(sys.stdin))
+    else:
+        with open(args.input, encoding="utf-8") as source:
+            entries = dict(read_entries(source))
+    if not args.no_fold_diacritics:
+        entries = with_folded_spellings(entries.items())
+    count = MappedLexicon.build(args.output, entries.items())
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"✅ Wrote {count} entries to {args.output} in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
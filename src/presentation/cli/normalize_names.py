@@ -0,0 +1,100 @@
+"""
+Normalize a file of product names to JSON Lines.
+
+Usage: python -m src.presentation.cli.normalize_names names.txt -o names.jsonl -w 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Iterator, List, Optional, TextIO
+
+from src.infrastructure.services.ProductNameNormalizationService import (
+    ProductNameNormalizationService,
+)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    :param argv: Arguments to parse, defaults to sys.argv.
+    :return: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Normalize product names, one per line, to JSON Lines."
+    )
+    parser.add_argument(
+        "input", help="File with one product name per line, - for stdin"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="JSONL output file, - for stdout"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "-b", "--batch-size", type=int, default=1000, help="Names sent per batch"
+    )
+    return parser.parse_args(argv)
+
+
+def read_names(stream: TextIO) -> Iterator[str]:
+    """
+    Yield non-empty names from a text stream.
+
+    :param stream: Stream with one name per line.
+    :yield: Product names.
+    """
+    for line in stream:
+        name = line.rstrip("\n")
+        if name.strip():
+            yield name
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the normalization and report throughput on stderr.
+
+    :param argv: Command-line arguments.
+    :return: Process exit code.
+    """
+    args = parse_args(argv)
+    service = ProductNameNormalizationService()
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = (
+        sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    )
+
+    count = 0
+    start = time.perf_counter()
+    try:
+        for result in service.normalize_names(
+            read_names(source), workers=args.workers, batch_size=args.batch_size
+        ):
+            target.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(
+        f"✅ Normalized {count} names in {elapsed:.2f}s ({rate:,.0f} names/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.domain.Product_Entity import _Product
+from src.presentation.controllers.ProductController import ProductController
+
+
+class AsyncProductController:
+    """
+    Run ProductController calls on a worker thread and return futures.
+
+    Calls run one at a time in submission order, so a query submitted after a
+    mutation sees its result and the wrapped controller never serves two
+    threads at once.
+    """
+
+    def __init__(
+        self, product_controller: ProductController, executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the facade.
+
+        :param product_controller: The controller whose calls are offloaded.
+        :param executor: Executor running the calls. Defaults to a single thread,
+            which keeps calls ordered; pass a custom one only if it does too.
+        """
+        self.product_controller = product_controller
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="product-controller"
+        )
+
+    @property
+    def executor(self) -> Executor:
+        """
+        Executor shared by every call, for other work that must stay ordered.
+
+        :return: The executor.
+        """
+        return self._executor
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Run any callable in the controller's call order.
+
+        :param func: Callable to run on the worker thread; must not touch Tk.
+        :return: Future of the callable's result.
+        """
+        return self._executor.submit(func, *args, **kwargs)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop accepting calls and drop the ones that have not started.
+
+        :param wait: Whether to wait for the running call to finish.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_all_products(self) -> "Future[list[_Product]]":
+        """
+        :return: Future of all products.
+        """
+        return self.submit(self.product_controller.get_all_products)
+
+    def get_product_by_id(self, product_id: str) -> "Future[_Product]":
+        """
+        :param product_id: The ID of the product to retrieve.
+        :return: Future of the product.
+        """
+        return self.submit(self.product_controller.get_product_by_id, product_id)
+
+    def get_low_stock_products(self, threshold: int = 5) -> "Future[list[_Product]]":
+        """
+        :param threshold: Quantity threshold for low stock.
+        :return: Future of the products below the threshold.
+        """
+        return self.submit(self.product_controller.get_low_stock_products, threshold)
+
+    def add_product_with_ai(
+        self, name: str, quantity: int, purchased: bool = False
+    ) -> "Future[Tuple[_Product, Dict[str, Any]]]":
+        """
+        :param name: Product name (will be normalized).
+        :param quantity: Product quantity.
+        :param purchased: Purchase status.
+        :return: Future of the added product and the normalization info.
+        """
+        return self.submit(
+            self.product_controller.add_product_with_ai, name, quantity, purchased
+        )
+
+    def update_product(
+        self,
+        id: str,
+        name: str,
+        quantity: int,
+        purchased: bool,
+        version: Optional[int] = None,
+    ) -> "Future[_Product]":
+        """
+        :param id: The ID of the product to update.
+        :param name: The new name of the product.
+        :param quantity: The new quantity of the product.
+        :param purchased: The new purchase status of the product.
+        :param version: The product version the caller last saw (optional).
+        :return: Future of the updated product.
+        """
+        return self.submit(
+            self.product_controller.update_product,
+            id,
+            name,
+            quantity,
+            purchased,
+            version=version,
+        )
+
+    def remove_product(self, product_id: str) -> "Future[None]":
+        """
+        :param product_id: The ID of the product to remove.
+        :return: Future completed once the product is removed.
+        """
+        return self.submit(self.product_controller.remove_product, product_id)
+
+    def adjust_quantity(self, product_id: str, delta: int) -> "Future[_Product]":
+        """
+        :param product_id: The ID of the product to change.
+        :param delta: Amount added to the quantity (negative to decrease).
+        :return: Future of the updated product.
+        """
+        return self.submit(self.product_controller.adjust_quantity, product_id, delta)
+
+    def set_purchased(self, product_id: str, purchased: bool) -> "Future[_Product]":
+        """
+        :param product_id: The ID of the product to change.
+        :param purchased: The new purchase status.
+        :return: Future of the updated product.
+        """
+        return self.submit(self.product_controller.set_purchased, product_id, purchased)
+
+    def check_name_for_suggestions(self, name: str) -> "Future[Dict[str, Any]]":
+        """
+        :param name: Product name to check.
+        :return: Future of the suggestion analysis.
+        """
+        return self.submit(self.product_controller.check_name_for_suggestions, name)
+
+    def normalize_product_name(self, name: str) -> "Future[Dict[str, Any]]":
+        """
+        :param name: Product name to normalize.
+        :return: Future of the normalization info.
+        """
+        return self.submit(self.product_controller.normalize_product_name, name)
+
+    def add_learned_typo(self, typo: str, correct: str) -> "Future[None]":
+        """
+        :param typo: Incorrect word.
+        :param correct: Correct word.
+        :return: Future completed once the correction is learned.
+        """
+        return self.submit(self.product_controller.add_learned_typo, typo, correct)
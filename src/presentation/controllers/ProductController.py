@@ -1,9 +1,12 @@
 from src.application.usecases.AddProduct import AddProduct
+from src.application.usecases.AdjustProductQuantity import AdjustProductQuantity
 from src.application.usecases.GetAllProducts import GetAllProducts
 from src.application.usecases.GetProductById import GetProductById
 from src.application.usecases.RemoveProduct import RemoveProduct
+from src.application.usecases.SetProductPurchased import SetProductPurchased
 from src.application.usecases.UpdateProduct import UpdateProduct
 from src.application.repositories.IProductRepository import IProductRepository
+from src.application.repositories.UnitOfWork import UnitOfWork
 from src.application.dto.ProductDTO import ProductDTO
 from src.utils.errorHandlerDecorator import handle_exceptions
 from src.domain.Product_Entity import _Product
@@ -11,7 +14,9 @@ from src.infrastructure.InMemoryProductRepository import InMemoryProductReposito
 from src.infrastructure.services.ProductNameNormalizationService import (
     ProductNameNormalizationService,
 )
-from typing import Dict, List, Tuple, Any
+from src.infrastructure.text.SimilarityIndex import SimilarityIndex
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 
 
 class ProductController:
@@ -33,7 +38,49 @@ class ProductController:
         self.get_product_by_id_use_case = GetProductById(self.product_repository)
         self.remove_product_use_case = RemoveProduct(self.product_repository)
         self.update_product_use_case = UpdateProduct(self.product_repository)
+        self.adjust_quantity_use_case = AdjustProductQuantity(self.product_repository)
+        self.set_purchased_use_case = SetProductPurchased(self.product_repository)
         self.name_normalization_service = ProductNameNormalizationService()
+        # Built from the repository on first use, then kept in step with changes
+        self._similarity_index: Optional[SimilarityIndex] = None
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[UnitOfWork]:
+        """
+        Open a unit of work so several controller calls share one transaction.
+
+        :return: A context manager yielding the active UnitOfWork.
+        """
+        try:
+            with UnitOfWork(self.product_repository) as unit_of_work:
+                yield unit_of_work
+        except BaseException:
+            # The rollback may undo changes already applied to the index
+            self._similarity_index = None
+            raise
+
+    def _get_similarity_index(self) -> SimilarityIndex:
+        """
+        Get the similarity index, building it from the repository if needed.
+
+        :return: The similarity index of product names.
+        """
+        if self._similarity_index is None:
+            similarity_index = SimilarityIndex()
+            for product in self.get_all_products_use_case.execute():
+                similarity_index.add(product.id, product.name)
+            self._similarity_index = similarity_index
+        return self._similarity_index
+
+    def _index_product(self, product: _Product) -> None:
+        """Keep the similarity index in step with an added or updated product."""
+        if self._similarity_index is not None:
+            self._similarity_index.add(product.id, product.name)
+
+    def _unindex_product(self, product_id: str) -> None:
+        """Drop a removed product from the similarity index."""
+        if self._similarity_index is not None:
+            self._similarity_index.remove(product_id)
 
     @handle_exceptions
     def add_product(
@@ -48,7 +95,9 @@ class ProductController:
         :return: The added product.
         """
         product_dto = ProductDTO(name=name, quantity=quantity, purchased=purchased)
-        return self.add_product_use_case.execute(product_dto)
+        product = self.add_product_use_case.execute(product_dto)
+        self._index_product(product)
+        return product
 
     @handle_exceptions
     def get_all_products(self) -> list[_Product]:
@@ -145,10 +194,28 @@ class ProductController:
         :param product_id: The ID of the product to remove.
         """
         self.remove_product_use_case.execute(product_id)
+        self._unindex_product(product_id)
+
+    @handle_exceptions
+    def remove_products(self, product_ids: List[str]) -> None:
+        """
+        Remove several products in a single unit of work.
+
+        :param product_ids: The IDs of the products to remove.
+        """
+        with self.unit_of_work():
+            for product_id in product_ids:
+                self.remove_product_use_case.execute(product_id)
+                self._unindex_product(product_id)
 
     @handle_exceptions
     def update_product(
-        self, id: str, name: str, quantity: int, purchased: bool
+        self,
+        id: str,
+        name: str,
+        quantity: int,
+        purchased: bool,
+        version: Optional[int] = None,
     ) -> _Product:
         """
         Update an existing product.
@@ -157,12 +224,37 @@ class ProductController:
         :param name: The updated name of the product.
         :param quantity: The updated quantity of the product.
         :param purchased: The updated purchase status of the product.
+        :param version: The product version the caller last saw (optional).
         :return: The updated product.
         """
         product_dto = ProductDTO(
-            id=id, name=name, quantity=quantity, purchased=purchased
+            id=id, name=name, quantity=quantity, purchased=purchased, version=version
         )
-        return self.update_product_use_case.execute(product_dto)
+        product = self.update_product_use_case.execute(product_dto)
+        self._index_product(product)
+        return product
+
+    @handle_exceptions
+    def adjust_quantity(self, product_id: str, delta: int) -> _Product:
+        """
+        Increase or decrease a product's quantity without a read-modify-write.
+
+        :param product_id: The ID of the product to change.
+        :param delta: Amount added to the quantity (negative to decrease).
+        :return: The updated product.
+        """
+        return self.adjust_quantity_use_case.execute(product_id, delta)
+
+    @handle_exceptions
+    def set_purchased(self, product_id: str, purchased: bool) -> _Product:
+        """
+        Set a product's purchase status without a read-modify-write.
+
+        :param product_id: The ID of the product to change.
+        :param purchased: The new purchase status.
+        :return: The updated product.
+        """
+        return self.set_purchased_use_case.execute(product_id, purchased)
 
     # AI Name Normalization Methods
 
@@ -182,19 +274,33 @@ class ProductController:
         normalization_info = self.name_normalization_service.normalize_name(name)
         normalized_name = normalization_info["normalized"]
 
-        # Check for similar products
-        existing_products = self.get_all_products()
-        existing_names = [p.name for p in existing_products]
-        similar_products = self.name_normalization_service.find_similar_products(
-            normalized_name, existing_names
-        )
-        normalization_info["similar_products"] = similar_products
+        with self.unit_of_work():
+            # Check for similar products
+            normalization_info["similar_products"] = self.find_similar_products(
+                normalized_name
+            )
 
-        # Create product with normalized name
-        product = self.add_product(normalized_name, quantity, purchased)
+            # Create product with normalized name
+            product = self.add_product(normalized_name, quantity, purchased)
+
+        # Words of added products become suggestion candidates
+        self.name_normalization_service.learn_product_name(product.name)
 
         return product, normalization_info
 
+    @handle_exceptions
+    def find_similar_products(
+        self, name: str, limit: int = 3
+    ) -> List[Tuple[str, float]]:
+        """
+        Find existing products whose names contain or are contained in a name.
+
+        :param name: Product name to compare
+        :param limit: Maximum number of results
+        :return: List of (name, similarity) tuples
+        """
+        return self._get_similarity_index().find_similar(name, limit)
+
     @handle_exceptions
     def normalize_product_name(self, name: str) -> Dict[str, Any]:
         """
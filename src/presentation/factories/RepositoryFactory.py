@@ -99,7 +99,11 @@ class RepositoryFactory:
         if database_service is None:
             database_service = DatabaseService()
 
-        return PostgreSQLProductRepository(database_service)
+        direct_hydration = config.get("direct_hydration", True)
+
+        return PostgreSQLProductRepository(
+            database_service, direct_hydration=direct_hydration
+        )
 
     @staticmethod
     def create_repository_with_fallback() -> IProductRepository:
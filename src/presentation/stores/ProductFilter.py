@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from src.domain.Product_Entity import _Product
+
+
+@dataclass(frozen=True)
+class ProductFilter:
+    """
+    Criteria of the product list filters, evaluated on the client side.
+    """
+
+    search_term: str = ""
+    purchased: Optional[bool] = None
+    min_quantity: int = 0
+    max_quantity: Optional[int] = None
+
+    @classmethod
+    def low_stock(cls, threshold: int) -> "ProductFilter":
+        """
+        Build the filter behind "Show Low Stock".
+
+        :param threshold: Products with a quantity below it are low on stock.
+        :return: Filter matching the low stock products.
+        """
+        return cls(max_quantity=threshold - 1)
+
+    def matches(self, product: _Product) -> bool:
+        """
+        Check a single product against the criteria.
+
+        :param product: The product to check.
+        :return: True if the product passes every criterion.
+        """
+        if self.search_term and self.search_term.lower() not in product.name.lower():
+            return False
+        if self.purchased is not None and product.purchased != self.purchased:
+            return False
+        if product.quantity < self.min_quantity:
+            return False
+        if self.max_quantity is not None and product.quantity > self.max_quantity:
+            return False
+        return True
+
+    def narrows(self, previous: "ProductFilter") -> bool:
+        """
+        Check whether this filter only keeps products the previous one kept.
+
+        True for a longer search term containing the previous one, a status
+        where there was none, or a tighter quantity range, so the previous
+        result set can be re-filtered instead of every product.
+
+        :param previous: The filter applied before.
+        :return: True if the matches of this filter are a subset of the previous.
+        """
+        if previous.search_term.lower() not in self.search_term.lower():
+            return False
+        if previous.purchased is not None and self.purchased != previous.purchased:
+            return False
+        if self.min_quantity < previous.min_quantity:
+            return False
+        if previous.max_quantity is not None and (
+            self.max_quantity is None or self.max_quantity > previous.max_quantity
+        ):
+            return False
+        return True
+
+    def apply(self, products: Iterable[_Product]) -> List[_Product]:
+        """
+        Keep the matching products, preserving their order.
+
+        :param products: Products to filter.
+        :return: The matching products.
+        """
+        return [product for product in products if self.matches(product)]
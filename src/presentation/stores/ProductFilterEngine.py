@@ -0,0 +1,71 @@
+from typing import List, Optional
+
+from src.domain.Product_Entity import _Product
+from src.presentation.stores.ProductFilter import ProductFilter
+from src.presentation.stores.ProductStore import ProductStore
+
+
+class ProductFilterEngine:
+    """
+    Filter the stored products, refining the previous result when possible.
+
+    The engine remembers the last filter and its matches. A filter that
+    narrows the last one, such as "mle" extended to "mlek", is evaluated over
+    those matches only; any other filter, or any change to the store since,
+    falls back to every stored product.
+    """
+
+    def __init__(self, product_store: ProductStore):
+        """
+        Initialize the engine.
+
+        :param product_store: Store holding the products to filter.
+        """
+        self.product_store = product_store
+        self._last_filter: Optional[ProductFilter] = None
+        self._last_matches: List[_Product] = []
+        self._last_revision = -1
+
+    def candidates(self, product_filter: ProductFilter) -> List[_Product]:
+        """
+        Return the smallest product list known to contain every match.
+
+        :param product_filter: The filter about to be applied.
+        :return: The previous matches if the filter narrows them, else all products.
+        """
+        if (
+            self._last_filter is not None
+            and self._last_revision == self.product_store.revision
+            and product_filter.narrows(self._last_filter)
+        ):
+            return self._last_matches
+        return self.product_store.all()
+
+    def remember(
+        self, product_filter: ProductFilter, matches: List[_Product], revision: int
+    ) -> None:
+        """
+        Record a result so the next narrowing filter can start from it.
+
+        :param product_filter: The filter that was applied.
+        :param matches: Its matches.
+        :param revision: Store revision the candidates were taken at; results
+            from an older revision are not kept.
+        """
+        if revision != self.product_store.revision:
+            return
+        self._last_filter = product_filter
+        self._last_matches = matches
+        self._last_revision = revision
+
+    def apply(self, product_filter: ProductFilter) -> List[_Product]:
+        """
+        Filter the stored products right away.
+
+        :param product_filter: The filter to apply.
+        :return: The matching products in store order.
+        """
+        revision = self.product_store.revision
+        matches = product_filter.apply(self.candidates(product_filter))
+        self.remember(product_filter, matches, revision)
+        return matches
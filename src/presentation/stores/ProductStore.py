@@ -0,0 +1,120 @@
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.domain.Product_Entity import _Product
+
+ProductListener = Callable[[_Product], None]
+ResetListener = Callable[[List[_Product]], None]
+
+
+class ProductStore:
+    """
+    Client-side cache of the product set with change events.
+
+    The store keeps its own snapshot of every product, in repository order,
+    and is updated from the results of controller calls instead of being
+    re-fetched. Views subscribe to fine-grained "added", "updated" and
+    "removed" events, plus "reset" when the whole set is reloaded.
+    """
+
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+    RESET = "reset"
+    EVENTS = (ADDED, UPDATED, REMOVED, RESET)
+
+    def __init__(self) -> None:
+        self._products: Dict[Optional[str], _Product] = {}
+        self._revision = 0
+        self._listeners: Dict[str, List[Callable]] = {
+            event: [] for event in self.EVENTS
+        }
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product_id: object) -> bool:
+        return product_id in self._products
+
+    @property
+    def revision(self) -> int:
+        """
+        Counter bumped on every change, so derived results can tell they are stale.
+
+        :return: The current revision.
+        """
+        return self._revision
+
+    def subscribe(self, event: str, listener: Callable) -> Callable[[], None]:
+        """
+        Register a listener for an event.
+
+        :param event: One of "added", "updated", "removed" or "reset".
+        :param listener: Called with the product, or with all products on reset.
+        :return: Function that removes the listener again.
+        :raises ValueError: If the event is unknown.
+        """
+        if event not in self._listeners:
+            raise ValueError(f"Unknown product store event: {event}")
+        self._listeners[event].append(listener)
+        return lambda: self._listeners[event].remove(listener)
+
+    def get(self, product_id: str) -> Optional[_Product]:
+        """
+        :param product_id: The ID of the product.
+        :return: The cached product, or None if it is not in the store.
+        """
+        return self._products.get(product_id)
+
+    def all(self) -> List[_Product]:
+        """
+        :return: All cached products in repository order.
+        """
+        return list(self._products.values())
+
+    def load(self, products: Iterable[_Product]) -> None:
+        """
+        Replace the cached set with a fresh repository read.
+
+        :param products: Every product, in repository order.
+        """
+        self._products = {product.id: self._snapshot(product) for product in products}
+        self._revision += 1
+        self._emit(self.RESET, self.all())
+
+    def upsert(self, product: _Product) -> None:
+        """
+        Apply an added or changed product returned by the controller.
+
+        Emits "added" for new products and "updated" for known products whose
+        version changed; re-applying the same version is a no-op.
+
+        :param product: The product as returned by the controller.
+        """
+        cached = self._products.get(product.id)
+        if cached is not None and cached.version == product.version:
+            return
+        snapshot = self._snapshot(product)
+        self._products[product.id] = snapshot
+        self._revision += 1
+        self._emit(self.ADDED if cached is None else self.UPDATED, snapshot)
+
+    def remove(self, product_id: str) -> None:
+        """
+        Apply a removal confirmed by the controller.
+
+        :param product_id: The ID of the removed product.
+        """
+        removed = self._products.pop(product_id, None)
+        if removed is not None:
+            self._revision += 1
+            self._emit(self.REMOVED, removed)
+
+    @staticmethod
+    def _snapshot(product: _Product) -> _Product:
+        # Repositories may hand out the instances they keep and mutate later
+        return replace(product)
+
+    def _emit(self, event: str, payload) -> None:
+        for listener in list(self._listeners[event]):
+            listener(payload)
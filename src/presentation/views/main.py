@@ -38,9 +38,17 @@ class MainApp(ctk.CTk):
         self.product_controller = ProductController(self.product_repository)
 
         self.app = TkinterApp(self, self.product_controller)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.center_window()
 
+    def on_close(self):
+        """
+        Stop background work and close the window.
+        """
+        self.app.shutdown()
+        self.destroy()
+
     def center_window(self):
         """
         Center the window on the screen.
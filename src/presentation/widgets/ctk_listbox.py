@@ -3,10 +3,19 @@ Custom ListBox for customtkinter
 Author: Akash Bora
 url: https://github.com/Akascape/CTkListbox
 Tutaj musiał wlecieć source code tego CtkListBox, ponieważ nie posiadało jednej funckjonalności m.in odznacznie wszystkich elementów w liscie
+
+The main window lists products with CTkVirtualListbox; this widget, with one
+button per row, is kept for small standalone lists.
 """
 
 import customtkinter  # type: ignore
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, Callable, Iterable, List, Dict, Hashable, Set
+
+from src.presentation.widgets.listbox_model import Index, ListboxModel
+from src.presentation.widgets.widget_pool import WidgetPool
+
+# Tk's grid geometry manager rejects row indexes above this
+MAX_GRID_ROW = 9999
 
 
 class CTkListbox(customtkinter.CTkScrollableFrame):
@@ -28,6 +37,8 @@ class CTkListbox(customtkinter.CTkScrollableFrame):
         hover: bool = True,
         command=None,
         justify="left",
+        spare_rows: int = 20,
+        spare_trim_ms: int = 5000,
         **kwargs,
     ):
         super().__init__(
@@ -80,14 +91,19 @@ class CTkListbox(customtkinter.CTkScrollableFrame):
             self.justify = "e"
         else:
             self.justify = "c"
-        self.buttons: Dict = {}
+        # Row order, positions and selection live in the model; buttons by row key
+        self.model = ListboxModel(multiple=multiple_selection)
+        self.buttons: Dict[Hashable, Any] = {}
+        # Next free grid row; rows only grow between renumberings, so appending
+        # never has to move other rows
+        self._next_grid_row = 0
         self.command = command
-        self.multiple = multiple_selection
-        self.selected = None
         self.hover = hover
-        self.end_num = 0
-        self.selections: List = []
-        self.selected_index = 0
+        self._insert_job = None
+        # Deleted row buttons are hidden and reused by later inserts
+        self._spare_buttons = WidgetPool(self, keep=spare_rows, trim_ms=spare_trim_ms)
+        # Rows whose buttons got extra options; those are destroyed, not reused
+        self._custom_keys: Set[Hashable] = set()
         self._scrollbar.configure(height=height)
         self.columnconfigure(0, weight=1)
 
@@ -102,68 +118,49 @@ class CTkListbox(customtkinter.CTkScrollableFrame):
         for i in values:
             self.insert("END", option=i)
 
-    def select(self, index):
-        """select the option"""
-        for options in self.buttons.values():
-            options.configure(fg_color=self.button_fg_color)
+    @property
+    def multiple(self) -> bool:
+        return self.model.multiple
 
-        if isinstance(index, int):
-            if index in self.buttons:
-                selected_button = self.buttons[index]
-            else:
-                selected_button = list(self.buttons.values())[index]
-        else:
-            selected_button = self.buttons[index]
-
-        if self.multiple:
-            if selected_button in self.selections:
-                self.selections.remove(selected_button)
-                selected_button.configure(fg_color=self.button_fg_color, hover=False)
-                self.after(100, lambda: selected_button.configure(hover=self.hover))
-            else:
-                self.selections.append(selected_button)
-            for i in self.selections:
-                i.configure(fg_color=self.select_color, hover=False)
-                self.after(100, lambda button=i: button.configure(hover=self.hover))
-        else:
-            self.selected = selected_button
-            selected_button.configure(fg_color=self.select_color, hover=False)
-            self.after(100, lambda: selected_button.configure(hover=self.hover))
+    @multiple.setter
+    def multiple(self, value: bool):
+        self.model.multiple = value
 
-        if self.command:
-            self.command(self.get())
+    @property
+    def selected(self):
+        """button of the selected option in single selection mode"""
+        indexes = self.model.selected_indices()
+        return self._button(indexes[0]) if indexes else None
 
-        self.event_generate("<<ListboxSelect>>")
+    @property
+    def selections(self) -> List:
+        """buttons of the selected options, in display order"""
+        return [self._button(i) for i in self.model.selected_indices()]
 
-    def activate(self, index):
+    def select(self, index: Index):
+        """select the option"""
+        position = self.model.normalize_index(index)
+        # Only the rows whose selection state flipped are recoloured
+        self._recolor(self.model.select(position))
+        selected_button = self._button(position)
+        selected_button.configure(hover=False)
+        self.after(100, lambda: selected_button.configure(hover=self.hover))
+        self._notify()
+
+    def activate(self, index: Index):
         if str(index).lower() == "all":
-            if self.multiple:
-                for i in self.buttons:
-                    self.select(i)
+            if self.multiple and self.model.size():
+                self._recolor(self.model.select_range(0, "end"))
+                self._notify()
             return
 
-        if str(index).lower() == "end":
-            index = -1
-
-        selected = list(self.buttons.keys())[index]
-        self.select(selected)
+        self.select(index)
 
     def curselection(self):
-        index = 0
+        indexes = self.model.selected_indices()
         if self.multiple:
-            indexes = []
-            for i in self.buttons.values():
-                if i in self.selections:
-                    indexes.append(index)
-                index += 1
             return tuple(indexes)
-
-        else:
-            for i in self.buttons.values():
-                if i == self.selected:
-                    return index
-                else:
-                    index += 1
+        return indexes[0] if indexes else None
 
     def bind(self, key, func, add="+"):
         super().bind(key, lambda e: func(e), add=add)
@@ -175,169 +172,270 @@ class CTkListbox(customtkinter.CTkScrollableFrame):
         self._parent_frame.unbind(key)
         self._parent_canvas.unbind(key)
 
-    def deselect(self, index):
+    def deselect(self, index: Index):
         if not self.multiple:
-            if self.selected:
-                self.selected.configure(fg_color=self.button_fg_color)
-                self.selected = None
-                return
-        if self.buttons[index] in self.selections:
-            self.selections.remove(self.buttons[index])
-            self.buttons[index].configure(fg_color=self.button_fg_color)
+            self.deselect_all()
+            return
+        self._recolor(self.model.deselect(index))
 
     def deselect_all(self):
         """Deselect all options in the listbox"""
-        if self.multiple:
-            for button in self.selections:
-                button.configure(fg_color=self.button_fg_color)
-            self.selections.clear()
-        else:
-            if self.selected:
-                self.selected.configure(fg_color=self.button_fg_color)
-                self.selected = None
+        for position in self.model.deselect_all():
+            self._button(position).configure(fg_color=self.button_fg_color)
 
-    def deactivate(self, index):
+    def deactivate(self, index: Index):
         if str(index).lower() == "all":
-            if self.multiple:
-                for i in self.buttons:
-                    self.deselect(i)
-            else:
-                self.deselect(0)
+            self.deselect_all()
             return
 
-        if str(index).lower() == "end":
-            index = -1
-
-        selected = list(self.buttons.keys())[index]
-        self.deselect(selected)
-
-    def insert(self, index, option, update=True, **args):
-        """add new option in the listbox"""
-
-        if str(index).lower() == "end":
-            index = f"END{self.end_num}"
-            self.end_num += 1
-
-        if index in self.buttons:
-            self.buttons[index].destroy()
+        self.deselect(index)
 
-        self.buttons[index] = customtkinter.CTkButton(
-            self,
-            text=option,
-            fg_color=self.button_fg_color,
-            anchor=self.justify,
-            text_color=self.text_color,
-            font=self.font,
-            hover_color=self.hover_color,
-            **args,
-        )
-        self.buttons[index].configure(command=lambda num=index: self.select(num))
-
-        if type(index) is int:
-            self.buttons[index].grid(
-                padx=0, pady=(0, 5), sticky="nsew", column=0, row=index
+    def insert(
+        self,
+        index: Index,
+        option,
+        update=True,
+        key: Optional[Hashable] = None,
+        **args,
+    ):
+        """add new option at a position (or "end"), returning its row key
+
+        ``key`` identifies the row, e.g. by a product id; a fresh key is
+        generated when it is omitted.
+        """
+        position = self.model.normalize_index(index, allow_end=True)
+        key = self.model.insert(position, option, key=key)
+
+        # Spares only fit rows without extra button options
+        button = None if args else self._spare_buttons.take()
+        if button is not None:
+            # Styles may have been reconfigured while the button was parked
+            button.configure(
+                text=option,
+                fg_color=self.button_fg_color,
+                anchor=self.justify,
+                text_color=self.text_color,
+                font=self.font,
+                hover_color=self.hover_color,
+                hover=self.hover,
             )
         else:
-            self.buttons[index].grid(padx=0, pady=(0, 5), sticky="nsew", column=0)
+            button = customtkinter.CTkButton(
+                self,
+                text=option,
+                fg_color=self.button_fg_color,
+                anchor=self.justify,
+                text_color=self.text_color,
+                font=self.font,
+                hover_color=self.hover_color,
+                **args,
+            )
+        button.configure(command=lambda: self._on_click(key))
+        self.buttons[key] = button
+        if args:
+            self._custom_keys.add(key)
+        # The new row and the rows below it move further down the grid
+        self._grid_from(position)
 
         if update:
             self.update()
 
         if self.multiple:
-            self.buttons[index].bind(
-                "<Shift-1>", lambda e: self.select_multiple(self.buttons[index])
-            )
+            button.bind("<Shift-1>", lambda e: self._on_shift_click(key))
 
-        return self.buttons[index]
+        return key
 
-    def select_multiple(self, button):
-        selections = list(self.buttons.values())
-        if len(self.selections) > 0:
-            last = selections.index(self.selections[-1])
-            to = selections.index(button)
+    def insert_many(
+        self,
+        options: Iterable[str],
+        chunk_size: Optional[int] = None,
+        delay: int = 1,
+        callback: Optional[Callable[[], None]] = None,
+        **args,
+    ):
+        """add many options at the end with a single layout pass
+
+        With ``chunk_size`` the rows are inserted ``chunk_size`` at a time from
+        ``after`` callbacks, so the window keeps handling events while a long
+        list streams in. ``callback`` runs once the last row is inserted.
+        """
+        options = list(options)
+        self._cancel_insert_job()
+        if not chunk_size or len(options) <= chunk_size:
+            self._insert_batch(options, **args)
+            if callback:
+                callback()
+            return
 
-            if last < to:
-                for i in range(last + 1, to + 1):
-                    if list(self.buttons.values())[i] not in self.selections:
-                        self.select(i)
+        def insert_chunk(start):
+            self._insert_batch(options[start : start + chunk_size], **args)
+            if start + chunk_size < len(options):
+                self._insert_job = self.after(delay, insert_chunk, start + chunk_size)
             else:
-                for i in range(to, last):
-                    if list(self.buttons.values())[i] not in self.selections:
-                        self.select(i)
+                self._insert_job = None
+                if callback:
+                    callback()
+
+        insert_chunk(0)
+
+    def replace_all(
+        self,
+        options: Iterable[str],
+        chunk_size: Optional[int] = None,
+        delay: int = 1,
+        callback: Optional[Callable[[], None]] = None,
+        **args,
+    ):
+        """replace every option in the listbox, see insert_many"""
+        self.delete("all")
+        self.insert_many(
+            options, chunk_size=chunk_size, delay=delay, callback=callback, **args
+        )
+
+    def _insert_batch(self, options: List[str], **args):
+        # Rows are gridded with propagation off so Tk lays the frame out once
+        self.grid_propagate(False)
+        try:
+            for option in options:
+                self.insert("END", option, update=False, **args)
+        finally:
+            self.grid_propagate(True)
+        self.update_idletasks()
+
+    def _cancel_insert_job(self):
+        if self._insert_job is not None:
+            self.after_cancel(self._insert_job)
+            self._insert_job = None
+
+    def select_multiple(self, index: Index):
+        """extend the selection from the last selected option to ``index``"""
+        anchor = self.model.anchor
+        if anchor is None:
+            self.select(index)
+            return
+        self._recolor(self.model.select_range(anchor, index))
+        self._notify()
+
+    def _on_click(self, key: Hashable):
+        position = self.model.index_of(key)
+        if position is not None:
+            self.select(position)
+
+    def _on_shift_click(self, key: Hashable):
+        position = self.model.index_of(key)
+        if position is not None:
+            self.select_multiple(position)
+
+    def _notify(self):
+        if self.command:
+            self.command(self.get())
+
+        self.event_generate("<<ListboxSelect>>")
+
+    def _button(self, position: int):
+        return self.buttons[self.model.key(position)]
+
+    def _recolor(self, positions: Iterable[int]):
+        for position in positions:
+            self._button(position).configure(
+                fg_color=(
+                    self.select_color
+                    if self.model.is_selected(position)
+                    else self.button_fg_color
+                )
+            )
 
     def destroy(self):
-        for i in self.buttons:
-            self.buttons[i].destroy()
+        self._cancel_insert_job()
+        self._spare_buttons.clear()
+        for button in self.buttons.values():
+            button.destroy()
         self._scrollbar.destroy()
         super().destroy()
 
         self._parent_frame.destroy()
         self._parent_canvas.destroy()
 
-    def delete(self, index, last=None):
+    def delete(self, index: Index, last: Optional[Index] = None):
         """delete options from the listbox"""
         if str(index).lower() == "all":
-            self.deactivate("all")
-            for i in self.buttons:
-                self.buttons[i].destroy()
-                self.update()
-            self.buttons = {}
-            self.end_num = 0
+            self._cancel_insert_job()
+            self._remove_buttons(list(self.buttons))
+            self.model.clear()
+            self._next_grid_row = 0
+            self.update_idletasks()
             return
 
-        if str(index).lower() == "end":
-            self.end_num -= 1
-            if len(self.buttons.keys()) > 0:
-                index = list(self.buttons.keys())[-1]
-            if index not in self.buttons:
-                return
-        else:
-            if int(index) >= len(self.buttons):
-                return
-            if not last:
-                index = list(self.buttons.keys())[int(index)]
-
-        if last:
-            if str(last).lower() == "end":
-                last = len(self.buttons) - 1
-            elif int(last) >= len(self.buttons):
-                last = len(self.buttons) - 1
-
-            deleted_list = []
-            for i in range(int(index), int(last) + 1):
-                list(self.buttons.values())[i].destroy()
-                deleted_list.append(list(self.buttons.keys())[i])
-                self.update()
-            for i in deleted_list:
-                del self.buttons[i]
-        else:
-            self.buttons[index].destroy()
-            if self.multiple:
-                if self.buttons[index] in self.selections:
-                    self.selections.remove(self.buttons[index])
-            del self.buttons[index]
+        self._remove_buttons(self.model.delete(index, last))
+        if not self.model.size():
+            self._next_grid_row = 0
+        if last is not None:
+            self.update_idletasks()
+
+    def _grid_from(self, position: int):
+        if self._next_grid_row + self.model.size() - position > MAX_GRID_ROW + 1:
+            # Renumber every row from 0 so the indexes stay within Tk's limit
+            self._next_grid_row = 0
+            position = 0
+        for i in range(position, self.model.size()):
+            self._button(i).grid(
+                padx=0, pady=(0, 5), sticky="nsew", column=0, row=self._next_grid_row
+            )
+            self._next_grid_row += 1
+
+    def _remove_buttons(self, keys):
+        spares = []
+        for key in keys:
+            button = self.buttons.pop(key)
+            if key in self._custom_keys:
+                # Extra options would carry over to the row reusing the button
+                self._custom_keys.discard(key)
+                button.destroy()
+                continue
+            button.grid_forget()
+            # Drop the row's shift-click binding; commands are replaced on reuse
+            button.unbind("<Shift-1>")
+            spares.append(button)
+        if spares:
+            self._spare_buttons.release_many(spares)
+
+    def set_option(self, key: Hashable, option: str):
+        """replace the text of the row with ``key``, keeping its selection"""
+        self.model.set_text(self._position(key), option)
+        self.buttons[key].configure(text=option)
+
+    def delete_key(self, key: Hashable):
+        """delete the row with ``key``"""
+        self.delete(self._position(key))
+
+    def key(self, index: Index) -> Hashable:
+        """return the key of the row at ``index``"""
+        return self.model.key(index)
+
+    def index_of(self, key: Hashable) -> Optional[int]:
+        """return the position of the row with ``key``, or None"""
+        return self.model.index_of(key)
+
+    def _position(self, key: Hashable) -> int:
+        position = self.model.index_of(key)
+        if position is None:
+            raise KeyError(key)
+        return position
 
     def size(self):
         """return total number of items in the listbox"""
-        return len(self.buttons.keys())
+        return self.model.size()
 
-    def get(self, index=None):
+    def get(self, index: Optional[Index] = None):
         """get the selected value"""
         if index is not None:
             if str(index).lower() == "all":
-                return list(item.cget("text") for item in self.buttons.values())
-            else:
-                index = list(self.buttons.keys())[int(index)]
-                return self.buttons[index].cget("text")
-        else:
-            if self.multiple:
-                return (
-                    [x.cget("text") for x in self.selections]
-                    if len(self.selections) > 0
-                    else None
-                )
-            else:
-                return self.selected.cget("text") if self.selected is not None else None
+                return self.model.texts()
+            return self.model.text(index)
+        selected = [self.model.text(i) for i in self.model.selected_indices()]
+        if self.multiple:
+            return selected if selected else None
+        return selected[0] if selected else None
 
     def configure(self, **kwargs):
         """configurable options of the listbox"""
@@ -350,13 +448,10 @@ class CTkListbox(customtkinter.CTkScrollableFrame):
             self.button_fg_color = kwargs.pop("button_color")
             for i in self.buttons.values():
                 i.configure(fg_color=self.button_fg_color)
+            self._recolor(self.model.selected_indices())
         if "highlight_color" in kwargs:
             self.select_color = kwargs.pop("highlight_color")
-            if self.selected:
-                self.selected.configure(fg_color=self.select_color)
-            if len(self.selections) > 0:
-                for i in self.selections:
-                    i.configure(fg_color=self.select_color)
+            self._recolor(self.model.selected_indices())
         if "text_color" in kwargs:
             self.text_color = kwargs.pop("text_color")
             for i in self.buttons.values():
@@ -405,52 +500,36 @@ class CTkListbox(customtkinter.CTkScrollableFrame):
             return self.justify
         return super().cget(param)
 
-    def move_up(self, index):
+    def move_up(self, index: int):
         """Move the option up in the listbox"""
         if index > 0:
-            current_key = list(self.buttons.keys())[index]
-            previous_key = list(self.buttons.keys())[index - 1]
+            self._swap_rows(index, index - 1)
 
-            # Store the text of the button to be moved
-            current_text = self.buttons[current_key].cget("text")
-
-            # Update the text of the buttons
-            self.buttons[current_key].configure(
-                text=self.buttons[previous_key].cget("text")
-            )
-            self.buttons[previous_key].configure(text=current_text)
-
-            # Clear the selection from the current option
-            self.deselect(current_key)
-
-            # Update the selection
-            self.select(previous_key)
+            # Keep the moved option selected
+            self.deselect(index - 1)
+            self.select(index - 1)
 
             # Update the scrollbar position
             if self._parent_canvas.yview() != (0.0, 1.0):
                 self._parent_canvas.yview("scroll", -int(100 / 6), "units")
 
-    def move_down(self, index):
+    def move_down(self, index: int):
         """Move the option down in the listbox"""
-        if index < len(self.buttons) - 1:
-            current_key = list(self.buttons.keys())[index]
-            next_key = list(self.buttons.keys())[index + 1]
+        if index < self.model.size() - 1:
+            self._swap_rows(index, index + 1)
 
-            # Store the text of the button to be moved
-            current_text = self.buttons[current_key].cget("text")
-
-            # Update the text of the buttons
-            self.buttons[current_key].configure(
-                text=self.buttons[next_key].cget("text")
-            )
-            self.buttons[next_key].configure(text=current_text)
-
-            # Clear the selection from the current option
-            self.deselect(current_key)
-
-            # Update the selection
-            self.select(next_key)
+            # Keep the moved option selected
+            self.deselect(index + 1)
+            self.select(index + 1)
 
             # Update the scrollbar position
             if self._parent_canvas.yview() != (0.0, 1.0):
                 self._parent_canvas.yview("scroll", int(100 / 6), "units")
+
+    def _swap_rows(self, index: int, other: int):
+        # The two buttons trade grid rows; every other row stays where it is
+        button, other_button = self._button(index), self._button(other)
+        row = button.grid_info()["row"]
+        button.grid_configure(row=other_button.grid_info()["row"])
+        other_button.grid_configure(row=row)
+        self.model.move(index, other)
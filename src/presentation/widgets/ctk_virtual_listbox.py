@@ -0,0 +1,566 @@
+"""
+Virtualized listbox for customtkinter.
+
+Draws the rows on a single canvas and keeps only as many canvas items as fit
+in the viewport. Scrolling re-binds that fixed pool of items to other rows of
+the ListboxModel, so the cost of a list no longer grows with the number of
+products. The public API mirrors CTkListbox.
+"""
+
+import sys
+import tkinter
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import customtkinter  # type: ignore
+
+from src.presentation.widgets.listbox_model import Index, ListboxModel, RowChanges
+
+
+class CTkVirtualListbox(customtkinter.CTkFrame):
+    def __init__(
+        self,
+        master: Any,
+        height: int = 100,
+        width: int = 150,
+        highlight_color: str = "default",
+        fg_color: str = "transparent",
+        text_color: str = "default",
+        hover_color: str = "default",
+        button_color: str = "default",
+        border_width: int = 3,
+        font: Optional[tuple] = None,
+        multiple_selection: bool = False,
+        hover: bool = True,
+        command: Optional[Callable] = None,
+        justify: str = "left",
+        row_height: int = 32,
+        **kwargs,
+    ):
+        super().__init__(
+            master,
+            width=width,
+            height=height,
+            fg_color=fg_color,
+            border_width=border_width,
+            **kwargs,
+        )
+        self.model = ListboxModel(multiple=multiple_selection)
+        self.command = command
+        self.hover = hover
+
+        self.select_color = (
+            customtkinter.ThemeManager.theme["CTkButton"]["fg_color"]
+            if highlight_color == "default"
+            else highlight_color
+        )
+        self.text_color = (
+            customtkinter.ThemeManager.theme["CTkLabel"]["text_color"]
+            if text_color == "default"
+            else text_color
+        )
+        self.hover_color = (
+            customtkinter.ThemeManager.theme["CTkButton"]["hover_color"]
+            if hover_color == "default"
+            else hover_color
+        )
+        self.button_fg_color = (
+            "transparent" if button_color == "default" else button_color
+        )
+        if not font:
+            self.font = customtkinter.CTkFont(
+                customtkinter.ThemeManager.theme["CTkFont"]["family"], 13
+            )
+        elif isinstance(font, customtkinter.CTkFont):
+            self.font = font
+        else:
+            self.font = customtkinter.CTkFont(*font)
+        self.justify = self._anchor_for(justify)
+
+        self._row_height = row_height
+        self._offset = 0.0
+        self._hover_row: Optional[int] = None
+        self._redraw_job: Optional[str] = None
+        # Pool of (background rectangle, text) canvas items, one per visible slot
+        self._slots: List[Tuple[int, int]] = []
+
+        border_spacing = self._apply_widget_scaling(
+            self.cget("corner_radius") + border_width
+        )
+        self._list_canvas = tkinter.Canvas(
+            self,
+            highlightthickness=0,
+            borderwidth=0,
+            width=self._apply_widget_scaling(width - 20),
+            height=self._apply_widget_scaling(height),
+        )
+        self._scrollbar = customtkinter.CTkScrollbar(
+            self, orientation="vertical", command=self.yview, width=12
+        )
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self._list_canvas.grid(
+            row=0,
+            column=0,
+            sticky="nsew",
+            padx=(border_spacing, 0),
+            pady=border_spacing,
+        )
+        self._scrollbar.grid(
+            row=0,
+            column=1,
+            sticky="ns",
+            padx=(0, border_width + 4),
+            pady=border_spacing,
+        )
+        self._update_canvas_color()
+
+        self._list_canvas.bind("<Configure>", lambda e: self._schedule_redraw())
+        self._list_canvas.bind("<Button-1>", self._on_click)
+        self._list_canvas.bind("<Shift-Button-1>", self._on_shift_click)
+        self._list_canvas.bind("<Motion>", self._on_motion)
+        self._list_canvas.bind("<Leave>", self._on_leave)
+        if "linux" in sys.platform:
+            self._list_canvas.bind("<Button-4>", self._on_mouse_wheel)
+            self._list_canvas.bind("<Button-5>", self._on_mouse_wheel)
+        else:
+            self._list_canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+
+    @staticmethod
+    def _anchor_for(justify: str) -> str:
+        if justify == "left":
+            return "w"
+        if justify == "right":
+            return "e"
+        return "center"
+
+    # ----------------------------------------------------------------- data API
+
+    def insert(
+        self,
+        index: Index,
+        option: str,
+        update: bool = True,
+        key: Optional[Hashable] = None,
+        **args,
+    ):
+        """add new option in the listbox, returning its row key
+
+        ``key`` identifies the row, e.g. by a product id; a fresh key is
+        generated when it is omitted.
+        """
+        key = self.model.insert(index, option, key=key)
+        self._schedule_redraw()
+        return key
+
+    def insert_many(
+        self,
+        options: Iterable[str],
+        chunk_size: Optional[int] = None,
+        delay: int = 1,
+        callback: Optional[Callable[[], None]] = None,
+        **args,
+    ) -> List[Hashable]:
+        """add many options at the end, returning their row keys
+
+        Rows are plain model entries here, so they are always added in one go
+        and drawn by a single redraw; ``chunk_size`` and ``delay`` are accepted
+        for compatibility with CTkListbox.
+        """
+        keys = self.model.extend(options)
+        self._schedule_redraw()
+        if callback:
+            callback()
+        return keys
+
+    def replace_all(
+        self,
+        options: Iterable[str],
+        chunk_size: Optional[int] = None,
+        delay: int = 1,
+        callback: Optional[Callable[[], None]] = None,
+        **args,
+    ) -> List[Hashable]:
+        """replace every option in the listbox, see insert_many"""
+        self.model.clear()
+        self._hover_row = None
+        keys = self.insert_many(options, callback=callback)
+        self._clamp_offset()
+        return keys
+
+    def delete(self, index: Index, last: Optional[Index] = None) -> None:
+        """delete options from the listbox"""
+        if str(index).lower() == "all":
+            self.model.clear()
+        else:
+            self.model.delete(index, last)
+        self._hover_row = None
+        self._clamp_offset()
+        self._schedule_redraw()
+
+    def reconcile(
+        self,
+        keys: Sequence[Hashable],
+        changed: Container[Hashable],
+        render: Callable[[Hashable], str],
+    ) -> RowChanges:
+        """make the rows match ``keys``, rendering only new or changed rows"""
+        changes = self.model.reconcile(keys, changed, render)
+        if changes.removed or changes.reordered:
+            self._hover_row = None
+        self._clamp_offset()
+        self._schedule_redraw()
+        return changes
+
+    def set_option(self, key: Hashable, option: str) -> None:
+        """replace the text of the row with ``key``, keeping its selection"""
+        position = self._position(key)
+        self.model.set_text(position, option)
+        self._schedule_redraw()
+
+    def delete_key(self, key: Hashable) -> None:
+        """delete the row with ``key``"""
+        self.delete(self._position(key))
+
+    def key(self, index: Index) -> Hashable:
+        """return the key of the row at ``index``"""
+        return self.model.key(index)
+
+    def index_of(self, key: Hashable) -> Optional[int]:
+        """return the position of the row with ``key``, or None"""
+        return self.model.index_of(key)
+
+    def _position(self, key: Hashable) -> int:
+        position = self.model.index_of(key)
+        if position is None:
+            raise KeyError(key)
+        return position
+
+    def size(self) -> int:
+        """return total number of items in the listbox"""
+        return self.model.size()
+
+    def get(self, index: Optional[Index] = None):
+        """get the selected value"""
+        if index is not None:
+            if str(index).lower() == "all":
+                return self.model.texts()
+            return self.model.text(index)
+        selected = [self.model.text(i) for i in self.model.selected_indices()]
+        if self.model.multiple:
+            return selected if selected else None
+        return selected[0] if selected else None
+
+    def curselection(self):
+        indexes = self.model.selected_indices()
+        if self.model.multiple:
+            return tuple(indexes)
+        return indexes[0] if indexes else None
+
+    # ------------------------------------------------------------ selection API
+
+    def select(self, index: Index) -> None:
+        """select the option"""
+        self.model.select(index)
+        self._schedule_redraw()
+        self._notify()
+
+    def select_multiple(self, index: Index) -> None:
+        """extend the selection from the last selected row to ``index``"""
+        anchor = self.model.anchor
+        if anchor is None:
+            self.select(index)
+            return
+        self.model.select_range(anchor, index)
+        self._schedule_redraw()
+        self._notify()
+
+    def activate(self, index: Index) -> None:
+        if str(index).lower() == "all":
+            if self.model.multiple and self.model.size():
+                self.model.select_range(0, "end")
+                self._schedule_redraw()
+                self._notify()
+            return
+        self.select(index)
+
+    def deselect(self, index: Index) -> None:
+        if not self.model.multiple:
+            self.model.deselect_all()
+        else:
+            self.model.deselect(index)
+        self._schedule_redraw()
+
+    def deselect_all(self) -> None:
+        """Deselect all options in the listbox"""
+        self.model.deselect_all()
+        self._schedule_redraw()
+
+    def deactivate(self, index: Index) -> None:
+        if str(index).lower() == "all":
+            self.deselect_all()
+            return
+        self.deselect(index)
+
+    def move_up(self, index: int) -> None:
+        """Move the option up in the listbox"""
+        if index > 0:
+            self.model.move(index, index - 1)
+            self.model.deselect_all()
+            self.select(index - 1)
+            self.see(index - 1)
+
+    def move_down(self, index: int) -> None:
+        """Move the option down in the listbox"""
+        if index < self.model.size() - 1:
+            self.model.move(index, index + 1)
+            self.model.deselect_all()
+            self.select(index + 1)
+            self.see(index + 1)
+
+    def _notify(self) -> None:
+        if self.command:
+            self.command(self.get())
+        self.event_generate("<<ListboxSelect>>")
+
+    # ------------------------------------------------------------ scrolling API
+
+    def yview(self, *args):
+        """scrollbar protocol: query or change the visible fraction"""
+        total = self._content_height()
+        if not args:
+            if total <= 0:
+                return 0.0, 1.0
+            view = self._view_height()
+            return self._offset / total, min(1.0, (self._offset + view) / total)
+        if args[0] == "moveto":
+            self._offset = float(args[1]) * total
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                self._offset += amount * self._view_height()
+            else:
+                self._offset += amount * self._scaled_row_height()
+        self._clamp_offset()
+        self._schedule_redraw()
+        return None
+
+    def see(self, index: Index) -> None:
+        """scroll so that the row at ``index`` is visible"""
+        if not self.model.size():
+            return
+        position = self.model.normalize_index(index)
+        row_height = self._scaled_row_height()
+        top = position * row_height
+        if top < self._offset:
+            self._offset = top
+        elif top + row_height > self._offset + self._view_height():
+            self._offset = top + row_height - self._view_height()
+        self._clamp_offset()
+        self._schedule_redraw()
+
+    def _on_mouse_wheel(self, event) -> None:
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        elif sys.platform == "darwin":
+            steps = -event.delta
+        else:
+            steps = -int(event.delta / 120)
+        self.yview("scroll", steps, "units")
+
+    def _content_height(self) -> float:
+        return self.model.size() * self._scaled_row_height()
+
+    def _view_height(self) -> int:
+        return max(1, self._list_canvas.winfo_height())
+
+    def _scaled_row_height(self) -> float:
+        return self._apply_widget_scaling(self._row_height)
+
+    def _clamp_offset(self) -> None:
+        limit = max(0.0, self._content_height() - self._view_height())
+        self._offset = min(max(self._offset, 0.0), limit)
+
+    def _row_at(self, y: int) -> Optional[int]:
+        row = int((self._offset + y) // self._scaled_row_height())
+        return row if 0 <= row < self.model.size() else None
+
+    # ------------------------------------------------------------------ events
+
+    def _on_click(self, event) -> None:
+        row = self._row_at(event.y)
+        if row is not None:
+            self.select(row)
+
+    def _on_shift_click(self, event) -> None:
+        row = self._row_at(event.y)
+        if row is not None:
+            if self.model.multiple:
+                self.select_multiple(row)
+            else:
+                self.select(row)
+
+    def _on_motion(self, event) -> None:
+        if not self.hover:
+            return
+        row = self._row_at(event.y)
+        if row != self._hover_row:
+            self._hover_row = row
+            self._schedule_redraw()
+
+    def _on_leave(self, event) -> None:
+        if self._hover_row is not None:
+            self._hover_row = None
+            self._schedule_redraw()
+
+    # --------------------------------------------------------------- rendering
+
+    def _schedule_redraw(self) -> None:
+        # Coalesce every change made in one event loop turn into a single redraw
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._redraw)
+
+    def _redraw(self) -> None:
+        self._redraw_job = None
+        canvas = self._list_canvas
+        width = max(1, canvas.winfo_width())
+        view_height = self._view_height()
+        row_height = self._scaled_row_height()
+        self._clamp_offset()
+
+        first_row = int(self._offset // row_height)
+        shift = self._offset - first_row * row_height
+        slot_count = int(view_height // row_height) + 2
+        while len(self._slots) < slot_count:
+            self._slots.append(
+                (
+                    canvas.create_rectangle(0, 0, 0, 0, width=0),
+                    canvas.create_text(0, 0, font=self.font),
+                )
+            )
+
+        text_x = {"w": 8, "e": width - 8}.get(self.justify, width / 2)
+        text_color = self._apply_appearance_mode(self.text_color)
+        size = self.model.size()
+        for slot, (rect, text) in enumerate(self._slots):
+            row = first_row + slot
+            if slot >= slot_count or row >= size:
+                canvas.itemconfigure(rect, state="hidden")
+                canvas.itemconfigure(text, state="hidden")
+                continue
+            top = slot * row_height - shift
+            # Leave a small gap between rows, like the padded buttons of CTkListbox
+            canvas.coords(rect, 0, top, width, top + row_height - 4)
+            canvas.coords(text, text_x, top + (row_height - 4) / 2)
+            canvas.itemconfigure(rect, state="normal", fill=self._row_fill(row))
+            canvas.itemconfigure(
+                text,
+                state="normal",
+                text=self.model.text(row),
+                fill=text_color,
+                anchor=self.justify,
+                font=self.font,
+            )
+        self._update_scrollbar()
+
+    def _row_fill(self, row: int) -> str:
+        if self.model.is_selected(row):
+            return self._apply_appearance_mode(self.select_color)
+        if self.hover and row == self._hover_row:
+            return self._apply_appearance_mode(self.hover_color)
+        if self.button_fg_color == "transparent":
+            return ""
+        return self._apply_appearance_mode(self.button_fg_color)
+
+    def _update_scrollbar(self) -> None:
+        self._scrollbar.set(*self.yview())
+
+    def _update_canvas_color(self) -> None:
+        frame_color = self.cget("fg_color")
+        if frame_color == "transparent":
+            frame_color = self.cget("bg_color")
+        self._list_canvas.configure(bg=self._apply_appearance_mode(frame_color))
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._update_canvas_color()
+        self._schedule_redraw()
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+        self._clamp_offset()
+        self._schedule_redraw()
+
+    # ---------------------------------------------------------- widget plumbing
+
+    def bind(self, key, func, add="+"):
+        self._list_canvas.bind(key, lambda e: func(e), add=add)
+
+    def unbind(self, key):
+        self._list_canvas.unbind(key)
+
+    def configure(self, **kwargs):
+        """configurable options of the listbox"""
+        if "hover_color" in kwargs:
+            self.hover_color = kwargs.pop("hover_color")
+        if "button_color" in kwargs:
+            self.button_fg_color = kwargs.pop("button_color")
+        if "highlight_color" in kwargs:
+            self.select_color = kwargs.pop("highlight_color")
+        if "text_color" in kwargs:
+            self.text_color = kwargs.pop("text_color")
+        if "font" in kwargs:
+            self.font = kwargs.pop("font")
+        if "command" in kwargs:
+            self.command = kwargs.pop("command")
+        if "hover" in kwargs:
+            self.hover = kwargs.pop("hover")
+        if "justify" in kwargs:
+            self.justify = self._anchor_for(kwargs.pop("justify"))
+        if "multiple_selection" in kwargs:
+            self.model.multiple = kwargs.pop("multiple_selection")
+        if "row_height" in kwargs:
+            self._row_height = kwargs.pop("row_height")
+        self._schedule_redraw()
+        if kwargs:
+            super().configure(**kwargs)
+            if "fg_color" in kwargs or "bg_color" in kwargs:
+                self._update_canvas_color()
+
+    def cget(self, param):
+        if param == "hover_color":
+            return self.hover_color
+        if param == "button_color":
+            return self.button_fg_color
+        if param == "highlight_color":
+            return self.select_color
+        if param == "text_color":
+            return self.text_color
+        if param == "font":
+            return self.font
+        if param == "hover":
+            return self.hover
+        if param == "justify":
+            return self.justify
+        if param == "multiple_selection":
+            return self.model.multiple
+        if param == "row_height":
+            return self._row_height
+        return super().cget(param)
+
+    def destroy(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        super().destroy()
@@ -0,0 +1,125 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.presentation.widgets.tk_dispatcher import (
+    ErrorCallback,
+    ResultCallback,
+    TkDispatcher,
+)
+
+
+class DebouncedWorker:
+    """
+    Run the latest of a burst of requests on a worker thread.
+
+    Each ``submit`` restarts a short timer, so a request only starts once
+    the user pauses. A newer request cancels the older one if it has not
+    started yet and makes its result stale if it has, so only the result of
+    the latest request is delivered back on the Tk main loop.
+    """
+
+    def __init__(
+        self,
+        widget: Any,
+        delay_ms: int = 250,
+        executor: Optional[Executor] = None,
+        dispatcher: Optional[TkDispatcher] = None,
+    ):
+        """
+        Initialize the worker.
+
+        :param widget: Any Tk widget, used for ``after`` scheduling.
+        :param delay_ms: Quiet period before a request starts.
+        :param executor: Executor running the requests (one thread by default).
+        :param dispatcher: Dispatcher delivering results on the main loop.
+        """
+        self._widget = widget
+        self.delay_ms = delay_ms
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="debounced-worker"
+        )
+        self._dispatcher = dispatcher or TkDispatcher(widget)
+        self._generation = 0
+        self._timer: Optional[str] = None
+        self._future: Optional[Future] = None
+
+    @property
+    def pending(self) -> bool:
+        """
+        Whether a request is waiting for its timer or still running.
+
+        :return: True if the latest request has not been delivered yet.
+        """
+        return self._timer is not None or self._future is not None
+
+    def submit(
+        self,
+        func: Callable[[], Any],
+        on_result: ResultCallback,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """
+        Replace any earlier request with a new one.
+
+        :param func: Work to run on the worker thread; must not touch Tk.
+        :param on_result: Called on the main loop with the result.
+        :param on_error: Called on the main loop with the raised exception.
+        """
+        self.cancel()
+        generation = self._generation
+        self._timer = self._widget.after(
+            self.delay_ms, self._start, generation, func, on_result, on_error
+        )
+
+    def cancel(self) -> None:
+        """
+        Drop the current request, whether it is waiting or running.
+        """
+        self._generation += 1
+        if self._timer is not None:
+            self._widget.after_cancel(self._timer)
+            self._timer = None
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def shutdown(self) -> None:
+        """
+        Cancel the current request and stop the worker thread.
+        """
+        self.cancel()
+        self._dispatcher.close()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _start(
+        self,
+        generation: int,
+        func: Callable[[], Any],
+        on_result: ResultCallback,
+        on_error: Optional[ErrorCallback],
+    ) -> None:
+        self._timer = None
+        future = self._executor.submit(func)
+        self._future = future
+
+        def deliver_result(result: Any) -> None:
+            if self._finish(generation):
+                on_result(result)
+
+        def deliver_error(error: BaseException) -> None:
+            if not self._finish(generation):
+                return
+            if on_error is None:
+                raise error
+            on_error(error)
+
+        self._dispatcher.when_done(future, deliver_result, deliver_error)
+
+    def _finish(self, generation: int) -> bool:
+        # Results of superseded requests are dropped here, on the main loop
+        if generation != self._generation:
+            return False
+        self._future = None
+        return True
@@ -0,0 +1,402 @@
+from dataclasses import dataclass, field
+from itertools import count, islice
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+Index = Union[int, str]
+
+
+@dataclass
+class RowChanges:
+    """
+    Summary of what a reconcile pass changed.
+    """
+
+    inserted: List[Hashable] = field(default_factory=list)
+    removed: List[Hashable] = field(default_factory=list)
+    updated: List[Hashable] = field(default_factory=list)
+    reordered: bool = False
+
+    @property
+    def touched(self) -> int:
+        """
+        :return: Number of rows inserted, removed or re-rendered.
+        """
+        return len(self.inserted) + len(self.removed) + len(self.updated)
+
+
+class ListboxModel:
+    """
+    Tk-free row store behind the list widgets.
+
+    Keeps the row texts in display order together with a stable key per row,
+    a key to position map and the selection as a set of keys, so widgets can
+    draw any slice of rows without owning one Tk widget per row.
+    """
+
+    def __init__(self, multiple: bool = False):
+        """
+        Initialize an empty model.
+
+        :param multiple: Whether clicking a row toggles it in a multi-selection.
+        """
+        self.multiple = multiple
+        self._texts: List[str] = []
+        self._keys: List[Hashable] = []
+        self._positions: Optional[Dict[Hashable, int]] = {}
+        self._selected: Set[Hashable] = set()
+        self._anchor: Optional[Hashable] = None
+        self._key_counter = count()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def size(self) -> int:
+        """
+        Return the number of rows.
+
+        :return: Number of rows in the model.
+        """
+        return len(self._texts)
+
+    def normalize_index(self, index: Index, allow_end: bool = False) -> int:
+        """
+        Turn a listbox index into a position.
+
+        :param index: Integer position, negative position or "end".
+        :param allow_end: Whether "end" means one past the last row (for inserts).
+        :return: The position.
+        :raises IndexError: If the position is out of range.
+        """
+        size = len(self._texts)
+        if isinstance(index, str):
+            if index.lower() != "end":
+                raise IndexError(f"Bad listbox index: {index!r}")
+            position = size if allow_end else size - 1
+        else:
+            position = int(index)
+            if position < 0:
+                position += size
+        upper = size if allow_end else size - 1
+        if position < 0 or position > upper:
+            raise IndexError(f"Listbox index out of range: {index!r}")
+        return position
+
+    def insert(self, index: Index, text: str, key: Optional[Hashable] = None):
+        """
+        Insert a row.
+
+        :param index: Position to insert at, or "end".
+        :param text: Text shown for the row.
+        :param key: Stable row key; a fresh one is generated when omitted.
+        :return: The row key.
+        :raises ValueError: If the key is already used by another row.
+        """
+        if key is None:
+            key = next(self._key_counter)
+        elif key in self._index():
+            raise ValueError(f"Duplicate listbox row key: {key!r}")
+        position = self.normalize_index(index, allow_end=True)
+        if position == len(self._texts):
+            self._texts.append(text)
+            self._keys.append(key)
+            if self._positions is not None:
+                self._positions[key] = position
+        else:
+            self._texts.insert(position, text)
+            self._keys.insert(position, key)
+            self._positions = None
+        return key
+
+    def extend(self, texts: Iterable[str]) -> List[Hashable]:
+        """
+        Append rows with generated keys.
+
+        :param texts: Texts of the new rows, in display order.
+        :return: Keys of the new rows.
+        """
+        texts = list(texts)
+        start = len(self._texts)
+        keys: List[Hashable] = list(islice(self._key_counter, len(texts)))
+        self._texts.extend(texts)
+        self._keys.extend(keys)
+        if self._positions is not None:
+            self._positions.update(zip(keys, range(start, start + len(keys))))
+        return keys
+
+    def delete(self, first: Index, last: Optional[Index] = None) -> List[Hashable]:
+        """
+        Delete one row or an inclusive range of rows.
+
+        Out of range bounds are clipped, so deleting from an empty model is a
+        no-op just like on a Tk listbox.
+
+        :param first: First position to delete, or "end".
+        :param last: Last position to delete (inclusive), or "end".
+        :return: Keys of the deleted rows.
+        """
+        if not self._texts:
+            return []
+        start = self._clip(first)
+        stop = start if last is None else min(self._clip(last), len(self._texts) - 1)
+        if start >= len(self._texts) or stop < start:
+            return []
+        removed = self._keys[start : stop + 1]
+        del self._texts[start : stop + 1]
+        del self._keys[start : stop + 1]
+        for key in removed:
+            self._selected.discard(key)
+        if self._anchor in removed:
+            self._anchor = None
+        if stop == len(self._texts) + len(removed) - 1 and self._positions is not None:
+            for key in removed:
+                del self._positions[key]
+        else:
+            self._positions = None
+        return removed
+
+    def clear(self) -> None:
+        """
+        Remove every row and the selection.
+        """
+        self._texts.clear()
+        self._keys.clear()
+        self._positions = {}
+        self._selected.clear()
+        self._anchor = None
+
+    def text(self, index: Index) -> str:
+        """
+        :param index: Row position.
+        :return: Text of the row.
+        """
+        return self._texts[self.normalize_index(index)]
+
+    def texts(self) -> List[str]:
+        """
+        :return: Copy of all row texts in display order.
+        """
+        return list(self._texts)
+
+    def set_text(self, index: Index, text: str) -> None:
+        """
+        Replace the text of a row, keeping its key and selection.
+
+        :param index: Row position.
+        :param text: New row text.
+        """
+        self._texts[self.normalize_index(index)] = text
+
+    def key(self, index: Index) -> Hashable:
+        """
+        :param index: Row position.
+        :return: Key of the row.
+        """
+        return self._keys[self.normalize_index(index)]
+
+    def index_of(self, key: Hashable) -> Optional[int]:
+        """
+        Find the position of a row.
+
+        :param key: Row key.
+        :return: Position of the row, or None if there is no such row.
+        """
+        return self._index().get(key)
+
+    def move(self, index: Index, new_index: Index) -> None:
+        """
+        Move a row to a new position, keeping its key and selection.
+
+        :param index: Current row position.
+        :param new_index: Target row position.
+        """
+        source = self.normalize_index(index)
+        target = self.normalize_index(new_index)
+        if source == target:
+            return
+        self._texts.insert(target, self._texts.pop(source))
+        self._keys.insert(target, self._keys.pop(source))
+        self._positions = None
+
+    def reconcile(
+        self,
+        keys: Sequence[Hashable],
+        changed: Container[Hashable],
+        render: Callable[[Hashable], str],
+    ) -> RowChanges:
+        """
+        Make the rows match a new keyed result set.
+
+        Rows whose key is already shown and not in ``changed`` keep their text,
+        so ``render`` only runs for new and changed rows. Removed rows leave the
+        selection; surviving rows keep it even when they move.
+
+        :param keys: Row keys of the new result set, in display order.
+        :param changed: Keys whose shown text is stale.
+        :param render: Builds the text of a row from its key.
+        :return: What was inserted, removed, re-rendered or reordered.
+        :raises ValueError: If ``keys`` contains duplicates.
+        """
+        new_keys = list(keys)
+        wanted = set(new_keys)
+        if len(wanted) != len(new_keys):
+            raise ValueError("Duplicate listbox row keys.")
+        positions = self._index()
+        changes = RowChanges(
+            inserted=[key for key in new_keys if key not in positions],
+            removed=[key for key in self._keys if key not in wanted],
+            updated=[key for key in new_keys if key in positions and key in changed],
+        )
+        changes.reordered = [key for key in self._keys if key in wanted] != [
+            key for key in new_keys if key in positions
+        ]
+
+        if not (changes.inserted or changes.removed or changes.reordered):
+            for key in changes.updated:
+                self._texts[positions[key]] = render(key)
+            return changes
+
+        old_texts = self._texts
+        self._texts = [
+            (
+                render(key)
+                if key not in positions or key in changed
+                else old_texts[positions[key]]
+            )
+            for key in new_keys
+        ]
+        self._keys = new_keys
+        self._positions = None
+        for key in changes.removed:
+            self._selected.discard(key)
+        if self._anchor is not None and self._anchor not in wanted:
+            self._anchor = None
+        return changes
+
+    def select(self, index: Index) -> List[int]:
+        """
+        Select a row.
+
+        In single mode the row replaces the current selection. In multiple
+        mode the row is toggled.
+
+        :param index: Row position.
+        :return: Positions whose selection state changed.
+        """
+        position = self.normalize_index(index)
+        key = self._keys[position]
+        changed: List[int] = []
+        if self.multiple:
+            if key in self._selected:
+                self._selected.remove(key)
+            else:
+                self._selected.add(key)
+                self._anchor = key
+            return [position]
+        for old_key in self._selected:
+            if old_key != key:
+                changed.append(self._index()[old_key])
+        if key not in self._selected:
+            changed.append(position)
+        self._selected = {key}
+        self._anchor = key
+        return changed
+
+    def select_range(self, first: Index, last: Index) -> List[int]:
+        """
+        Add an inclusive range of rows to the selection without toggling.
+
+        :param first: One end of the range.
+        :param last: Other end of the range.
+        :return: Positions that became selected.
+        """
+        start = self.normalize_index(first)
+        stop = self.normalize_index(last)
+        if start > stop:
+            start, stop = stop, start
+        if not self.multiple:
+            return self.select(stop)
+        changed = []
+        for position in range(start, stop + 1):
+            key = self._keys[position]
+            if key not in self._selected:
+                self._selected.add(key)
+                changed.append(position)
+        return changed
+
+    def deselect(self, index: Index) -> List[int]:
+        """
+        Remove a row from the selection.
+
+        :param index: Row position.
+        :return: Positions whose selection state changed.
+        """
+        position = self.normalize_index(index)
+        key = self._keys[position]
+        if key not in self._selected:
+            return []
+        self._selected.remove(key)
+        if self._anchor == key:
+            self._anchor = None
+        return [position]
+
+    def deselect_all(self) -> List[int]:
+        """
+        Clear the selection.
+
+        :return: Positions that were selected.
+        """
+        positions = self.selected_indices()
+        self._selected.clear()
+        self._anchor = None
+        return positions
+
+    def is_selected(self, index: Index) -> bool:
+        """
+        :param index: Row position.
+        :return: True if the row is selected.
+        """
+        return self._keys[self.normalize_index(index)] in self._selected
+
+    def selected_indices(self) -> List[int]:
+        """
+        :return: Sorted positions of the selected rows.
+        """
+        positions = self._index()
+        return sorted(positions[key] for key in self._selected)
+
+    @property
+    def anchor(self) -> Optional[int]:
+        """
+        Position of the last row selected by a click, used for range selection.
+
+        :return: Anchor position, or None if there is no anchor.
+        """
+        if self._anchor is None:
+            return None
+        return self._index().get(self._anchor)
+
+    def _clip(self, index: Index) -> int:
+        if isinstance(index, str):
+            if index.lower() != "end":
+                raise IndexError(f"Bad listbox index: {index!r}")
+            return len(self._texts) - 1
+        position = int(index)
+        if position < 0:
+            position += len(self._texts)
+        return max(0, position)
+
+    def _index(self) -> Dict[Hashable, int]:
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self._keys)}
+        return self._positions
@@ -0,0 +1,128 @@
+import queue
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[BaseException], None]
+
+
+class TkDispatcher:
+    """
+    Deliver the outcome of futures on the Tk main loop.
+
+    Worker threads must not touch Tk, so a finished future only puts itself
+    on a thread-safe queue. The main loop drains that queue from an ``after``
+    poll that runs only while futures are outstanding.
+    """
+
+    def __init__(
+        self,
+        widget: Any,
+        poll_ms: int = 20,
+        on_busy_change: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        :param widget: Any Tk widget, used for ``after`` scheduling.
+        :param poll_ms: Delay between polls while futures are outstanding.
+        :param on_busy_change: Called with True when the first future becomes
+            outstanding and with False once every outcome was delivered.
+        """
+        self._widget = widget
+        self.poll_ms = poll_ms
+        self.on_busy_change = on_busy_change
+        self._busy = False
+        # Finished futures with their callbacks, filled from worker threads
+        self._done: queue.SimpleQueue = queue.SimpleQueue()
+        self._outstanding = 0
+        self._poll_job: Optional[str] = None
+
+    @property
+    def outstanding(self) -> int:
+        """
+        Number of futures whose outcome has not been delivered yet.
+
+        :return: Count of outstanding futures.
+        """
+        return self._outstanding
+
+    def when_done(
+        self,
+        future: Future,
+        on_result: ResultCallback,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """
+        Call back on the main loop once the future finishes.
+
+        Cancelled futures are dropped silently. Errors without an
+        ``on_error`` callback go to the Tk callback exception handler.
+
+        :param future: The future to watch.
+        :param on_result: Called with the future's result.
+        :param on_error: Called with the future's exception.
+        """
+        self._outstanding += 1
+        future.add_done_callback(
+            lambda done: self._done.put((done, on_result, on_error))
+        )
+        self._update_busy()
+        self._schedule_poll()
+
+    def close(self) -> None:
+        """
+        Stop polling; outcomes that arrive later are not delivered.
+        """
+        if self._poll_job is not None:
+            self._widget.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._outstanding = 0
+        self._update_busy()
+
+    def _schedule_poll(self) -> None:
+        if self._poll_job is None:
+            self._poll_job = self._widget.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        while True:
+            try:
+                future, on_result, on_error = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            self._deliver(future, on_result, on_error)
+        # Callbacks may have started new work, so report the state once drained
+        self._update_busy()
+        if self._outstanding > 0:
+            self._schedule_poll()
+
+    def _update_busy(self) -> None:
+        busy = self._outstanding > 0
+        if busy != self._busy:
+            self._busy = busy
+            if self.on_busy_change is not None:
+                self.on_busy_change(busy)
+
+    def _deliver(
+        self,
+        future: Future,
+        on_result: ResultCallback,
+        on_error: Optional[ErrorCallback],
+    ) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        try:
+            if error is None:
+                on_result(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                raise error
+        except Exception as callback_error:
+            # Keep draining the queue; report like any other Tk callback error
+            self._widget._root().report_callback_exception(
+                type(callback_error), callback_error, callback_error.__traceback__
+            )
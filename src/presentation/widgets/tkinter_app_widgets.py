@@ -1,6 +1,14 @@
 import customtkinter as ctk  # type: ignore
 from tkinter import messagebox
-from src.presentation.widgets.ctk_listbox import CTkListbox
+from src.presentation.widgets.ctk_virtual_listbox import CTkVirtualListbox
+from src.presentation.widgets.debounced_worker import DebouncedWorker
+from src.presentation.widgets.tk_dispatcher import TkDispatcher
+from src.presentation.controllers.AsyncProductController import (
+    AsyncProductController,
+)
+from src.presentation.stores.ProductFilter import ProductFilter
+from src.presentation.stores.ProductFilterEngine import ProductFilterEngine
+from src.presentation.stores.ProductStore import ProductStore
 from src.utils.purchaseStatus import get_purchase_status
 from typing import List
 
@@ -10,15 +18,26 @@ class TkinterApp:
     Main application class for the Tkinter-based shopping list and todo app.
     """
 
-    def __init__(self, root, product_controller) -> None:
+    def __init__(self, root, product_controller, filter_delay_ms: int = 250) -> None:
         """
         Initialize the TkinterApp with the root window and product controller.
 
         :param root: The root window of the Tkinter application.
         :param product_controller: The controller for managing products.
+        :param filter_delay_ms: Typing pause before search and filters run.
         """
         self.root = root
         self.product_controller = product_controller
+        # Controller calls run on one worker thread; results come back on Tk
+        self.async_controller = AsyncProductController(product_controller)
+        self.dispatcher = TkDispatcher(root, on_busy_change=self._set_busy)
+        # Search and filter queries share that thread, latest keystroke wins
+        self.filter_worker = DebouncedWorker(
+            root,
+            delay_ms=filter_delay_ms,
+            executor=self.async_controller.executor,
+            dispatcher=self.dispatcher,
+        )
 
         # Create a main frame to center the content
         main_frame = ctk.CTkFrame(root, fg_color="#242424")
@@ -162,19 +181,61 @@ class TkinterApp:
         )
         self.learn_button.grid(row=0, column=4, padx=5, pady=5)
 
+        # Quick edit buttons applied directly to the selected product
+        self.decrease_button = ctk.CTkButton(
+            button_frame,
+            text="➖ Qty",
+            command=lambda: self.adjust_selected_quantity(-1),
+            state=ctk.DISABLED,
+            width=80,
+        )
+        self.decrease_button.grid(row=1, column=0, padx=5, pady=5)
+
+        self.increase_button = ctk.CTkButton(
+            button_frame,
+            text="➕ Qty",
+            command=lambda: self.adjust_selected_quantity(1),
+            state=ctk.DISABLED,
+            width=80,
+        )
+        self.increase_button.grid(row=1, column=1, padx=5, pady=5)
+
+        self.toggle_purchased_button = ctk.CTkButton(
+            button_frame,
+            text="✔ Toggle Purchased",
+            command=self.toggle_selected_purchased,
+            state=ctk.DISABLED,
+        )
+        self.toggle_purchased_button.grid(row=1, column=2, padx=5, pady=5)
+
         # Product list
-        self.product_list = CTkListbox(
+        self.product_list = CTkVirtualListbox(
             main_frame, width=600, height=300, command=self.on_product_select
         )
         self.product_list.pack(pady=5)
 
+        # Shown while controller calls are running in the background
+        self.busy_label = ctk.CTkLabel(main_frame, text="")
+        self.busy_label.pack(pady=(0, 5))
+
         self.selected_product_id = None
-        self.product_map: dict[str, int] = (
-            {}
-        )  # Słownik do mapowania wyświetlanych wartości na ID produktów
-        self.current_filter_mode = (
-            "all"  # Track current filter mode for efficient updates
+        self.selected_product_version = None  # Version shown when selected
+        self.selected_product_purchased = False
+        # Product id -> (version, row text) of the rows currently in the list;
+        # the list rows are keyed by product id too
+        self._displayed_rows: dict[str, tuple[int, str]] = {}
+        # Filter applied to the store to get the displayed products
+        self.active_filter = ProductFilter()
+
+        # Client-side copy of the products, kept current from controller results
+        self.product_store = ProductStore()
+        for event in (ProductStore.ADDED, ProductStore.UPDATED, ProductStore.REMOVED):
+            self.product_store.subscribe(event, self._on_product_changed)
+        self.product_store.subscribe(
+            ProductStore.RESET, lambda products: self._redisplay()
         )
+        # Narrowing searches re-filter the last result instead of every product
+        self.filter_engine = ProductFilterEngine(self.product_store)
 
         # Refresh product list on startup
         self.refresh_product_list()
@@ -185,27 +246,158 @@ class TkinterApp:
 
         :param selected_option: The selected product option.
         """
-        selected_value = selected_option
-        selected_id = self.product_map.get(selected_value)
+        position = self.product_list.curselection()
+        if position is None:
+            return
+        selected_id = self.product_list.key(position)
         if self.selected_product_id == selected_id:
             # Odznacz element
-            self.selected_product_id = None
-            self.clear_inputs()
-            self.product_list.deselect_all()  # Resetuj zaznaczenie w liście
+            self._clear_selection()
         else:
             # Zaznacz nowy element
             self.selected_product_id = selected_id
-            product = self.product_controller.get_product_by_id(
-                self.selected_product_id
-            )
+            product = self.product_store.get(selected_id)
             if product:
-                self.name_entry.delete(0, ctk.END)
-                self.name_entry.insert(0, product.name)
-                self.quantity_entry.delete(0, ctk.END)
-                self.quantity_entry.insert(0, product.quantity)
-                self.purchased_var.set(product.purchased)
-                self.update_button.configure(state=ctk.NORMAL)
-                self.remove_button.configure(state=ctk.NORMAL)
+                self._show_selected_product(product)
+
+    def _on_product_changed(self, product):
+        """
+        Update the list row of a changed product, found by its product id.
+
+        A shown product is re-rendered or dropped in place; a product that
+        appears in or leaves the filtered list triggers a full redisplay.
+
+        :param product: The product added, updated or removed in the store.
+        """
+        shown = product.id in self._displayed_rows
+        if shown and product.id not in self.product_store:
+            del self._displayed_rows[product.id]
+            self.product_list.delete_key(product.id)
+        elif shown and self.active_filter.matches(product):
+            row_text = self._format_product_row(product)
+            self._displayed_rows[product.id] = (product.version, row_text)
+            self.product_list.set_option(product.id, row_text)
+        elif shown or self.active_filter.matches(product):
+            self._redisplay()
+
+    def _clear_selection(self):
+        """
+        Forget the selected product and clear its row highlight and inputs.
+        """
+        self.selected_product_id = None
+        self.product_list.deselect_all()
+        self.clear_inputs()
+
+    def _redisplay(self):
+        """
+        Show the stored products that pass the active filter.
+        """
+        self.update_product_display(self.filter_engine.apply(self.active_filter))
+
+    def _run_async(self, future, on_result, on_error=None):
+        """
+        Deliver the outcome of a background controller call on the Tk thread.
+
+        :param future: Future returned by the async controller.
+        :param on_result: Called with the result.
+        :param on_error: Called with the error; shows an error dialog by default.
+        """
+        self.dispatcher.when_done(future, on_result, on_error or self._show_error)
+
+    def _show_error(self, error):
+        """
+        Show a failed background call to the user.
+
+        :param error: The raised exception.
+        """
+        messagebox.showerror("Error", str(error))
+
+    def _set_busy(self, busy: bool):
+        """
+        Toggle the busy indicators while background calls are running.
+
+        :param busy: Whether any call is still running.
+        """
+        self.busy_label.configure(text="⏳ Working..." if busy else "")
+        self.root.configure(cursor="watch" if busy else "")
+
+    def shutdown(self):
+        """
+        Stop background work before the window closes.
+        """
+        self.filter_worker.shutdown()
+        self.async_controller.shutdown()
+
+    def _show_selected_product(self, product):
+        """
+        Fill the inputs with the selected product and enable the edit buttons.
+
+        :param product: The selected product.
+        """
+        self.selected_product_id = product.id
+        self.selected_product_version = product.version
+        self.selected_product_purchased = product.purchased
+        self.name_entry.delete(0, ctk.END)
+        self.name_entry.insert(0, product.name)
+        self.quantity_entry.delete(0, ctk.END)
+        self.quantity_entry.insert(0, product.quantity)
+        self.purchased_var.set(product.purchased)
+        self._set_edit_buttons_state(ctk.NORMAL)
+
+    def _set_edit_buttons_state(self, state):
+        """
+        Enable or disable the buttons acting on the selected product.
+
+        :param state: ctk.NORMAL or ctk.DISABLED.
+        """
+        self.update_button.configure(state=state)
+        self.remove_button.configure(state=state)
+        self.decrease_button.configure(state=state)
+        self.increase_button.configure(state=state)
+        self.toggle_purchased_button.configure(state=state)
+
+    def adjust_selected_quantity(self, delta: int):
+        """
+        Change the selected product's quantity by delta in one atomic call.
+
+        :param delta: Amount added to the quantity (negative to decrease).
+        """
+        if not self.selected_product_id:
+            messagebox.showerror("Error", "No product selected")
+            return
+        self._run_async(
+            self.async_controller.adjust_quantity(self.selected_product_id, delta),
+            self._refresh_keeping_selection,
+        )
+
+    def toggle_selected_purchased(self):
+        """
+        Flip the selected product's purchase status in one atomic call.
+        """
+        if not self.selected_product_id:
+            messagebox.showerror("Error", "No product selected")
+            return
+        self._run_async(
+            self.async_controller.set_purchased(
+                self.selected_product_id, not self.selected_product_purchased
+            ),
+            self._refresh_keeping_selection,
+        )
+
+    def _refresh_keeping_selection(self, product):
+        """
+        Apply a quick edit to the list and keep the product selected.
+
+        A product that no longer passes the active filter leaves the list,
+        so its selection is cleared instead.
+
+        :param product: The product returned by the quick edit.
+        """
+        self.product_store.upsert(product)
+        if product.id in self._displayed_rows:
+            self._show_selected_product(product)
+        else:
+            self._clear_selection()
 
     def add_product(self):
         """
@@ -227,13 +419,8 @@ class TkinterApp:
             messagebox.showerror("Error", "Quantity must be a positive integer")
             return
         purchased = self.purchased_var.get()
-        # BEFORE adding the product, check if AI has suggestions
-        try:
-            # Use new advanced AI checking
-            suggestions_analysis = self.product_controller.check_name_for_suggestions(
-                name
-            )
 
+        def on_checked(suggestions_analysis):
             if suggestions_analysis["has_any_suggestions"]:
                 # Show AI suggestions dialog and let user choose
                 self._show_smart_ai_suggestions_for_add_product(
@@ -241,44 +428,58 @@ class TkinterApp:
                 )
                 return  # Exit here, the dialog will handle adding the product
 
-        except Exception as e:
+            # No AI suggestions needed, proceed with normal add
+            self._add_product_final(name, quantity, purchased)
+
+        def on_check_failed(e):
             # If AI check fails, continue with normal add
             print(f"AI suggestion check failed: {e}")
+            self._add_product_final(name, quantity, purchased)
 
-        # No AI suggestions needed or AI failed, proceed with normal add
-        self._add_product_final(name, quantity, purchased)
+        # BEFORE adding the product, check if AI has suggestions
+        self._run_async(
+            self.async_controller.check_name_for_suggestions(name),
+            on_checked,
+            on_check_failed,
+        )
 
     def _add_product_final(self, name: str, quantity: int, purchased: bool):
         """
         Final step to add product with AI normalization.
         """
-        try:
+        self._run_async(
             # Use AI normalization
-            product, normalization_info = self.product_controller.add_product_with_ai(
-                name, quantity, purchased
-            )
+            self.async_controller.add_product_with_ai(name, quantity, purchased),
+            self._on_product_added,
+        )
 
-            # Create success message
-            success_msg = f"Product '{product.name}' added successfully!"
+    def _on_product_added(self, result):
+        """
+        Report an added product and add it to the list.
 
-            # Show AI improvements
-            if normalization_info["improved"]:
-                changes = ", ".join(normalization_info["changes"])
-                success_msg += f"\n🤖 AI improved: '{normalization_info['original']}' → '{normalization_info['normalized']}'"
-                success_msg += f"\nChanges: {changes}"
+        :param result: Tuple of the added product and its normalization info.
+        """
+        product, normalization_info = result
 
-            # Show similar products warning
-            if normalization_info["similar_products"]:
-                similar_names = [
-                    name for name, score in normalization_info["similar_products"][:2]
-                ]
-                success_msg += f"\n⚠️ Similar products found: {', '.join(similar_names)}"
+        # Create success message
+        success_msg = f"Product '{product.name}' added successfully!"
 
-            messagebox.showinfo("Success", success_msg)
-            self.refresh_product_list()
-            self.clear_inputs()
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
+        # Show AI improvements
+        if normalization_info["improved"]:
+            changes = ", ".join(normalization_info["changes"])
+            success_msg += f"\n🤖 AI improved: '{normalization_info['original']}' → '{normalization_info['normalized']}'"
+            success_msg += f"\nChanges: {changes}"
+
+        # Show similar products warning
+        if normalization_info["similar_products"]:
+            similar_names = [
+                name for name, score in normalization_info["similar_products"][:2]
+            ]
+            success_msg += f"\n⚠️ Similar products found: {', '.join(similar_names)}"
+
+        self.product_store.upsert(product)
+        messagebox.showinfo("Success", success_msg)
+        self.clear_inputs()
 
     def update_product(self):
         """
@@ -303,17 +504,26 @@ class TkinterApp:
             messagebox.showerror("Error", "Quantity must be a positive integer")
             return
         purchased = self.purchased_var.get()
-        try:
-            product = self.product_controller.update_product(
-                self.selected_product_id, name, quantity, purchased
-            )
-            messagebox.showinfo(
-                "Success", f"Product {product.name} updated successfully!"
-            )
-            self.refresh_product_list()
-            self.clear_inputs()
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
+        self._run_async(
+            self.async_controller.update_product(
+                self.selected_product_id,
+                name,
+                quantity,
+                purchased,
+                version=self.selected_product_version,
+            ),
+            self._on_product_updated,
+        )
+
+    def _on_product_updated(self, product):
+        """
+        Report an updated product and update its row.
+
+        :param product: The updated product.
+        """
+        self.product_store.upsert(product)
+        messagebox.showinfo("Success", f"Product {product.name} updated successfully!")
+        self._clear_selection()
 
     def remove_product(self):
         """
@@ -322,28 +532,31 @@ class TkinterApp:
         if not self.selected_product_id:
             messagebox.showerror("Error", "No product selected")
             return
-        try:
-            self.product_controller.remove_product(self.selected_product_id)
-            messagebox.showinfo("Success", "Product removed successfully!")
-            self.refresh_product_list()
-            self.clear_inputs()
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
+        product_id = self.selected_product_id
+        self._run_async(
+            self.async_controller.remove_product(product_id),
+            lambda result: self._on_product_removed(product_id),
+        )
+
+    def _on_product_removed(self, product_id):
+        """
+        Report a removed product and drop it from the list.
+
+        :param product_id: The ID of the removed product.
+        """
+        self.product_store.remove(product_id)
+        messagebox.showinfo("Success", "Product removed successfully!")
+        self._clear_selection()
 
     def refresh_product_list(self):
         """
-        Refresh the product list displayed in the UI using all products.
+        Reload the products from the repository and show them with the active filter.
         """
-        if hasattr(self, "current_filter_mode") and self.current_filter_mode != "all":
-            # If filters are active, reapply them
-            if self.current_filter_mode == "low_stock":
-                self.show_low_stock()
-            else:
-                self.apply_filters()
-        else:
-            # Show all products
-            products = self.product_controller.get_all_products()
-            self.update_product_display(products)
+        # A pending filter result would be stale once the reload lands
+        self.filter_worker.cancel()
+        self._run_async(
+            self.async_controller.get_all_products(), self.product_store.load
+        )
 
     def clear_inputs(self):
         """
@@ -352,28 +565,55 @@ class TkinterApp:
         self.name_entry.delete(0, ctk.END)
         self.quantity_entry.delete(0, ctk.END)
         self.purchased_var.set(False)
-        self.update_button.configure(state=ctk.DISABLED)
-        self.remove_button.configure(state=ctk.DISABLED)
+        self._set_edit_buttons_state(ctk.DISABLED)
 
     def on_search_change(self, event=None):
         """
-        Handle search input changes and filter products using list comprehensions.
+        Handle search input changes; filtering runs once typing pauses.
 
         :param event: The event triggered by key release (optional).
         """
-        self.apply_filters()
+        self.schedule_filters()
 
     def on_filter_change(self, event=None):
         """
-        Handle filter changes and update product list.
+        Handle filter changes; filtering runs once typing pauses.
 
         :param event: The event triggered by combo box or entry changes (optional).
         """
-        self.apply_filters()
+        self.schedule_filters()
+
+    def schedule_filters(self):
+        """
+        Filter the stored products on a worker thread after the debounce delay.
+
+        A newer keystroke cancels a pass that has not started yet and makes
+        the result of a running one stale, so only the latest result is shown.
+        """
+        product_filter = self._read_filter_criteria()
+        self.active_filter = product_filter
+        revision = self.product_store.revision
+        candidates = self.filter_engine.candidates(product_filter)
+        self.filter_worker.submit(
+            lambda: product_filter.apply(candidates),
+            lambda matches: self._show_products(matches, product_filter, revision),
+            self._show_error,
+        )
 
     def apply_filters(self):
         """
-        Apply all active filters to the product list using ProductController methods.
+        Apply all active filters to the stored products right away.
+        """
+        # A direct refresh supersedes any filtering still waiting on the worker
+        self.filter_worker.cancel()
+        self.active_filter = self._read_filter_criteria()
+        self._redisplay()
+
+    def _read_filter_criteria(self):
+        """
+        Read the filter inputs; must run on the Tk thread.
+
+        :return: ProductFilter built from the search and filter inputs.
         """
         # Get search term
         search_term = self.search_entry.get().strip()
@@ -404,39 +644,30 @@ class TkinterApp:
         except ValueError:
             max_qty = None
 
-        # Apply filters in sequence using ProductController methods
-        if search_term:
-            # Use search functionality
-            products = self.product_controller.search_products(search_term)
-        else:
-            # Start with status filter
-            products = self.product_controller.get_products_by_status(purchased_filter)
-
-        # Apply quantity range filter
-        if search_term:
-            # If search was used, apply additional filters manually using list comprehensions
-            if purchased_filter is not None:
-                products = [p for p in products if p.purchased == purchased_filter]
-            if max_qty is not None:
-                products = [p for p in products if min_qty <= p.quantity <= max_qty]
-            else:
-                products = [p for p in products if p.quantity >= min_qty]
-        else:
-            # Use quantity range filter from controller
-            quantity_filtered = self.product_controller.get_products_by_quantity_range(
-                min_qty, max_qty
-            )
-            # Intersect with status filtered products
-            product_ids = {p.id for p in products}
-            products = [p for p in quantity_filtered if p.id in product_ids]
+        return ProductFilter(search_term, purchased_filter, min_qty, max_qty)
+
+    def _show_products(self, products, product_filter, revision):
+        """
+        Display a filter result, unless a newer filter was applied meanwhile.
 
+        :param products: The products to display.
+        :param product_filter: Filter the result was computed for.
+        :param revision: Store revision the filtered products were taken at.
+        """
+        if self.active_filter != product_filter:
+            return
+        if revision != self.product_store.revision:
+            # The store changed while the worker was filtering; the result
+            # may miss an added product or still show a removed one
+            self._redisplay()
+            return
+        self.filter_engine.remember(product_filter, products, revision)
         # Update the display
         self.update_product_display(products)
-        self.current_filter_mode = "filtered"
 
     def show_low_stock(self):
         """
-        Show products with low stock using the ProductController method.
+        Show products with low stock.
         """
         try:
             threshold_text = self.low_stock_entry.get().strip()
@@ -444,9 +675,9 @@ class TkinterApp:
         except ValueError:
             threshold = 5
 
-        low_stock_products = self.product_controller.get_low_stock_products(threshold)
-        self.update_product_display(low_stock_products)
-        self.current_filter_mode = "low_stock"
+        self.filter_worker.cancel()
+        self.active_filter = ProductFilter.low_stock(threshold)
+        self._redisplay()
 
     def clear_filters(self):
         """
@@ -458,35 +689,56 @@ class TkinterApp:
         self.max_qty_entry.delete(0, ctk.END)
         self.low_stock_entry.delete(0, ctk.END)
         self.low_stock_entry.insert(0, "5")  # Reset to default
-        self.current_filter_mode = "all"
-        self.refresh_product_list()
+        self.filter_worker.cancel()
+        self.active_filter = ProductFilter()
+        self._redisplay()
 
     def update_product_display(self, products):
         """
         Update the product list display with filtered products.
 
+        Rows are reconciled by product id and version, so only products that
+        appeared, disappeared or changed since the last refresh are formatted
+        and touched in the list.
+
         :param products: List of products to display.
         """
-        self.product_list.delete(0, ctk.END)
-        self.product_map.clear()  # Use generator to efficiently process product names
-        product_names_gen = self.product_controller.get_product_names_generator()
-        # Convert generator to list for demonstration (but don't store unused)
-        list(product_names_gen)
-
+        displayed_rows = {}
+        changed_ids = set()
         for product in products:
-            purchase_status = get_purchase_status(product.purchased)
-            name_display = (
-                product.name if len(product.name) <= 40 else product.name[:40] + "..."
-            )  # Add low stock indicator
-            low_stock_indicator = " ⚠️ LOW STOCK" if product.quantity < 5 else ""
-            display_value = f"- Name: {name_display} | Quantity: {product.quantity} | Status: {purchase_status}{low_stock_indicator}"
-            self.product_list.insert(ctk.END, display_value)
-            self.product_map[display_value] = product.id
+            shown = self._displayed_rows.get(product.id)
+            if shown is not None and shown[0] == product.version:
+                displayed_rows[product.id] = shown
+            else:
+                displayed_rows[product.id] = (
+                    product.version,
+                    self._format_product_row(product),
+                )
+                changed_ids.add(product.id)
+
+        self.product_list.reconcile(
+            list(displayed_rows), changed_ids, lambda key: displayed_rows[key][1]
+        )
+        self._displayed_rows = displayed_rows
+        self.product_list.deselect_all()
 
         # Update button states
         self.selected_product_id = None
-        self.update_button.configure(state=ctk.DISABLED)
-        self.remove_button.configure(state=ctk.DISABLED)
+        self._set_edit_buttons_state(ctk.DISABLED)
+
+    def _format_product_row(self, product):
+        """
+        Build the list row shown for a product.
+
+        :param product: The product to display.
+        :return: The row text.
+        """
+        purchase_status = get_purchase_status(product.purchased)
+        name_display = (
+            product.name if len(product.name) <= 40 else product.name[:40] + "..."
+        )  # Add low stock indicator
+        low_stock_indicator = " ⚠️ LOW STOCK" if product.quantity < 5 else ""
+        return f"- Name: {name_display} | Quantity: {product.quantity} | Status: {purchase_status}{low_stock_indicator}"
 
     def fix_name(self):
         """
@@ -497,45 +749,109 @@ class TkinterApp:
             messagebox.showwarning("Warning", "Please enter a product name first.")
             return
 
-        try:
-            # Use advanced AI analysis
-            suggestions_analysis = self.product_controller.check_name_for_suggestions(
-                current_name
+        # Use advanced AI analysis
+        self._run_async(
+            self.async_controller.check_name_for_suggestions(current_name),
+            lambda analysis: self._on_name_checked(current_name, analysis),
+            self._show_fix_name_error,
+        )
+
+    def _on_name_checked(self, current_name: str, suggestions_analysis: dict):
+        """
+        Continue fixing a name once its suggestions are known.
+
+        :param current_name: The name being fixed.
+        :param suggestions_analysis: Result of check_name_for_suggestions.
+        """
+        if suggestions_analysis["has_any_suggestions"]:
+            # Show AI suggestions dialog
+            self._show_smart_ai_suggestions_dialog(current_name, suggestions_analysis)
+        else:
+            # No suggestions found, just normalize normally
+            self._run_async(
+                self.async_controller.normalize_product_name(current_name),
+                lambda info: self._on_name_normalized(current_name, info),
+                self._show_fix_name_error,
             )
 
-            if suggestions_analysis["has_any_suggestions"]:
-                # Show AI suggestions dialog
-                self._show_smart_ai_suggestions_dialog(
-                    current_name, suggestions_analysis
-                )
-            else:
-                # No suggestions found, just normalize normally
-                normalization_info = self.product_controller.normalize_product_name(
-                    current_name
-                )
+    def _on_name_normalized(self, current_name: str, normalization_info: dict):
+        """
+        Show the normalized name and offer to update the selected product.
 
-                if normalization_info["improved"]:
-                    self.name_entry.delete(0, ctk.END)
-                    self.name_entry.insert(0, normalization_info["normalized"])
+        :param current_name: The name being fixed.
+        :param normalization_info: Result of normalize_product_name.
+        """
+        if normalization_info["improved"]:
+            self.name_entry.delete(0, ctk.END)
+            self.name_entry.insert(0, normalization_info["normalized"])
 
-                    changes = ", ".join(normalization_info["changes"])
-                    message = f"✨ Name improved!\n\nBefore: '{normalization_info['original']}'\nAfter: '{normalization_info['normalized']}'\n\nChanges: {changes}"
+            changes = ", ".join(normalization_info["changes"])
+            message = f"✨ Name improved!\n\nBefore: '{normalization_info['original']}'\nAfter: '{normalization_info['normalized']}'\n\nChanges: {changes}"
 
-                    if self.selected_product_id:
-                        message += "\n\nUpdate this product now?"
-                        result = messagebox.askyesno("AI Name Fix", message)
-                        if result:
-                            self.update_product()
-                            return
+            if self.selected_product_id:
+                message += "\n\nUpdate this product now?"
+                result = messagebox.askyesno("AI Name Fix", message)
+                if result:
+                    self.update_product()
+                    return
 
-                    messagebox.showinfo("AI Name Fix", message)
-                else:
-                    messagebox.showinfo(
-                        "AI Name Fix", f"✅ Name '{current_name}' is already perfect!"
-                    )
+            messagebox.showinfo("AI Name Fix", message)
+        else:
+            messagebox.showinfo(
+                "AI Name Fix", f"✅ Name '{current_name}' is already perfect!"
+            )
+
+    def _show_fix_name_error(self, error):
+        """
+        Report a failed name fix.
+
+        :param error: The raised exception.
+        """
+        messagebox.showerror("Error", f"Failed to fix name: {str(error)}")
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to fix name: {str(e)}")
+    def _learn_typo(self, typo: str, correct: str):
+        """
+        Teach a typo correction on the worker thread.
+
+        Later controller calls run after it, so they already use the correction.
+
+        :param typo: Incorrect word.
+        :param correct: Correct word.
+        """
+        self._run_async(
+            self.async_controller.add_learned_typo(typo, correct), lambda result: None
+        )
+
+    def _on_corrections_normalized(
+        self, original_name: str, normalization_info: dict, learn_msg: str = ""
+    ):
+        """
+        Put a corrected name into the name field and report the change.
+
+        :param original_name: Name before the corrections.
+        :param normalization_info: Normalization of the corrected name.
+        :param learn_msg: Summary of the learned corrections, shown first.
+        """
+        final_name = normalization_info["normalized"]
+
+        # Update name field
+        self.name_entry.delete(0, ctk.END)
+        self.name_entry.insert(0, final_name)
+
+        # Show result and ask about auto-update
+        if final_name != original_name:
+            message = f"{learn_msg}✨ AI applied corrections!\n\nBefore: '{original_name}'\nAfter: '{final_name}'"
+
+            if self.selected_product_id:
+                message += "\n\nUpdate this product now?"
+                result = messagebox.askyesno("AI Corrections Applied", message)
+                if result:
+                    self.update_product()
+                    return
+
+            messagebox.showinfo("AI Corrections Applied", message)
+        else:
+            messagebox.showinfo("AI Corrections", "No corrections were applied.")
 
     def _show_smart_ai_suggestions_dialog(self, original_name: str, analysis: dict):
         """
@@ -670,22 +986,12 @@ class TkinterApp:
                         # Track what AI learned
                         if chosen != word_lower:
                             learned_corrections.append(f"'{word_lower}' → '{chosen}'")
-                            self.product_controller.add_learned_typo(word_lower, chosen)
+                            self._learn_typo(word_lower, chosen)
                 else:
                     corrected_words.append(word)
 
             corrected_name = " ".join(corrected_words)
 
-            # Apply proper capitalization
-            normalization_info = self.product_controller.normalize_product_name(
-                corrected_name
-            )
-            final_name = normalization_info["normalized"]
-
-            # Update name field
-            self.name_entry.delete(0, ctk.END)
-            self.name_entry.insert(0, final_name)
-
             dialog.destroy()
 
             # Show what AI learned if any
@@ -694,20 +1000,13 @@ class TkinterApp:
             else:
                 learn_msg = ""
 
-            # Show result and ask about auto-update
-            if final_name != original_name:
-                message = f"{learn_msg}✨ AI applied corrections!\n\nBefore: '{original_name}'\nAfter: '{final_name}'"
-
-                if self.selected_product_id:
-                    message += "\n\nUpdate this product now?"
-                    result = messagebox.askyesno("AI Corrections Applied", message)
-                    if result:
-                        self.update_product()
-                        return
-
-                messagebox.showinfo("AI Corrections Applied", message)
-            else:
-                messagebox.showinfo("AI Corrections", "No corrections were applied.")
+            # Apply proper capitalization once the corrections are learned
+            self._run_async(
+                self.async_controller.normalize_product_name(corrected_name),
+                lambda normalization_info: self._on_corrections_normalized(
+                    original_name, normalization_info, learn_msg
+                ),
+            )
 
         def cancel():
             dialog.destroy()
@@ -810,38 +1109,21 @@ class TkinterApp:
                         corrected_words.append(chosen)
                         # Learn this correction for future use
                         if chosen != word_lower:
-                            self.product_controller.add_learned_typo(word_lower, chosen)
+                            self._learn_typo(word_lower, chosen)
                 else:
                     corrected_words.append(word)
 
             corrected_name = " ".join(corrected_words)
 
-            # Apply proper capitalization
-            normalization_info = self.product_controller.normalize_product_name(
-                corrected_name
-            )
-            final_name = normalization_info["normalized"]
-
-            # Update name field
-            self.name_entry.delete(0, ctk.END)
-            self.name_entry.insert(0, final_name)
-
             dialog.destroy()
 
-            # Show result and ask about auto-update
-            if final_name != original_name:
-                message = f"✨ AI applied corrections!\n\nBefore: '{original_name}'\nAfter: '{final_name}'"
-
-                if self.selected_product_id:
-                    message += "\n\nUpdate this product now?"
-                    result = messagebox.askyesno("AI Corrections Applied", message)
-                    if result:
-                        self.update_product()
-                        return
-
-                messagebox.showinfo("AI Corrections Applied", message)
-            else:
-                messagebox.showinfo("AI Corrections", "No corrections were applied.")
+            # Apply proper capitalization once the corrections are learned
+            self._run_async(
+                self.async_controller.normalize_product_name(corrected_name),
+                lambda normalization_info: self._on_corrections_normalized(
+                    original_name, normalization_info
+                ),
+            )
 
         def cancel():
             dialog.destroy()
@@ -986,7 +1268,7 @@ class TkinterApp:
                         # Track what AI learned
                         if chosen != word_lower:
                             learned_corrections.append(f"'{word_lower}' → '{chosen}'")
-                            self.product_controller.add_learned_typo(word_lower, chosen)
+                            self._learn_typo(word_lower, chosen)
                 else:
                     corrected_words.append(word)
 
@@ -1093,13 +1375,19 @@ class TkinterApp:
                 )
                 return
 
-            try:
-                self.product_controller.add_learned_typo(typo, correct)
+            def on_learned(result):
                 messagebox.showinfo("Success", f"✅ AI learned: '{typo}' → '{correct}'")
                 dialog.destroy()
-            except Exception as e:
+
+            def on_learn_failed(e):
                 messagebox.showerror("Error", f"Failed to add correction: {str(e)}")
 
+            self._run_async(
+                self.async_controller.add_learned_typo(typo, correct),
+                on_learned,
+                on_learn_failed,
+            )
+
         def cancel():
             dialog.destroy()  # Buttons
 
@@ -0,0 +1,78 @@
+from typing import Any, Iterable, List, Optional
+
+
+class WidgetPool:
+    """
+    Free-list of hidden widgets kept for reuse.
+
+    Creating a Tk widget costs far more than reconfiguring an existing one,
+    so widgets that leave the screen are parked here instead of destroyed.
+    Once the pool sits unused for ``trim_ms``, spares beyond ``keep`` are
+    destroyed so a one-off large list does not hold its widgets forever.
+    """
+
+    def __init__(self, widget: Any, keep: int = 20, trim_ms: int = 5000):
+        """
+        Initialize an empty pool.
+
+        :param widget: Any Tk widget, used for ``after`` scheduling.
+        :param keep: Number of spares that survive an idle trim.
+        :param trim_ms: Idle time after the last release before trimming.
+        """
+        self._widget = widget
+        self.keep = keep
+        self.trim_ms = trim_ms
+        self._spares: List[Any] = []
+        self._trim_job: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._spares)
+
+    def take(self) -> Optional[Any]:
+        """
+        Take a spare widget out of the pool.
+
+        :return: A hidden widget to reconfigure, or None if the pool is empty.
+        """
+        if not self._spares:
+            return None
+        return self._spares.pop()
+
+    def release(self, item: Any) -> None:
+        """
+        Park a widget that the caller has already hidden.
+
+        :param item: The widget to keep for reuse.
+        """
+        self.release_many([item])
+
+    def release_many(self, items: Iterable[Any]) -> None:
+        """
+        Park several hidden widgets, restarting the idle timer only once.
+
+        :param items: The widgets to keep for reuse.
+        """
+        self._spares.extend(items)
+        # Every release restarts the idle timer
+        if self._trim_job is not None:
+            self._widget.after_cancel(self._trim_job)
+        self._trim_job = self._widget.after(self.trim_ms, self.trim)
+
+    def trim(self, keep: Optional[int] = None) -> None:
+        """
+        Destroy spares down to a number to keep.
+
+        :param keep: Spares to keep; defaults to the pool's ``keep``.
+        """
+        self._trim_job = None
+        limit = self.keep if keep is None else keep
+        while len(self._spares) > limit:
+            self._spares.pop().destroy()
+
+    def clear(self) -> None:
+        """
+        Stop the idle timer and destroy every spare.
+        """
+        if self._trim_job is not None:
+            self._widget.after_cancel(self._trim_job)
+        self.trim(0)
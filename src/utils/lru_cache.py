@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    Bounded mapping that evicts the least recently used entry when full.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Create an empty cache.
+
+        :param maxsize: Maximum number of entries kept.
+        :raises ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be a positive integer.")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Return a cached value and mark it as recently used.
+
+        :param key: Cache key.
+        :return: The cached value, or None if the key is not cached.
+        """
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        Cache a value, evicting the least recently used entry if full.
+
+        :param key: Cache key.
+        :param value: Value to cache.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        self._entries.clear()
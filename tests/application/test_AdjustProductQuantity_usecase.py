@@ -0,0 +1,54 @@
+import pytest
+from src.application.usecases.AdjustProductQuantity import AdjustProductQuantity
+from src.infrastructure.InMemoryProductRepository import InMemoryProductRepository
+from src.domain.Product_Entity import _Product
+
+
+@pytest.fixture
+def product_repository():
+    return InMemoryProductRepository()
+
+
+@pytest.fixture
+def adjust_quantity_use_case(product_repository):
+    return AdjustProductQuantity(product_repository)
+
+
+def test_increase_quantity(adjust_quantity_use_case, product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    updated_product = adjust_quantity_use_case.execute(product.id, 2)
+
+    assert updated_product.quantity == 12
+    assert updated_product.version == 2
+
+
+def test_decrease_quantity(adjust_quantity_use_case, product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    updated_product = adjust_quantity_use_case.execute(product.id, -9)
+
+    assert updated_product.quantity == 1
+
+
+def test_decrease_quantity_below_one(adjust_quantity_use_case, product_repository):
+    product = _Product(name="Test Product", quantity=1)
+    product_repository.add_product(product)
+
+    with pytest.raises(ValueError, match="Quantity must be positive"):
+        adjust_quantity_use_case.execute(product.id, -1)
+    assert product_repository.get_product_by_id(product.id).quantity == 1
+
+
+def test_adjust_quantity_zero_delta(adjust_quantity_use_case):
+    with pytest.raises(ValueError, match="non-zero integer"):
+        adjust_quantity_use_case.execute("any_id", 0)
+
+
+def test_adjust_quantity_nonexistent_product(adjust_quantity_use_case):
+    with pytest.raises(
+        ValueError, match="Product with id nonexistent_id does not exist."
+    ):
+        adjust_quantity_use_case.execute("nonexistent_id", 1)
@@ -0,0 +1,43 @@
+import pytest
+from src.application.usecases.SetProductPurchased import SetProductPurchased
+from src.infrastructure.InMemoryProductRepository import InMemoryProductRepository
+from src.domain.Product_Entity import _Product
+
+
+@pytest.fixture
+def product_repository():
+    return InMemoryProductRepository()
+
+
+@pytest.fixture
+def set_purchased_use_case(product_repository):
+    return SetProductPurchased(product_repository)
+
+
+def test_set_purchased(set_purchased_use_case, product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    updated_product = set_purchased_use_case.execute(product.id, True)
+
+    assert updated_product.purchased is True
+    assert updated_product.version == 2
+
+
+def test_set_purchased_unchanged_keeps_version(
+    set_purchased_use_case, product_repository
+):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    updated_product = set_purchased_use_case.execute(product.id, False)
+
+    assert updated_product.purchased is False
+    assert updated_product.version == 1
+
+
+def test_set_purchased_nonexistent_product(set_purchased_use_case):
+    with pytest.raises(
+        ValueError, match="Product with id nonexistent_id does not exist."
+    ):
+        set_purchased_use_case.execute("nonexistent_id", True)
@@ -1,8 +1,10 @@
 import pytest
+from unittest.mock import Mock
 from src.application.usecases.UpdateProduct import UpdateProduct
 from src.infrastructure.InMemoryProductRepository import InMemoryProductRepository
 from src.application.dto.ProductDTO import ProductDTO
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 
 
 @pytest.fixture
@@ -57,3 +59,31 @@ def test_update_product_empty_name(update_product_use_case, product_repository):
     with pytest.raises(ValueError, match="Product name cannot be empty."):
         product_dto = ProductDTO(id=product.id, name="", quantity=20, purchased=True)
         update_product_use_case.execute(product_dto)
+
+
+def test_update_product_without_changes_skips_repository(product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+    repository = Mock(wraps=product_repository)
+    use_case = UpdateProduct(repository)
+
+    product_dto = ProductDTO(
+        id=product.id, name="Test Product", quantity=10, purchased=False
+    )
+    result = use_case.execute(product_dto)
+
+    assert result is product
+    repository.update_product.assert_not_called()
+
+
+def test_update_product_with_stale_version(update_product_use_case, product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+    update_product_use_case.execute(
+        ProductDTO(id=product.id, name="First Edit", quantity=10, version=1)
+    )
+
+    with pytest.raises(ProductConflictError):
+        update_product_use_case.execute(
+            ProductDTO(id=product.id, name="Second Edit", quantity=10, version=1)
+        )
@@ -40,3 +40,18 @@ def test_quantity_must_be_positive():
 def test_name_must_not_be_empty():
     with pytest.raises(ValueError, match="Product name cannot be empty."):
         _Product(name="", quantity=10)
+
+
+def test_new_product_is_dirty(product):
+    assert product.dirty_fields == {"name", "quantity", "purchased"}
+
+
+def test_mark_clean_and_track_changes(product):
+    product.mark_clean()
+    assert not product.is_dirty
+
+    product.quantity = 10  # same value, not a change
+    assert not product.is_dirty
+
+    product.purchased = True
+    assert product.dirty_fields == {"purchased"}
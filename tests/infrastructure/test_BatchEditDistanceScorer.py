@@ -0,0 +1,53 @@
+import pytest
+from src.infrastructure.text.BatchEditDistanceScorer import (
+    NUMPY_AVAILABLE,
+    BatchEditDistanceScorer,
+)
+
+WORDS = ["mleko", "masło", "chleb", "kiełbasa", "ser", "mleczko"]
+
+backends = [
+    pytest.param(False, id="python"),
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed"),
+    ),
+]
+
+
+@pytest.fixture(params=backends)
+def scorer(request):
+    scorer = BatchEditDistanceScorer(use_numpy=request.param)
+    for word in WORDS:
+        scorer.add(word)
+    return scorer
+
+
+def test_lookup(scorer):
+    assert scorer.lookup("mleko") == [("mleko", 0), ("mleczko", 2)]
+    assert scorer.lookup("mlko") == [("mleko", 1)]
+    assert scorer.lookup("kielbsa") == [("kiełbasa", 2)]
+    assert scorer.lookup("sr") == [("ser", 1)]
+
+
+def test_lookup_respects_max_distance(scorer):
+    assert scorer.lookup("kielbsa", max_distance=1) == []
+    assert scorer.lookup("xyz") == []
+
+
+def test_added_words_are_scored(scorer):
+    scorer.lookup("mleko", max_distance=1)
+    scorer.add("mlekoo")
+
+    assert scorer.lookup("mleko", max_distance=1) == [("mleko", 0), ("mlekoo", 1)]
+    assert len(scorer) == 7
+
+
+def test_numpy_required_when_requested(monkeypatch):
+    monkeypatch.setattr(
+        "src.infrastructure.text.BatchEditDistanceScorer.NUMPY_AVAILABLE", False
+    )
+
+    with pytest.raises(ValueError, match="NumPy is not installed"):
+        BatchEditDistanceScorer(use_numpy=True)
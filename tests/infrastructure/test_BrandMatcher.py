@@ -0,0 +1,40 @@
+from src.infrastructure.text.BrandMatcher import BrandMatcher
+
+
+class TestBrandMatcher:
+    """Unit tests for BrandMatcher."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.matcher = BrandMatcher(
+            {"coca cola": "Coca-Cola", "cola": "Cola", "pepsi": "Pepsi"}
+        )
+
+    def test_replace_all_brands_in_one_pass(self):
+        """Test that every brand in the text is standardized."""
+        assert self.matcher.replace("COCA COLA i pepsi") == "Coca-Cola i Pepsi"
+
+    def test_longest_brand_wins(self):
+        """Test that a brand inside a longer brand is not replaced separately."""
+        assert self.matcher.replace("coca cola zero") == "Coca-Cola zero"
+        assert self.matcher.replace("cola zero") == "Cola zero"
+
+    def test_word_boundaries(self):
+        """Test that brands inside other words are left alone."""
+        assert self.matcher.replace("pepsico") == "pepsico"
+        assert self.matcher.replace("pepsi, cola") == "Pepsi, Cola"
+
+    def test_flexible_whitespace(self):
+        """Test that multi-word brands match any whitespace between words."""
+        assert self.matcher.replace("coca   cola") == "Coca-Cola"
+
+    def test_add_brand(self):
+        """Test that added brands are matched."""
+        self.matcher.add_brand("Danone", "Danone")
+
+        assert self.matcher.replace("jogurt danone") == "jogurt Danone"
+        assert self.matcher.brands["danone"] == "Danone"
+
+    def test_no_brands(self):
+        """Test that text is only lower-cased without brands."""
+        assert BrandMatcher().replace("Pepsi") == "pepsi"
@@ -194,3 +194,34 @@ class TestDatabaseService:
             "INSERT INTO products (id, name) VALUES (%(id)s, %(name)s)",
             {"id": "test-id", "name": "Test Product"},
         )
+
+    @patch("src.infrastructure.services.DatabaseService.psycopg")
+    def test_unit_of_work_shares_connection_and_transaction(self, mock_psycopg):
+        """Test that commands inside a unit of work use one transaction."""
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 1
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_psycopg.connect.return_value = mock_connection
+
+        with self.db_service.unit_of_work():
+            self.db_service.execute_query("SELECT 1")
+            self.db_service.execute_command("DELETE FROM products")
+            with self.db_service.unit_of_work():
+                self.db_service.execute_command("DELETE FROM products")
+
+        mock_psycopg.connect.assert_called_once()
+        mock_connection.transaction.assert_called_once()
+        mock_connection.close.assert_called_once()
+        assert mock_cursor.execute.call_count == 3
+
+    @patch("src.infrastructure.services.DatabaseService.psycopg")
+    def test_unit_of_work_releases_connection_on_error(self, mock_psycopg):
+        """Test that a failed unit of work unbinds its connection."""
+        mock_psycopg.connect.return_value = MagicMock()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            with self.db_service.unit_of_work():
+                raise RuntimeError("boom")
+
+        assert self.db_service._local.connection is None
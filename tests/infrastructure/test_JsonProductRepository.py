@@ -1,7 +1,10 @@
 import pytest
 from src.infrastructure.JsonProductRepository import JsonProductRepository
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 import json
+from unittest.mock import patch
+import os
 
 
 @pytest.fixture
@@ -131,6 +134,19 @@ def test_update_product(product_repository):
     assert retrieved_product.purchased is False
 
 
+def test_update_product_without_changes_keeps_file(product_repository):
+    product = _Product(name="Test Product", quantity=10, purchased=True)
+    product_repository.add_product(product)
+    os.utime(product_repository.file_path, ns=(0, 0))
+
+    unchanged_product = _Product(
+        name="Test Product", quantity=10, id=product.id, purchased=True
+    )
+    product_repository.update_product(unchanged_product)
+
+    assert os.stat(product_repository.file_path).st_mtime_ns == 0
+
+
 def test_update_nonexistent_product(product_repository):
     product = _Product(
         name="Nonexistent Product", quantity=10, id="nonexistent_id", purchased=True
@@ -277,3 +293,66 @@ def test_generators_are_iterators(product_repository):
     assert len(list1) == 1
     assert len(list2) == 1
     assert list1[0].name == list2[0].name
+
+
+def test_update_product_with_stale_version(product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+    first_copy = _Product(name="First", quantity=10, id=product.id)
+    stale_copy = _Product(name="Second", quantity=10, id=product.id)
+
+    product_repository.update_product(first_copy)
+
+    assert product_repository.get_product_by_id(product.id).version == 2
+    with pytest.raises(ProductConflictError):
+        product_repository.update_product(stale_copy)
+
+    reloaded = JsonProductRepository(product_repository.file_path)
+    assert reloaded.get_product_by_id(product.id).name == "First"
+    assert reloaded.get_product_by_id(product.id).version == 2
+
+
+def test_transaction_saves_once_at_commit(product_repository):
+    with patch(
+        "src.infrastructure.JsonProductRepository.json.dump", wraps=json.dump
+    ) as dump:
+        with product_repository.transaction():
+            product_repository.add_product(_Product(name="Product 1", quantity=1))
+            product_repository.add_product(_Product(name="Product 2", quantity=2))
+            assert dump.call_count == 0
+
+    assert dump.call_count == 1
+    reloaded = JsonProductRepository(product_repository.file_path)
+    assert len(reloaded.get_all_products()) == 2
+
+
+def test_transaction_rolls_back_on_error(product_repository):
+    product_repository.add_product(_Product(name="Kept", quantity=1))
+
+    with pytest.raises(RuntimeError):
+        with product_repository.transaction():
+            product_repository.add_product(_Product(name="Discarded", quantity=1))
+            raise RuntimeError("abort")
+
+    names = [p.name for p in product_repository.get_all_products()]
+    assert names == ["Kept"]
+
+
+def test_adjust_quantity_persists(product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    product_repository.adjust_quantity(product.id, -3)
+
+    reloaded = JsonProductRepository(product_repository.file_path)
+    assert reloaded.get_product_by_id(product.id).quantity == 7
+
+
+def test_set_purchased_persists(product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    product_repository.set_purchased(product.id, True)
+
+    reloaded = JsonProductRepository(product_repository.file_path)
+    assert reloaded.get_product_by_id(product.id).purchased is True
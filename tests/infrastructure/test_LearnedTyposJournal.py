@@ -0,0 +1,129 @@
+import gc
+import json
+import os
+import time
+import weakref
+import pytest
+from src.infrastructure.text import LearnedTyposJournal as journal_module
+from src.infrastructure.text.LearnedTyposJournal import (
+    LearnedTyposJournal,
+    _open_journals,
+)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "data" / "learned_typos.json")
+
+
+def test_record_is_buffered_until_flush(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60)
+
+    for i in range(100):
+        journal.record(f"typo{i}", f"word{i}")
+
+    assert journal.fixes["typo99"] == "word99"
+    assert not os.path.exists(journal.journal_path)
+
+    journal.flush()
+
+    with open(journal.journal_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 100
+
+
+def test_debounced_flush_writes_once(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=0.05)
+    journal.record("mlko", "mleko")
+    journal.record("chlb", "chleb")
+
+    deadline = time.time() + 5
+    while journal._pending and time.time() < deadline:
+        time.sleep(0.01)
+
+    with open(journal.journal_path, encoding="utf-8") as f:
+        assert [json.loads(line)["typo"] for line in f] == ["mlko", "chlb"]
+
+
+def test_reload_replays_journal_over_snapshot(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60)
+    journal.record("mlko", "mleko")
+    journal.compact()
+    journal.record("mlko", "mleczko")
+    journal.record("chlb", "chleb")
+    journal.flush()
+
+    reloaded = LearnedTyposJournal(snapshot_path)
+
+    assert reloaded.fixes == {"mlko": "mleczko", "chlb": "chleb"}
+
+
+def test_compaction_after_threshold(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60, compact_threshold=3)
+    for i in range(3):
+        journal.record(f"typo{i}", f"word{i}")
+    journal.flush()
+
+    with open(snapshot_path, encoding="utf-8") as f:
+        assert json.load(f) == {"typo0": "word0", "typo1": "word1", "typo2": "word2"}
+    with open(journal.journal_path, encoding="utf-8") as f:
+        assert f.read() == ""
+
+
+def test_partial_last_line_is_ignored(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60)
+    journal.record("mlko", "mleko")
+    journal.flush()
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"typo": "chl')
+
+    assert LearnedTyposJournal(snapshot_path).fixes == {"mlko": "mleko"}
+
+
+def test_partial_last_line_is_cut_before_new_entries(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60)
+    journal.record("mlko", "mleko")
+    journal.flush()
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"typo": "mlek')
+
+    reopened = LearnedTyposJournal(snapshot_path, flush_delay=60)
+    reopened.record("chlep", "chleb")
+    reopened.flush()
+
+    assert LearnedTyposJournal(snapshot_path).fixes == {
+        "mlko": "mleko",
+        "chlep": "chleb",
+    }
+
+
+def test_exit_hook_does_not_keep_journals_alive(snapshot_path):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60)
+    reference = weakref.ref(journal)
+
+    assert journal in _open_journals
+
+    journal.close()
+
+    assert journal not in _open_journals
+
+    del journal
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_read_only_journal_is_still_replayed(snapshot_path, monkeypatch):
+    journal = LearnedTyposJournal(snapshot_path, flush_delay=60)
+    journal.record("mlko", "mleko")
+    journal.flush()
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"typo": "chl')
+
+    def read_only_open(path, mode="r", *args, **kwargs):
+        if mode != "rb" and path == journal.journal_path:
+            raise PermissionError(path)
+        return open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(journal_module, "open", read_only_open, raising=False)
+
+    assert LearnedTyposJournal(snapshot_path).fixes == {"mlko": "mleko"}
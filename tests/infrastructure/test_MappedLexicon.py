@@ -0,0 +1,62 @@
+import pytest
+from src.infrastructure.text.MappedLexicon import MappedLexicon
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    path = str(tmp_path / "lexicon.lex")
+    MappedLexicon.build(
+        path,
+        [
+            ("mleko", ""),
+            ("mlko", "mleko"),
+            ("masło", ""),
+            ("maslo", "masło"),
+            ("mlko", "mleczko"),
+        ],
+    )
+    with MappedLexicon(path) as lexicon:
+        yield lexicon
+
+
+def test_get(lexicon):
+    assert lexicon.get("mleko") == "mleko"
+    assert lexicon.get("maslo") == "masło"
+    assert lexicon.get("chleb") is None
+
+
+def test_later_duplicates_win(lexicon):
+    assert lexicon.get("mlko") == "mleczko"
+    assert len(lexicon) == 4
+
+
+def test_contains(lexicon):
+    assert "masło" in lexicon
+    assert "ser" not in lexicon
+    assert 42 not in lexicon
+
+
+def test_items_with_prefix(lexicon):
+    assert list(lexicon.items_with_prefix("ma")) == [
+        ("maslo", "masło"),
+        ("masło", "masło"),
+    ]
+    assert len(list(lexicon.items_with_prefix(""))) == 4
+    assert list(lexicon.items_with_prefix("x")) == []
+
+
+def test_empty_lexicon(tmp_path):
+    path = str(tmp_path / "empty.lex")
+    MappedLexicon.build(path, [])
+
+    with MappedLexicon(path) as lexicon:
+        assert len(lexicon) == 0
+        assert lexicon.get("mleko") is None
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "products.json"
+    path.write_text("[]" * 20)
+
+    with pytest.raises(ValueError, match="not a lexicon file"):
+        MappedLexicon(str(path))
@@ -4,7 +4,9 @@ from src.infrastructure.database.PostgreSQLProductRepository import (
     PostgreSQLProductRepository,
 )
 from src.infrastructure.services.DatabaseService import DatabaseService
+from src.infrastructure.mappers.ProductMapper import ProductMapper
 from src.domain.Product_Entity import _Product
+from src.domain.ProductConflictError import ProductConflictError
 
 
 class TestPostgreSQLProductRepository:
@@ -137,6 +139,58 @@ class TestPostgreSQLProductRepository:
         assert "UPDATE products" in call_args[0][0]
         assert call_args[0][1]["id"] == "test-id-123"
 
+    def test_update_product_writes_only_dirty_columns(self):
+        """Test that toggling purchased becomes a one-column UPDATE."""
+        self.sample_product.mark_clean()
+        self.sample_product.purchased = True
+        self.mock_db_service.execute_command.return_value = 1
+
+        self.repository.update_product(self.sample_product)
+
+        update_sql, params = self.mock_db_service.execute_command.call_args[0]
+        assert "purchased = %(purchased)s" in update_sql
+        assert "name =" not in update_sql
+        assert "quantity =" not in update_sql
+        assert params == {"purchased": True, "id": "test-id-123", "version": 1}
+        assert not self.sample_product.is_dirty
+
+    def test_update_product_checks_version_in_single_round_trip(self):
+        """Test that the update is guarded by the version without a pre-read."""
+        self.mock_db_service.execute_command.return_value = 1
+
+        self.repository.update_product(self.sample_product)
+
+        update_sql = self.mock_db_service.execute_command.call_args[0][0]
+        assert "AND version = %(version)s" in update_sql
+        assert "version = version + 1" in update_sql
+        self.mock_db_service.execute_query.assert_not_called()
+        assert self.sample_product.version == 2
+
+    def test_update_product_version_conflict(self):
+        """Test that a stale version raises a conflict error."""
+        self.mock_db_service.execute_command.return_value = 0
+        self.mock_db_service.execute_query.return_value = [
+            {
+                "id": "test-id-123",
+                "name": "Changed Elsewhere",
+                "quantity": 5,
+                "purchased": False,
+                "version": 2,
+            }
+        ]
+
+        with pytest.raises(ProductConflictError):
+            self.repository.update_product(self.sample_product)
+
+    def test_update_product_without_changes_skips_database(self):
+        """Test that a clean product is not written at all."""
+        self.sample_product.mark_clean()
+
+        self.repository.update_product(self.sample_product)
+
+        self.mock_db_service.execute_query.assert_not_called()
+        self.mock_db_service.execute_command.assert_not_called()
+
     def test_update_product_not_found(self):
         """Test update when product doesn't exist."""
         # Mock that product doesn't exist (for existence check)
@@ -184,6 +238,104 @@ class TestPostgreSQLProductRepository:
         ):
             self.repository.remove_product("non-existent")
 
+    def test_get_all_products_direct_hydration(self):
+        """Test that direct hydration passes the product row factory."""
+        repository = PostgreSQLProductRepository(
+            self.mock_db_service, direct_hydration=True
+        )
+        self.mock_db_service.execute_query.return_value = [self.sample_product]
+
+        products = repository.get_all_products()
+
+        assert products == [self.sample_product]
+        call_args = self.mock_db_service.execute_query.call_args
+        assert call_args.kwargs["row_factory"] is ProductMapper.product_row_factory
+        assert "created_at," not in call_args[0][0]
+        assert "updated_at" not in call_args[0][0]
+
+    def test_get_product_by_id_direct_hydration_not_found(self):
+        """Test direct hydration when ID doesn't exist."""
+        repository = PostgreSQLProductRepository(
+            self.mock_db_service, direct_hydration=True
+        )
+        self.mock_db_service.execute_query.return_value = []
+
+        assert repository.get_product_by_id("non-existent-id") is None
+
+    def test_product_row_factory_maps_columns_by_name(self):
+        """Test that the row factory resolves positions from the description."""
+        cursor = Mock()
+        cursor.description = [Mock(), Mock(), Mock(), Mock(), Mock()]
+        for column, name in zip(
+            cursor.description, ["version", "purchased", "quantity", "name", "id"]
+        ):
+            column.name = name
+
+        make_row = ProductMapper.product_row_factory(cursor)
+        product = make_row((4, True, 3, "Mleko", "id-1"))
+
+        assert product == _Product(
+            id="id-1", name="Mleko", quantity=3, purchased=True, version=4
+        )
+        assert not product.is_dirty
+
+    def test_product_row_factory_missing_column(self):
+        """Test that the row factory rejects incomplete result sets."""
+        cursor = Mock()
+        column = Mock()
+        column.name = "id"
+        cursor.description = [column]
+
+        with pytest.raises(ValueError, match="missing columns"):
+            ProductMapper.product_row_factory(cursor)
+
+    def test_adjust_quantity_is_single_atomic_statement(self):
+        """Test that quantity changes run server-side with RETURNING."""
+        self.mock_db_service.execute_returning.return_value = [
+            {
+                "id": "test-id-123",
+                "name": "Test Product",
+                "quantity": 6,
+                "purchased": False,
+                "version": 2,
+            }
+        ]
+
+        product = self.repository.adjust_quantity("test-id-123", 1)
+
+        command, params = self.mock_db_service.execute_returning.call_args[0]
+        assert "quantity = quantity + %(delta)s" in command
+        assert "RETURNING" in command
+        assert params == {"product_id": "test-id-123", "delta": 1}
+        self.mock_db_service.execute_query.assert_not_called()
+        assert product.quantity == 6
+        assert product.version == 2
+
+    def test_adjust_quantity_below_one(self):
+        """Test that a change leaving no stock is rejected."""
+        self.mock_db_service.execute_returning.return_value = []
+        self.mock_db_service.execute_query.return_value = [
+            {
+                "id": "test-id-123",
+                "name": "Test Product",
+                "quantity": 1,
+                "purchased": False,
+            }
+        ]
+
+        with pytest.raises(ValueError, match="Quantity must be positive"):
+            self.repository.adjust_quantity("test-id-123", -1)
+
+    def test_set_purchased_not_found(self):
+        """Test set_purchased when ID doesn't exist."""
+        self.mock_db_service.execute_returning.return_value = []
+        self.mock_db_service.execute_query.return_value = []
+
+        with pytest.raises(
+            ValueError, match="Product with id non-existent does not exist"
+        ):
+            self.repository.set_purchased("non-existent", True)
+
 
 @pytest.mark.integration
 class TestPostgreSQLIntegration:
@@ -0,0 +1,188 @@
+import pytest
+from src.infrastructure.services.ProductNameNormalizationService import (
+    ProductNameNormalizationService,
+)
+from src.infrastructure.text.MappedLexicon import MappedLexicon
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ProductNameNormalizationService()
+
+
+def test_find_typo_suggestions_direct_match(service):
+    assert service.find_typo_suggestions("mlko") == [("mleko", 1.0)]
+
+
+def test_find_typo_suggestions_fuzzy_match(service):
+    suggestions = service.find_typo_suggestions("czosnk")
+
+    assert suggestions[0][0] == "czosnek"
+    assert suggestions[0][1] > 0.8
+
+
+def test_find_typo_suggestions_no_match(service):
+    assert service.find_typo_suggestions("xyz") == []
+
+
+def test_add_learned_typo_updates_suggestions(service):
+    assert service.find_typo_suggestions("szynkaa") == []
+
+    service.add_learned_typo("szynak", "szynka")
+
+    assert service.find_typo_suggestions("szynkaa")[0][0] == "szynka"
+    assert service.find_typo_suggestions("szynak") == [("szynka", 1.0)]
+
+
+def test_has_potential_typos(service):
+    assert service.has_potential_typos("czosnk i cbula") is True
+    assert service.has_potential_typos("woda") is False
+
+
+def test_add_brand(service):
+    service.add_brand("Tymbark", "Tymbark")
+
+    assert service._fix_brands("sok tymbark") == "sok Tymbark"
+    assert service.brands["tymbark"] == "Tymbark"
+
+
+def test_normalize_name_records_changes(service):
+    result = service.normalize_name("  mlko   i chlb ")
+
+    assert result["normalized"] == "Mleko i Chleb"
+    assert result["improved"] is True
+    assert result["changes"] == [
+        "Fixed spacing",
+        "Fixed typos",
+        "Fixed capitalization",
+    ]
+
+
+def test_normalize_name_is_cached(service, monkeypatch):
+    first = service.normalize_name("mlko")
+    first["changes"].append("modified by caller")
+
+    monkeypatch.setattr(
+        service, "_fix_typos", lambda text: pytest.fail("cache was bypassed")
+    )
+    second = service.normalize_name("mlko")
+
+    assert second["normalized"] == "Mleko"
+    assert "modified by caller" not in second["changes"]
+
+
+def test_normalize_name_cache_invalidated_by_learning(service):
+    assert service.normalize_name("mlekko")["normalized"] == "Mlekko"
+
+    service.add_learned_typo("mlekko", "mleko")
+
+    assert service.normalize_name("mlekko")["normalized"] == "Mleko"
+
+
+def test_normalize_names_sequential(service):
+    results = list(service.normalize_names(["mlko", "chlb"]))
+
+    assert [result["normalized"] for result in results] == ["Mleko", "Chleb"]
+
+
+def test_normalize_names_process_pool_keeps_order(service):
+    service.add_learned_typo("szynak", "szynka")
+    names = [f"szynak {i}" for i in range(50)]
+
+    results = list(service.normalize_names(names, workers=2, batch_size=7))
+
+    assert [result["original"] for result in results] == names
+    assert results[3]["normalized"] == "Szynka 3"
+
+
+def test_normalize_names_invalid_workers(service):
+    with pytest.raises(ValueError):
+        service.normalize_names(["mlko"], workers=0)
+
+
+def test_learned_typos_survive_restart(service):
+    service.add_learned_typo("mlekko", "mleko")
+    service.flush_learned_typos()
+
+    restarted = ProductNameNormalizationService()
+
+    assert restarted.typo_fixes["mlekko"] == "mleko"
+    assert restarted.get_learning_stats()["learned_typos"] == 1
+
+
+def test_learn_product_name_adds_suggestions(service):
+    service.learn_product_name("Szynka Konserwowa 2%")
+
+    assert "szynka" in service.vocabulary
+    assert "2%" not in service.vocabulary
+    assert service.find_typo_suggestions("szynkaa")[0][0] == "szynka"
+
+
+def test_known_words_have_no_typos(service):
+    service.learn_product_name("Szynka")
+
+    assert service.has_potential_typos("szynka") is False
+    assert service.has_potential_typos("szynkaa") is True
+    assert service.get_word_suggestions_details("mleko")["has_any_suggestions"] is False
+    assert service.find_smart_suggestions("szynka") == []
+
+
+def test_lexicon_corrections(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    MappedLexicon.build(
+        "data/polish_lexicon.lex", [("szynka", ""), ("szynak", "szynka")]
+    )
+
+    service = ProductNameNormalizationService()
+
+    assert service.normalize_name("szynak")["normalized"] == "Szynka"
+    assert service.find_typo_suggestions("szynak") == [("szynka", 1.0)]
+    assert service.has_potential_typos("szynka") is False
+    assert service.get_learning_stats()["lexicon_words"] == 2
+
+
+def test_diacritic_fast_path(service):
+    service.learn_product_name("Śmietana")
+
+    assert service.find_typo_suggestions("smietana") == [("śmietana", 1.0)]
+    assert service.find_typo_suggestions("smietan") != []
+
+    stats = service.get_learning_stats()
+    assert stats["diacritic_hits"] == 1
+    assert stats["diacritic_misses"] == 1
+    assert stats["diacritic_hit_rate"] == 0.5
+
+
+def test_accented_word_is_not_corrected_to_plain_spelling(service):
+    service.learn_product_name("Maka Tortowa")
+
+    assert ("maka", 1.0) not in service.find_typo_suggestions("mąka")
+
+
+def test_batch_scoring_backend(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = ProductNameNormalizationService(scoring_backend="batch")
+
+    assert service.find_typo_suggestions("czosnk")[0][0] == "czosnek"
+
+
+def test_given_dictionaries_skip_learned_data(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "learned_typos.json").write_text("not json")
+    service = ProductNameNormalizationService(
+        typo_fixes={"mlko": "mleko"}, brands={"pepsi": "Pepsi"}
+    )
+
+    assert service.normalize_name("mlko pepsi")["normalized"] == "Mleko Pepsi"
+    assert service.learned_typos_journal is None
+    assert service.learned_typo_fixes == {}
+
+    service.add_learned_typo("szynak", "szynka")
+    service.flush_learned_typos()
+
+    assert (tmp_path / "data" / "learned_typos.json").read_text() == "not json"
+    assert sorted(p.name for p in (tmp_path / "data").iterdir()) == [
+        "learned_typos.json"
+    ]
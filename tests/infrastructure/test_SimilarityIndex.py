@@ -0,0 +1,50 @@
+from src.infrastructure.text.SimilarityIndex import SimilarityIndex
+
+
+class TestSimilarityIndex:
+    """Unit tests for SimilarityIndex."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = SimilarityIndex()
+        self.index.add("1", "Mleko 2%")
+        self.index.add("2", "Mleko 2% UHT")
+        self.index.add("3", "Chleb")
+        self.index.add("4", "Ser")
+
+    def test_find_contained_and_containing_names(self):
+        """Test that substring matches in both directions are found."""
+        assert self.index.find_similar("mleko 2% uh") == [
+            ("Mleko 2% UHT", 11 / 12),
+            ("Mleko 2%", 8 / 11),
+        ]
+
+    def test_similarity_threshold(self):
+        """Test that names with too different lengths are ignored."""
+        assert self.index.find_similar("mleko") == []
+
+    def test_equal_names_are_not_similar(self):
+        """Test that an identical name is not reported."""
+        assert self.index.find_similar("CHLEB") == []
+
+    def test_short_names(self):
+        """Test names shorter than a trigram with a lower threshold."""
+        index = SimilarityIndex(min_similarity=0.5)
+        index.add("1", "Se")
+        index.add("2", "Ser")
+
+        assert index.find_similar("ser") == [("Se", 2 / 3)]
+        assert index.find_similar("s") == []
+        assert index.find_similar("se") == [("Ser", 2 / 3)]
+
+    def test_update_and_remove(self):
+        """Test that replaced and removed names are no longer matched."""
+        self.index.add("3", "Chleb razowy")
+        self.index.remove("2")
+        self.index.remove("missing")
+
+        assert self.index.find_similar("chleb razow") == [("Chleb razowy", 11 / 12)]
+        assert self.index.find_similar("chlebb") == []
+        assert self.index.find_similar("mleko 2% uh") == [("Mleko 2%", 8 / 11)]
+        assert len(self.index) == 3
+        assert "2" not in self.index
@@ -0,0 +1,45 @@
+import pytest
+from src.infrastructure.text.SymSpellIndex import SymSpellIndex
+
+
+class TestSymSpellIndex:
+    """Unit tests for SymSpellIndex."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = SymSpellIndex(["mleko", "masło", "chleb", "kiełbasa"])
+
+    def test_lookup_exact_word(self):
+        """Test that an indexed word matches itself at distance zero."""
+        assert self.index.lookup("mleko")[0] == ("mleko", 0)
+
+    def test_lookup_typos(self):
+        """Test deletions, insertions and substitutions."""
+        assert self.index.lookup("mlko") == [("mleko", 1)]
+        assert self.index.lookup("chlebb") == [("chleb", 1)]
+        assert self.index.lookup("kielbsa") == [("kiełbasa", 2)]
+
+    def test_lookup_respects_max_distance(self):
+        """Test that words beyond the edit distance are not returned."""
+        assert self.index.lookup("kielbsa", max_distance=1) == []
+        assert self.index.lookup("xyz") == []
+
+    def test_lookup_beyond_prefix_length(self):
+        """Test typos located after the indexed prefix."""
+        index = SymSpellIndex(["pomidorowa"], prefix_length=4)
+
+        assert index.lookup("pomidorwa") == [("pomidorowa", 1)]
+
+    def test_add_updates_index(self):
+        """Test that added words are found without rebuilding."""
+        assert self.index.add("cebula") is True
+        assert self.index.add("cebula") is False
+
+        assert "cebula" in self.index
+        assert len(self.index) == 5
+        assert self.index.lookup("cbula") == [("cebula", 1)]
+
+    def test_invalid_configuration(self):
+        """Test that the prefix must be longer than the edit distance."""
+        with pytest.raises(ValueError):
+            SymSpellIndex(max_distance=2, prefix_length=2)
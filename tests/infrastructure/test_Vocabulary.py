@@ -0,0 +1,78 @@
+import pytest
+from src.infrastructure.text.Vocabulary import Vocabulary
+
+
+class TestVocabulary:
+    """Unit tests for Vocabulary."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.vocabulary = Vocabulary(["mleko", "masło", "chleb"])
+
+    def test_add_counts_frequency(self):
+        """Test that repeated words only increase their frequency."""
+        self.vocabulary.add("mleko")
+        self.vocabulary.add("szynka", count=3)
+
+        assert self.vocabulary.frequency("mleko") == 2
+        assert self.vocabulary.frequency("szynka") == 3
+        assert self.vocabulary.frequency("unknown") == 0
+        assert len(self.vocabulary) == 4
+
+    def test_length_buckets(self):
+        """Test that words are bucketed by length."""
+        assert self.vocabulary.words_of_length(5) == {"mleko", "masło", "chleb"}
+        assert self.vocabulary.words_of_length(9) == set()
+
+    def test_signature_bound(self):
+        """Test that one substitution flips at most two signature bits."""
+        difference = Vocabulary.signature("mleko") ^ Vocabulary.signature("mlekx")
+
+        assert bin(difference).count("1") <= 2
+
+    def test_lookup(self):
+        """Test finding words within the edit distance."""
+        assert self.vocabulary.lookup("mlko") == [("mleko", 1)]
+        assert self.vocabulary.lookup("chlebek") == [("chleb", 2)]
+        assert self.vocabulary.lookup("kiełbasa") == []
+
+    def test_lookup_sees_added_words(self):
+        """Test that new words are found without a rebuild."""
+        self.vocabulary.add("szynka")
+
+        assert self.vocabulary.lookup("szynak") == [("szynka", 2)]
+
+    def test_fold_diacritics(self):
+        """Test that Polish letters are folded to ASCII."""
+        assert Vocabulary.fold_diacritics("zażółć gęślą jaźń") == "zazolc gesla jazn"
+        assert Vocabulary.fold_diacritics("ŁÓDŹ") == "LODZ"
+
+    def test_diacritic_variants(self):
+        """Test finding words that only differ by diacritics."""
+        self.vocabulary.add("maslo", count=0)
+        self.vocabulary.add("masło", count=2)
+
+        assert self.vocabulary.diacritic_variants("maslo") == ["masło"]
+        assert self.vocabulary.diacritic_variants("mleko") == []
+        assert self.vocabulary.diacritic_variants("ser") == []
+
+    def test_diacritic_variants_never_downgrade_accented_words(self):
+        """Test that an accented word is never matched to its plain spelling."""
+        self.vocabulary.add("maslo", count=5)
+        self.vocabulary.add("masło")
+        self.vocabulary.add("mąka")
+
+        assert self.vocabulary.diacritic_variants("masło") == []
+        assert self.vocabulary.diacritic_variants("mąka") == []
+
+    def test_batch_backend(self):
+        """Test that the batch backend finds the same words."""
+        vocabulary = Vocabulary(["mleko", "masło", "chleb"], backend="batch")
+
+        assert vocabulary.lookup("mlko") == [("mleko", 1)]
+        assert vocabulary.lookup("chlebek") == [("chleb", 2)]
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown vocabulary backend"):
+            Vocabulary(backend="bk-tree")
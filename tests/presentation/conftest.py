@@ -0,0 +1,39 @@
+import itertools
+
+import pytest
+
+
+class FakeTk:
+    """Stand-in for a Tk widget that runs ``after`` callbacks on demand."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.reported = []
+        self._ids = itertools.count()
+
+    def after(self, ms, func, *args):
+        job_id = f"after#{next(self._ids)}"
+        self.jobs[job_id] = (func, args)
+        return job_id
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def run_pending(self):
+        """Run the callbacks scheduled so far; returns how many ran."""
+        jobs = list(self.jobs.values())
+        self.jobs.clear()
+        for func, args in jobs:
+            func(*args)
+        return len(jobs)
+
+    def _root(self):
+        return self
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.reported.append(exc)
+
+
+@pytest.fixture
+def fake_tk():
+    return FakeTk()
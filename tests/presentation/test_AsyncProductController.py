@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+from src.presentation.controllers.AsyncProductController import AsyncProductController
+from src.presentation.controllers.ProductController import ProductController
+from src.infrastructure.InMemoryProductRepository import InMemoryProductRepository
+
+
+@pytest.fixture
+def async_controller():
+    facade = AsyncProductController(ProductController(InMemoryProductRepository()))
+    yield facade
+    facade.shutdown(wait=True)
+
+
+def test_calls_return_futures_with_results(async_controller):
+    product = async_controller.add_product_with_ai("mleko", 2)
+
+    added, info = product.result(timeout=5)
+
+    assert async_controller.get_product_by_id(added.id).result(timeout=5) == added
+    assert info["normalized"] == added.name
+
+
+def test_calls_run_in_submission_order(async_controller):
+    added = async_controller.add_product_with_ai("chleb", 1).result(timeout=5)[0]
+    async_controller.adjust_quantity(added.id, 4)
+    async_controller.set_purchased(added.id, True)
+    products = async_controller.get_all_products().result(timeout=5)
+
+    assert [(p.quantity, p.purchased) for p in products] == [(5, True)]
+
+
+def test_calls_run_off_the_calling_thread(async_controller):
+    worker = async_controller.submit(threading.current_thread).result(timeout=5)
+
+    assert worker is not threading.current_thread()
+
+
+def test_errors_are_raised_from_the_future(async_controller):
+    future = async_controller.update_product("missing", "Mleko", 1, False)
+
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+
+
+def test_remove_product(async_controller):
+    added = async_controller.add_product_with_ai("ser", 1).result(timeout=5)[0]
+    async_controller.remove_product(added.id).result(timeout=5)
+
+    assert async_controller.get_all_products().result(timeout=5) == []
+
+
+def test_learned_typo_applies_to_later_calls(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    facade = AsyncProductController(ProductController(InMemoryProductRepository()))
+    try:
+        facade.add_learned_typo("szynak", "szynka")
+        info = facade.normalize_product_name("szynak").result(timeout=5)
+    finally:
+        facade.shutdown(wait=True)
+
+    assert info["normalized"] == "Szynka"
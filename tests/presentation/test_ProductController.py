@@ -1,7 +1,10 @@
 import pytest
 from src.presentation.controllers.ProductController import ProductController
 from src.infrastructure.InMemoryProductRepository import InMemoryProductRepository
+from src.infrastructure.JsonProductRepository import JsonProductRepository
 from src.domain.Product_Entity import _Product
+from unittest.mock import patch
+import json
 
 
 @pytest.fixture
@@ -277,3 +280,89 @@ def test_get_low_stock_products_custom_threshold(
     assert all(product.quantity < 10 for product in result)
     assert result[0].name == "Product 1"
     assert result[1].name == "Product 3"
+
+
+def test_remove_products(product_controller, product_repository):
+    product1 = _Product(name="Test Product 1", quantity=10)
+    product2 = _Product(name="Test Product 2", quantity=20)
+    product_repository.add_product(product1)
+    product_repository.add_product(product2)
+
+    product_controller.remove_products([product1.id, product2.id])
+
+    assert product_repository.get_all_products() == []
+
+
+def test_unit_of_work_batches_json_saves(tmp_path):
+    repository = JsonProductRepository(tmp_path / "products.json")
+    controller = ProductController(repository)
+
+    with patch(
+        "src.infrastructure.JsonProductRepository.json.dump", wraps=json.dump
+    ) as dump:
+        with controller.unit_of_work():
+            controller.add_product("Mleko", 1)
+            controller.add_product("Chleb", 2)
+
+    assert dump.call_count == 1
+    assert len(JsonProductRepository(repository.file_path).get_all_products()) == 2
+
+
+def test_adjust_quantity_and_set_purchased(product_controller, product_repository):
+    product = _Product(name="Test Product", quantity=10)
+    product_repository.add_product(product)
+
+    product_controller.adjust_quantity(product.id, 1)
+    result = product_controller.set_purchased(product.id, True)
+
+    assert result.quantity == 11
+    assert result.purchased is True
+
+
+def test_add_product_with_ai_learns_product_words(product_controller):
+    product_controller.add_product_with_ai("Szynka konserwowa", 1)
+
+    service = product_controller.name_normalization_service
+    assert service.find_typo_suggestions("konserwowaa")[0][0] == "konserwowa"
+
+
+def test_find_similar_products_reads_repository_once(
+    product_controller, product_repository
+):
+    product_repository.add_product(_Product(name="Mleko 2%", quantity=1))
+
+    with patch.object(
+        product_repository,
+        "get_all_products",
+        wraps=product_repository.get_all_products,
+    ) as get_all_products:
+        _, info = product_controller.add_product_with_ai("mleko 2% uh", 1)
+        similar = product_controller.find_similar_products("mleko 2%")
+
+    assert info["similar_products"] == [("Mleko 2%", 8 / 11)]
+    assert similar == [("Mleko 2% Uh", 8 / 11)]
+    assert get_all_products.call_count == 1
+
+
+def test_similarity_index_follows_updates_and_removals(product_controller):
+    product = product_controller.add_product("Chleb", 1)
+    product_controller.find_similar_products("chleb")
+
+    product_controller.update_product(product.id, "Chleb razowy", 1, False)
+    assert product_controller.find_similar_products("chleb razow") == [
+        ("Chleb razowy", 11 / 12)
+    ]
+
+    product_controller.remove_product(product.id)
+    assert product_controller.find_similar_products("chleb razow") == []
+
+
+def test_failed_unit_of_work_rebuilds_similarity_index(product_controller):
+    product_controller.find_similar_products("chleb")
+
+    with pytest.raises(RuntimeError):
+        with product_controller.unit_of_work():
+            product_controller.add_product("Chleb", 1)
+            raise RuntimeError("boom")
+
+    assert product_controller._similarity_index is None
@@ -0,0 +1,65 @@
+from src.domain.Product_Entity import _Product
+from src.presentation.stores.ProductFilter import ProductFilter
+
+
+def make_products():
+    return [
+        _Product(name="Mleko", quantity=2),
+        _Product(name="Mleko kozie", quantity=8, purchased=True),
+        _Product(name="Chleb", quantity=5),
+    ]
+
+
+def test_empty_filter_matches_everything():
+    products = make_products()
+
+    assert ProductFilter().apply(products) == products
+
+
+def test_search_is_case_insensitive_substring():
+    names = [p.name for p in ProductFilter(search_term="MLE").apply(make_products())]
+
+    assert names == ["Mleko", "Mleko kozie"]
+
+
+def test_status_and_quantity_range():
+    product_filter = ProductFilter(purchased=False, min_quantity=3, max_quantity=5)
+
+    assert [p.name for p in product_filter.apply(make_products())] == ["Chleb"]
+
+
+def test_low_stock_matches_quantities_below_threshold():
+    names = [p.name for p in ProductFilter.low_stock(5).apply(make_products())]
+
+    assert names == ["Mleko"]
+
+
+def test_narrows_for_longer_term_and_tighter_range():
+    previous = ProductFilter(search_term="mle", max_quantity=10)
+
+    assert ProductFilter(search_term="MLEK", max_quantity=10).narrows(previous)
+    assert ProductFilter(search_term="mle", purchased=True, max_quantity=5).narrows(
+        previous
+    )
+    assert ProductFilter(search_term="mle", min_quantity=1, max_quantity=10).narrows(
+        previous
+    )
+
+
+def test_broadened_filters_do_not_narrow():
+    previous = ProductFilter(
+        search_term="mlek", purchased=False, min_quantity=2, max_quantity=5
+    )
+
+    assert not ProductFilter(
+        search_term="mle", purchased=False, min_quantity=2, max_quantity=5
+    ).narrows(previous)
+    assert not ProductFilter(
+        search_term="mlek", min_quantity=2, max_quantity=5
+    ).narrows(previous)
+    assert not ProductFilter(
+        search_term="mlek", purchased=False, min_quantity=2
+    ).narrows(previous)
+    assert not ProductFilter(
+        search_term="mlek", purchased=False, max_quantity=5
+    ).narrows(previous)
@@ -0,0 +1,61 @@
+import pytest
+from src.domain.Product_Entity import _Product
+from src.presentation.stores.ProductFilter import ProductFilter
+from src.presentation.stores.ProductFilterEngine import ProductFilterEngine
+from src.presentation.stores.ProductStore import ProductStore
+
+
+@pytest.fixture
+def store():
+    store = ProductStore()
+    store.load(
+        [
+            _Product(id="1", name="Mleko", quantity=2),
+            _Product(id="2", name="Mleko kozie", quantity=8),
+            _Product(id="3", name="Chleb", quantity=5),
+        ]
+    )
+    return store
+
+
+def names(products):
+    return [product.name for product in products]
+
+
+def test_narrowing_filter_starts_from_previous_matches(store):
+    engine = ProductFilterEngine(store)
+    engine.apply(ProductFilter(search_term="mle"))
+
+    candidates = engine.candidates(ProductFilter(search_term="mlek"))
+
+    assert names(candidates) == ["Mleko", "Mleko kozie"]
+    assert names(engine.apply(ProductFilter(search_term="mleko k"))) == ["Mleko kozie"]
+
+
+def test_broadened_filter_falls_back_to_all_products(store):
+    engine = ProductFilterEngine(store)
+    engine.apply(ProductFilter(search_term="mleko k"))
+
+    assert len(engine.candidates(ProductFilter(search_term="mle"))) == 3
+    assert names(engine.apply(ProductFilter(search_term="e"))) == [
+        "Mleko",
+        "Mleko kozie",
+        "Chleb",
+    ]
+
+
+def test_store_change_invalidates_previous_matches(store):
+    engine = ProductFilterEngine(store)
+    engine.apply(ProductFilter(search_term="mle"))
+    store.upsert(_Product(id="4", name="Mleczko", quantity=1))
+
+    assert names(engine.apply(ProductFilter(search_term="mlec"))) == ["Mleczko"]
+
+
+def test_result_from_older_revision_is_not_remembered(store):
+    engine = ProductFilterEngine(store)
+    revision = store.revision
+    store.remove("3")
+    engine.remember(ProductFilter(search_term="chleb"), [], revision)
+
+    assert len(engine.candidates(ProductFilter(search_term="chleb"))) == 2
@@ -0,0 +1,86 @@
+import pytest
+from src.domain.Product_Entity import _Product
+from src.presentation.stores.ProductStore import ProductStore
+
+
+@pytest.fixture
+def store():
+    return ProductStore()
+
+
+@pytest.fixture
+def events(store):
+    received = []
+    for event in ProductStore.EVENTS:
+        store.subscribe(
+            event, lambda payload, event=event: received.append((event, payload))
+        )
+    return received
+
+
+def test_load_replaces_products_and_emits_reset(store, events):
+    milk = _Product(name="Milk", quantity=1)
+    bread = _Product(name="Bread", quantity=2)
+    store.load([milk, bread])
+
+    assert [p.name for p in store.all()] == ["Milk", "Bread"]
+    assert store.get(milk.id).name == "Milk"
+    assert milk.id in store
+    assert len(store) == 2
+    assert [event for event, _ in events] == ["reset"]
+
+
+def test_upsert_emits_added_then_updated(store, events):
+    milk = _Product(name="Milk", quantity=1)
+    store.upsert(milk)
+    changed = _Product(name="Milk", quantity=3, id=milk.id, version=2)
+    store.upsert(changed)
+
+    assert [event for event, _ in events] == ["added", "updated"]
+    assert store.get(milk.id).quantity == 3
+
+
+def test_upsert_of_same_version_is_ignored(store, events):
+    milk = _Product(name="Milk", quantity=1)
+    store.upsert(milk)
+    store.upsert(milk)
+
+    assert [event for event, _ in events] == ["added"]
+
+
+def test_store_keeps_its_own_snapshot(store):
+    milk = _Product(name="Milk", quantity=1)
+    store.upsert(milk)
+    # Repositories may mutate the instance they handed out
+    milk.quantity = 9
+    milk.version = 2
+
+    assert store.get(milk.id).quantity == 1
+
+    store.upsert(milk)
+
+    assert store.get(milk.id).quantity == 9
+
+
+def test_remove_emits_removed_once(store, events):
+    milk = _Product(name="Milk", quantity=1)
+    store.upsert(milk)
+    store.remove(milk.id)
+    store.remove(milk.id)
+
+    assert [event for event, _ in events] == ["added", "removed"]
+    assert store.get(milk.id) is None
+
+
+def test_unsubscribe(store):
+    received = []
+    unsubscribe = store.subscribe(ProductStore.ADDED, received.append)
+    unsubscribe()
+    store.upsert(_Product(name="Milk", quantity=1))
+
+    assert received == []
+
+
+def test_unknown_event_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.subscribe("changed", lambda product: None)
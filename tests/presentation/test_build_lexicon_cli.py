@@ -0,0 +1,39 @@
+from src.infrastructure.text.MappedLexicon import MappedLexicon
+from src.presentation.cli.build_lexicon import main
+
+
+def test_main_builds_lexicon(tmp_path, capsys):
+    input_file = tmp_path / "words.tsv"
+    output_file = tmp_path / "lexicon.lex"
+    input_file.write_text("Mleko\nmlko\tmleko\n\n", encoding="utf-8")
+
+    exit_code = main([str(input_file), "-o", str(output_file)])
+
+    assert exit_code == 0
+    with MappedLexicon(str(output_file)) as lexicon:
+        assert lexicon.get("mleko") == "mleko"
+        assert lexicon.get("mlko") == "mleko"
+    assert "Wrote 2 entries" in capsys.readouterr().err
+
+
+def test_main_adds_diacritic_free_spellings(tmp_path):
+    input_file = tmp_path / "words.tsv"
+    output_file = tmp_path / "lexicon.lex"
+    input_file.write_text("masło\nżółć\nzolc\tżółw\n", encoding="utf-8")
+
+    main([str(input_file), "-o", str(output_file)])
+
+    with MappedLexicon(str(output_file)) as lexicon:
+        assert lexicon.get("maslo") == "masło"
+        assert lexicon.get("zolc") == "żółw"
+
+
+def test_main_without_folding(tmp_path):
+    input_file = tmp_path / "words.tsv"
+    output_file = tmp_path / "lexicon.lex"
+    input_file.write_text("masło\n", encoding="utf-8")
+
+    main([str(input_file), "-o", str(output_file), "--no-fold-diacritics"])
+
+    with MappedLexicon(str(output_file)) as lexicon:
+        assert lexicon.get("maslo") is None
@@ -0,0 +1,150 @@
+import tkinter
+
+import customtkinter  # type: ignore
+import pytest
+from src.presentation.widgets.ctk_listbox import MAX_GRID_ROW, CTkListbox
+
+
+@pytest.fixture
+def root():
+    try:
+        root = customtkinter.CTk()
+    except tkinter.TclError as e:
+        pytest.skip(f"No display available for widget tests: {e}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def make_listbox(root, count=5, **kwargs):
+    listbox = CTkListbox(root, **kwargs)
+    for i in range(count):
+        listbox.insert("end", f"row {i}", update=False)
+    return listbox
+
+
+def grid_rows(listbox):
+    return [int(listbox._button(i).grid_info()["row"]) for i in range(listbox.size())]
+
+
+class TestCTkListbox:
+    """Test cases for CTkListbox."""
+
+    def test_insert_by_position(self, root):
+        """Test that inserting in the middle keeps the grid in display order."""
+        listbox = make_listbox(root, 3)
+        listbox.insert(1, "new", update=False)
+
+        assert listbox.get("all") == ["row 0", "new", "row 1", "row 2"]
+        assert grid_rows(listbox) == sorted(set(grid_rows(listbox)))
+
+    def test_select_recolors_only_changed_rows(self, root, monkeypatch):
+        """Test that a click only touches the old and the new selected row."""
+        listbox = make_listbox(root, 5)
+        listbox.select(1)
+
+        def untouched(**kwargs):
+            raise AssertionError("row 4 was reconfigured")
+
+        monkeypatch.setattr(listbox._button(4), "configure", untouched)
+        listbox.select(3)
+
+        plain = listbox._button(0).cget("fg_color")
+        assert listbox._button(1).cget("fg_color") == plain
+        assert listbox._button(3).cget("fg_color") != plain
+        assert listbox.curselection() == 3
+        assert listbox.get() == "row 3"
+
+    def test_shift_range_selection(self, root):
+        """Test extending a multiple selection from the last clicked row."""
+        listbox = make_listbox(root, 6, multiple_selection=True)
+        listbox.select(4)
+        listbox.select_multiple(1)
+
+        assert listbox.curselection() == (1, 2, 3, 4)
+        assert listbox.get() == ["row 1", "row 2", "row 3", "row 4"]
+
+    def test_delete_keeps_selection_on_surviving_rows(self, root):
+        """Test that deleting rows shifts the remaining selection with them."""
+        listbox = make_listbox(root, 5, multiple_selection=True)
+        listbox.select(0)
+        listbox.select(3)
+        listbox.delete(1, 2)
+
+        assert listbox.get("all") == ["row 0", "row 3", "row 4"]
+        assert listbox.curselection() == (0, 1)
+
+        listbox.delete("end")
+
+        assert listbox.size() == 2
+
+    def test_move_up_keeps_moved_row_selected(self, root):
+        """Test that moving a row swaps it with its neighbour and selects it."""
+        listbox = make_listbox(root, 3)
+        listbox.move_up(2)
+
+        assert listbox.get("all") == ["row 0", "row 2", "row 1"]
+        assert listbox.curselection() == 1
+        assert grid_rows(listbox) == sorted(grid_rows(listbox))
+
+    def test_rows_by_key(self, root):
+        """Test looking up, updating and deleting rows by their key."""
+        listbox = CTkListbox(root)
+        listbox.insert("end", "milk", update=False, key="p1")
+        listbox.insert("end", "bread", update=False, key="p2")
+        listbox.set_option("p2", "bread x2")
+
+        assert listbox.index_of("p2") == 1
+        assert listbox.get(1) == "bread x2"
+
+        listbox.delete_key("p1")
+
+        assert listbox.key(0) == "p2"
+        assert listbox.index_of("p1") is None
+        with pytest.raises(KeyError):
+            listbox.delete_key("p1")
+
+    def test_grid_rows_stay_within_tk_limit(self, root):
+        """Test that grid rows restart when emptied and renumber near the limit."""
+        listbox = make_listbox(root, 3)
+        listbox.delete("all")
+        listbox.insert("end", "a", update=False)
+
+        assert grid_rows(listbox) == [0]
+
+        listbox._next_grid_row = MAX_GRID_ROW
+        listbox.insert("end", "b", update=False)
+
+        assert grid_rows(listbox) == [0, MAX_GRID_ROW]
+
+        listbox.insert("end", "c", update=False)
+
+        assert grid_rows(listbox) == [0, 1, 2]
+
+    def test_deleted_buttons_are_reused(self, root):
+        """Test that an insert after a delete reconfigures the parked button."""
+        listbox = make_listbox(root, 2)
+        button = listbox._button(1)
+        listbox.delete(1)
+        listbox.insert("end", "again", update=False)
+
+        assert listbox._button(1) is button
+        assert button.cget("text") == "again"
+
+        button.invoke()
+
+        assert listbox.curselection() == 1
+
+    def test_buttons_with_extra_options_are_not_reused(self, root):
+        """Test that a row created with button options is destroyed on delete."""
+        listbox = make_listbox(root, 1)
+        listbox.insert("end", "wide", update=False, width=300)
+        custom = listbox._button(1)
+        listbox.delete("all")
+
+        assert not custom.winfo_exists()
+        assert len(listbox._spare_buttons) == 1
+
+        listbox.insert("end", "plain", update=False)
+
+        assert listbox._button(0) is not custom
@@ -0,0 +1,122 @@
+from concurrent.futures import Executor, Future
+import threading
+import time
+
+import pytest
+from src.presentation.widgets.debounced_worker import DebouncedWorker
+
+
+class ManualExecutor(Executor):
+    """Executor whose submitted calls run only when the test says so."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.calls.append((future, fn))
+        return future
+
+    def run(self, index=-1):
+        future, fn = self.calls[index]
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn())
+            except Exception as error:
+                future.set_exception(error)
+
+
+@pytest.fixture
+def executor():
+    return ManualExecutor()
+
+
+def test_only_latest_request_starts_after_delay(fake_tk, executor):
+    worker = DebouncedWorker(fake_tk, delay_ms=200, executor=executor)
+    results = []
+    worker.submit(lambda: "m", results.append)
+    worker.submit(lambda: "ml", results.append)
+    worker.submit(lambda: "mle", results.append)
+
+    fake_tk.run_pending()
+    executor.run()
+    fake_tk.run_pending()
+
+    assert len(executor.calls) == 1
+    assert results == ["mle"]
+    assert not worker.pending
+
+
+def test_newer_request_cancels_queued_one(fake_tk, executor):
+    worker = DebouncedWorker(fake_tk, executor=executor)
+    results = []
+    worker.submit(lambda: "old", results.append)
+    fake_tk.run_pending()
+    old_future = executor.calls[0][0]
+
+    worker.submit(lambda: "new", results.append)
+
+    assert old_future.cancelled()
+
+    fake_tk.run_pending()
+    executor.run()
+    fake_tk.run_pending()
+
+    assert results == ["new"]
+
+
+def test_stale_result_of_running_request_is_dropped(fake_tk, executor):
+    worker = DebouncedWorker(fake_tk, executor=executor)
+    results = []
+    worker.submit(lambda: "old", results.append)
+    fake_tk.run_pending()
+    old_future = executor.calls[0][0]
+    old_future.set_running_or_notify_cancel()
+
+    worker.submit(lambda: "new", results.append)
+    old_future.set_result("old")
+    fake_tk.run_pending()
+    executor.run()
+    fake_tk.run_pending()
+
+    assert results == ["new"]
+
+
+def test_errors_reach_the_error_callback(fake_tk, executor):
+    worker = DebouncedWorker(fake_tk, executor=executor)
+    errors = []
+
+    def query():
+        raise ValueError("bad filter")
+
+    worker.submit(query, lambda result: None, errors.append)
+    fake_tk.run_pending()
+    executor.run()
+    fake_tk.run_pending()
+
+    assert [str(error) for error in errors] == ["bad filter"]
+
+
+def test_cancel_drops_pending_request(fake_tk, executor):
+    worker = DebouncedWorker(fake_tk, executor=executor)
+    results = []
+    worker.submit(lambda: "x", results.append)
+    worker.cancel()
+
+    fake_tk.run_pending()
+
+    assert executor.calls == []
+    assert not worker.pending
+
+
+def test_runs_on_a_worker_thread(fake_tk):
+    worker = DebouncedWorker(fake_tk, delay_ms=0)
+    threads = []
+    worker.submit(threading.current_thread, threads.append)
+    deadline = time.monotonic() + 5
+    while not threads and time.monotonic() < deadline:
+        fake_tk.run_pending()
+        time.sleep(0.01)
+    worker.shutdown()
+
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,208 @@
+import pytest
+from src.presentation.widgets.listbox_model import ListboxModel
+
+
+def make_model(count=5, multiple=False):
+    model = ListboxModel(multiple=multiple)
+    model.extend(f"row {i}" for i in range(count))
+    return model
+
+
+class TestListboxModel:
+    """Test cases for ListboxModel."""
+
+    def test_insert_positions_and_end(self):
+        """Test inserting at the end, in the middle and at negative indexes."""
+        model = ListboxModel()
+        model.insert("end", "b")
+        model.insert(0, "a")
+        model.insert("END", "d")
+        model.insert(-1, "c")
+
+        assert model.texts() == ["a", "b", "c", "d"]
+        assert model.size() == len(model) == 4
+        assert model.text("end") == "d"
+
+    def test_keys_follow_rows(self):
+        """Test that row keys stay attached to their rows across edits."""
+        model = ListboxModel()
+        first = model.insert("end", "a")
+        second = model.insert("end", "b")
+        model.insert(0, "z")
+
+        assert model.index_of(first) == 1
+        assert model.index_of(second) == 2
+        assert model.key(2) == second
+
+        model.delete(0)
+
+        assert model.index_of(first) == 0
+        assert model.index_of("missing") is None
+
+    def test_custom_keys_must_be_unique(self):
+        """Test that explicit keys cannot be reused."""
+        model = ListboxModel()
+        model.insert("end", "milk", key="p1")
+
+        with pytest.raises(ValueError):
+            model.insert("end", "bread", key="p1")
+
+    def test_out_of_range_index(self):
+        """Test that reading past the end raises IndexError."""
+        model = make_model(2)
+
+        with pytest.raises(IndexError):
+            model.text(2)
+        with pytest.raises(IndexError):
+            model.text("all")
+
+    def test_delete_range_like_tk(self):
+        """Test inclusive range deletion with clipped bounds."""
+        model = make_model(5)
+        model.delete(1, 2)
+
+        assert model.texts() == ["row 0", "row 3", "row 4"]
+
+        model.delete(0, "end")
+
+        assert model.size() == 0
+        assert model.delete(0, "end") == []
+
+    def test_delete_past_end_is_noop(self):
+        """Test that deleting an index past the end leaves the rows alone."""
+        model = make_model(3)
+
+        assert model.delete(10) == []
+        assert model.size() == 3
+
+    def test_single_selection(self):
+        """Test that selecting a row replaces the previous selection."""
+        model = make_model(5)
+
+        assert model.select(1) == [1]
+        assert sorted(model.select(3)) == [1, 3]
+        assert model.selected_indices() == [3]
+        assert model.select(3) == []
+
+    def test_multiple_selection_toggles(self):
+        """Test that multiple mode toggles rows in and out."""
+        model = make_model(5, multiple=True)
+        model.select(1)
+        model.select(3)
+        model.select(1)
+
+        assert model.selected_indices() == [3]
+        assert model.is_selected(3)
+        assert not model.is_selected(1)
+
+    def test_select_range_from_anchor(self):
+        """Test shift-style range selection from the last clicked row."""
+        model = make_model(6, multiple=True)
+        model.select(4)
+
+        assert model.anchor == 4
+
+        model.select_range(model.anchor, 1)
+
+        assert model.selected_indices() == [1, 2, 3, 4]
+
+    def test_selection_survives_inserts_and_moves(self):
+        """Test that the selection follows its row rather than its position."""
+        model = make_model(3)
+        model.select(1)
+        model.insert(0, "new")
+
+        assert model.selected_indices() == [2]
+
+        model.move(2, 0)
+
+        assert model.selected_indices() == [0]
+        assert model.text(0) == "row 1"
+
+    def test_delete_drops_selection(self):
+        """Test that deleting selected rows removes them from the selection."""
+        model = make_model(3, multiple=True)
+        model.select(0)
+        model.select(2)
+        model.delete(2)
+
+        assert model.selected_indices() == [0]
+
+    def test_deselect_all(self):
+        """Test clearing the selection."""
+        model = make_model(3, multiple=True)
+        model.select(0)
+        model.select(2)
+
+        assert model.deselect_all() == [0, 2]
+        assert model.selected_indices() == []
+        assert model.anchor is None
+
+    def test_set_text_keeps_key_and_selection(self):
+        """Test that re-texting a row keeps its identity."""
+        model = make_model(2)
+        key = model.key(1)
+        model.select(1)
+        model.set_text(1, "changed")
+
+        assert model.key(1) == key
+        assert model.is_selected(1)
+        assert model.text(1) == "changed"
+
+    def test_large_model(self):
+        """Test that a 100k row model stays addressable by position and key."""
+        model = make_model(100_000)
+        key = model.key(99_999)
+        model.select(99_999)
+
+        assert model.index_of(key) == 99_999
+        assert model.text(50_000) == "row 50000"
+        assert model.selected_indices() == [99_999]
+
+    def test_extend_returns_keys_in_order(self):
+        """Test that bulk appends hand back addressable keys."""
+        model = make_model(2)
+        keys = model.extend(["a", "b", "c"])
+
+        assert [model.index_of(key) for key in keys] == [2, 3, 4]
+        assert model.texts()[2:] == ["a", "b", "c"]
+
+    def test_reconcile_renders_only_new_and_changed_rows(self):
+        """Test that reconciling re-renders only rows that need it."""
+        model = ListboxModel()
+        model.reconcile(["a", "b", "c"], set(), lambda key: key.upper())
+        rendered = []
+
+        def render(key):
+            rendered.append(key)
+            return f"{key}!"
+
+        changes = model.reconcile(["a", "x", "b", "c"], {"c"}, render)
+
+        assert model.texts() == ["A", "x!", "B", "c!"]
+        assert sorted(rendered) == ["c", "x"]
+        assert changes.inserted == ["x"]
+        assert changes.updated == ["c"]
+        assert changes.touched == 2
+        assert not changes.reordered
+
+    def test_reconcile_removes_and_reorders_keeping_selection(self):
+        """Test that surviving rows keep their selection across a reconcile."""
+        model = ListboxModel()
+        model.reconcile(["a", "b", "c"], set(), str)
+        model.select(1)
+
+        changes = model.reconcile(["c", "b"], set(), str)
+
+        assert changes.removed == ["a"]
+        assert changes.reordered
+        assert model.texts() == ["c", "b"]
+        assert model.selected_indices() == [1]
+        assert model.index_of("c") == 0
+
+    def test_reconcile_rejects_duplicate_keys(self):
+        """Test that a result set with repeated keys is rejected."""
+        model = ListboxModel()
+
+        with pytest.raises(ValueError):
+            model.reconcile(["a", "a"], set(), str)
@@ -0,0 +1,19 @@
+import json
+from src.presentation.cli.normalize_names import main
+
+
+def test_main_writes_jsonl(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    input_file = tmp_path / "names.txt"
+    output_file = tmp_path / "names.jsonl"
+    input_file.write_text("mlko\n\n  coca cola \n", encoding="utf-8")
+
+    exit_code = main([str(input_file), "-o", str(output_file), "-w", "1"])
+
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    assert exit_code == 0
+    assert [json.loads(line)["normalized"] for line in lines] == [
+        "Mleko",
+        "Coca-cola",
+    ]
+    assert "Normalized 2 names" in capsys.readouterr().err
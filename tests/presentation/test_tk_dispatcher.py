@@ -0,0 +1,93 @@
+from concurrent.futures import Future
+from src.presentation.widgets.tk_dispatcher import TkDispatcher
+
+
+def test_delivers_result_on_poll(fake_tk):
+    dispatcher = TkDispatcher(fake_tk)
+    future = Future()
+    results = []
+    dispatcher.when_done(future, results.append)
+
+    fake_tk.run_pending()
+    assert results == []
+    assert dispatcher.outstanding == 1
+
+    future.set_result(42)
+    fake_tk.run_pending()
+
+    assert results == [42]
+    assert dispatcher.outstanding == 0
+    assert fake_tk.jobs == {}
+
+
+def test_delivers_errors_to_error_callback(fake_tk):
+    dispatcher = TkDispatcher(fake_tk)
+    future = Future()
+    errors = []
+    dispatcher.when_done(future, lambda result: None, errors.append)
+
+    future.set_exception(ValueError("boom"))
+    fake_tk.run_pending()
+
+    assert [str(error) for error in errors] == ["boom"]
+
+
+def test_unhandled_errors_are_reported(fake_tk):
+    dispatcher = TkDispatcher(fake_tk)
+    failing, succeeding = Future(), Future()
+    results = []
+    dispatcher.when_done(failing, results.append)
+    dispatcher.when_done(succeeding, results.append)
+
+    failing.set_exception(RuntimeError("db down"))
+    succeeding.set_result("ok")
+    fake_tk.run_pending()
+
+    assert results == ["ok"]
+    assert [str(error) for error in fake_tk.reported] == ["db down"]
+
+
+def test_cancelled_futures_are_dropped(fake_tk):
+    dispatcher = TkDispatcher(fake_tk)
+    future = Future()
+    results = []
+    dispatcher.when_done(future, results.append)
+
+    future.cancel()
+    fake_tk.run_pending()
+
+    assert results == []
+    assert dispatcher.outstanding == 0
+
+
+def test_reports_busy_state_changes(fake_tk):
+    states = []
+    dispatcher = TkDispatcher(fake_tk, on_busy_change=states.append)
+    first, second = Future(), Future()
+    dispatcher.when_done(first, lambda result: None)
+    dispatcher.when_done(second, lambda result: None)
+
+    first.set_result(1)
+    fake_tk.run_pending()
+
+    assert states == [True]
+
+    second.set_result(2)
+    fake_tk.run_pending()
+
+    assert states == [True, False]
+
+
+def test_work_started_from_a_callback_keeps_busy(fake_tk):
+    states = []
+    dispatcher = TkDispatcher(fake_tk, on_busy_change=states.append)
+    first, follow_up = Future(), Future()
+    dispatcher.when_done(
+        first, lambda result: dispatcher.when_done(follow_up, lambda r: None)
+    )
+
+    first.set_result(1)
+    fake_tk.run_pending()
+
+    assert states == [True]
+    assert dispatcher.outstanding == 1
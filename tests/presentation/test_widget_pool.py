@@ -0,0 +1,65 @@
+from src.presentation.widgets.widget_pool import WidgetPool
+
+
+class FakeWidget:
+    """Widget stand-in that records whether it was destroyed."""
+
+    def __init__(self):
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def test_take_reuses_released_widgets(fake_tk):
+    pool = WidgetPool(fake_tk)
+    widget = FakeWidget()
+
+    assert pool.take() is None
+
+    pool.release(widget)
+
+    assert len(pool) == 1
+    assert pool.take() is widget
+    assert len(pool) == 0
+
+
+def test_idle_trim_keeps_only_the_reserve(fake_tk):
+    pool = WidgetPool(fake_tk, keep=1, trim_ms=100)
+    widgets = [FakeWidget() for _ in range(3)]
+    for widget in widgets:
+        pool.release(widget)
+
+    # Each release restarted the timer, so only one trim is pending
+    assert fake_tk.run_pending() == 1
+    assert len(pool) == 1
+    assert [widget.destroyed for widget in widgets] == [False, True, True]
+
+
+def test_release_many_schedules_one_trim(fake_tk, monkeypatch):
+    pool = WidgetPool(fake_tk, keep=0)
+    scheduled = []
+    after = fake_tk.after
+    monkeypatch.setattr(
+        fake_tk, "after", lambda ms, func: scheduled.append(ms) or after(ms, func)
+    )
+
+    pool.release_many([FakeWidget() for _ in range(3)])
+
+    assert len(pool) == 3
+    assert len(scheduled) == 1
+    assert fake_tk.run_pending() == 1
+    assert len(pool) == 0
+
+
+def test_clear_destroys_every_spare_and_stops_the_timer(fake_tk):
+    pool = WidgetPool(fake_tk, keep=5)
+    widgets = [FakeWidget() for _ in range(2)]
+    for widget in widgets:
+        pool.release(widget)
+
+    pool.clear()
+
+    assert len(pool) == 0
+    assert all(widget.destroyed for widget in widgets)
+    assert fake_tk.run_pending() == 0
@@ -0,0 +1,41 @@
+import pytest
+from src.utils.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_get_and_put(self):
+        """Test storing and reading values."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_clear(self):
+        """Test removing every entry."""
+        cache = LRUCache()
+        cache.put("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_invalid_size(self):
+        """Test that the size must be positive."""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)